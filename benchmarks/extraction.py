@@ -0,0 +1,167 @@
+"""
+Microbenchmark of the extraction of a manga page by `PageExtractor.extract`.
+
+It compares the extraction engine against the previous selector-based one,
+which parsed the page with Modest, queried it again for every rule and only
+kept the first price row, on pages of the local stand-in site in both layouts.
+Both must produce the same informative content, and the first price row of the
+engine must be the one of the baseline, which is checked on every page before
+timing; the engine extracts every price row meanwhile.
+
+Usage:
+    poetry run python3 -m benchmarks.extraction --pages 200
+"""
+
+# Native Libraries
+import re
+from argparse import ArgumentParser
+from timeit import repeat
+
+# Third-Party Libraries
+from selectolax.parser import HTMLParser, Node
+
+# Local Modules
+from benchmarks.site import build_page, get_slug
+from src.extraction.engine import default_page_extractor
+from src.extraction.static import allowed_content_keys, columns_replace_mapping
+from src.extraction.utils import replace_columns
+
+
+def format_tag(strong: Node | None) -> str:
+    """
+    Args:
+        strong (Node | None): The node whose text is cleaned.
+
+    Returns:
+        str: The text of the node without its 'Nº de' prefix, colons and
+        surrounding whitespace, lowercased; empty if the node is None.
+    """
+    text: str = strong.text() if strong is not None else ''
+
+    return re.sub(r'^(Nº de\s*)?|^[\s:]+|[\s:]+$', '', text).lower()
+
+
+def selector_extract(
+    page: bytes, manga: str
+) -> tuple[dict[str, str] | None, dict[str, str] | None]:
+    """
+    The previous selector-based extraction, kept as the baseline.
+
+    Args:
+        page (bytes): The HTML content of the page.
+        manga (str): The name of the manga.
+
+    Returns:
+        tuple[dict[str, str] | None, dict[str, str] | None]: The informative content
+        and the table content of the page.
+    """
+    parser: HTMLParser = HTMLParser(page)
+    dynamic_tag: str = (
+        'td' if len(parser.css_first('.entry-content td').css('strong')) > 1 else 'p'
+    )
+
+    informative_content: dict[str, str] = {}
+
+    for strong in parser.css_first(f'.entry-content {dynamic_tag}').css('strong'):
+        content_key, content_value = format_tag(strong), format_tag(strong.next)
+
+        if content_key in allowed_content_keys:
+            informative_content[content_key] = content_value
+
+    informative_content['manga'] = manga
+
+    tables: list[Node] = parser.css('table')
+
+    if len(tables) <= 1:
+        return informative_content, None
+
+    for table in tables[1:] if dynamic_tag == 'td' else tables:
+        rows: list[Node] = table.css('tr')
+        header: Node = rows.pop(0)
+        columns: list[str] = header.text().strip('\n\t ').lower().split('\n')
+
+        if len(rows) <= 1 or len(rows[1].css('td')) > len(columns):
+            continue
+
+        replace_columns(columns=columns, mapping=columns_replace_mapping)
+
+        if header.text().strip().lower() == 'título editora':
+            continue
+
+        table_content: dict[str, str] = {
+            column: value.text() for column, value in zip(columns, rows[0].css('td'))
+        }
+        table_content['manga'] = manga
+
+        return informative_content, table_content
+
+    return informative_content, None
+
+
+def measure(pages: list[tuple[bytes, str]]) -> tuple[float, float]:
+    """
+    Args:
+        pages (list[tuple[bytes, str]]): The HTML content and the manga of every
+            page.
+
+    Returns:
+        tuple[float, float]: The microseconds per page of the selector-based
+        extraction and of the engine.
+
+    Raises:
+        AssertionError: If both extractions differ on a page.
+    """
+    for page, manga in pages:
+        informative_content, price_batch = default_page_extractor.extract(
+            page, manga
+        )
+        first_row: dict[str, str] | None = price_batch and {
+            column: value
+            for column, value in price_batch.slice(0, 1).to_pylist()[0].items()
+            if value is not None
+        }
+
+        assert (informative_content, first_row) == selector_extract(page, manga), (
+            manga
+        )
+
+    def run(extract) -> float:
+        return (
+            min(
+                repeat(
+                    lambda: [extract(page, manga) for page, manga in pages],
+                    number=3,
+                    repeat=3,
+                )
+            )
+            / 3
+            / len(pages)
+            * 1e6
+        )
+
+    return run(selector_extract), run(default_page_extractor.extract)
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        '--pages', type=int, default=200, help='Stand-in pages extracted.'
+    )
+    arguments = parser.parse_args()
+
+    pages: list[tuple[bytes, str]] = [
+        (build_page(index), get_slug(index)) for index in range(arguments.pages)
+    ]
+    selector, engine = measure(pages)
+
+    print(f'{"pages":>6} {"selectors (us)":>15} {"engine (us)":>12} {"speedup":>8}')
+    print(
+        f'{len(pages):>6} {selector:>15.1f} {engine:>12.1f} '
+        f'{selector / engine:>7.1f}x'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Microbenchmark of the user-agent selection of `Rotator.get`.
+
+It compares the Fenwick tree selection against the previous linear selection,
+which re-weighed every agent and ran `random.choices` on each request, for
+growing pools of agents.
+
+Usage:
+    poetry run python3 -m benchmarks.rotator
+"""
+
+# Native Libraries
+import random
+from time import time
+from timeit import repeat
+
+# Local Modules
+from src.core.agents import Rotator, UserAgent, user_agents
+
+POOL_SIZES: tuple[int] = (100, 1_000, 10_000)
+CALLS: int = 500
+
+
+def linear_get(rotator: Rotator) -> str:
+    """
+    The previous O(n) selection, kept as the baseline.
+
+    Args:
+        rotator (Rotator): The rotator holding the pool.
+
+    Returns:
+        str: The selected user agent string.
+    """
+    user_agent_weights: list[float] = [
+        rotator.weigh_user_agent(user_agent) for user_agent in rotator.user_agents
+    ]
+    user_agent: UserAgent = random.choices(
+        rotator.user_agents, user_agent_weights
+    ).pop(0)
+    user_agent.last_used = time()
+
+    return str(user_agent)
+
+
+def measure(pool_size: int) -> tuple[float, float]:
+    """
+    Args:
+        pool_size (int): The number of agents in the pool.
+
+    Returns:
+        tuple[float, float]: The microseconds per call of the linear and of the
+        Fenwick tree selection.
+    """
+    pool: list[str] = [
+        f'{user_agents[index % len(user_agents)]} Pool/{index}'
+        for index in range(pool_size)
+    ]
+    # The pools are parsed on every run instead of filling the parse cache of the
+    # crawler.
+    linear_rotator: Rotator = Rotator(pool, cache_path=None)
+    rotator: Rotator = Rotator(pool, cache_path=None)
+
+    linear: float = min(
+        repeat(lambda: linear_get(linear_rotator), number=CALLS, repeat=3)
+    )
+    fenwick: float = min(repeat(rotator.get, number=CALLS, repeat=3))
+
+    return linear / CALLS * 1e6, fenwick / CALLS * 1e6
+
+
+def main() -> None:
+    print(f'{"agents":>8} {"linear (us)":>12} {"fenwick (us)":>13} {"speedup":>8}')
+
+    for pool_size in POOL_SIZES:
+        linear, fenwick = measure(pool_size)
+        print(
+            f'{pool_size:>8} {linear:>12.2f} {fenwick:>13.2f} '
+            f'{linear / fenwick:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
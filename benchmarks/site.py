@@ -0,0 +1,351 @@
+"""
+A local stand-in for the manga section of blogbbm.com, used by the offline
+benchmarks.
+
+It serves a catalog at `/manga/` and one synthetic page per manga at
+`/manga/<slug>/`, alternating the `td` layout (informative content in the
+first table cell) and the `p` layout (informative content in a paragraph),
+each followed by price tables and padded with the site chrome. Pages are
+generated deterministically from their index, carry an `ETag` and answer
+conditional requests with `304 Not Modified`, like the real site.
+
+Usage:
+    poetry run python3 -m benchmarks.site --pages 500 --error-rate 0.01
+"""
+
+# Native Libraries
+import hashlib
+import multiprocessing
+import random
+import time
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+from typing import Iterator
+
+PUBLISHERS: tuple[str] = (
+    'Panini',
+    'JBC',
+    'NewPOP',
+    'Conrad',
+    'Pipoca & Nanquim',
+    'Devir',
+)
+DEMOGRAPHIES: tuple[str] = ('Shounen', 'Seinen', 'Shoujo', 'Josei', 'Kodomo')
+FORMATS: tuple[str] = (
+    'Tankobon (13,5 x 20,5 cm)',
+    'Meio-tanko (13,2 x 18 cm)',
+    'Kanzenban',
+)
+FREQUENCIES: tuple[str] = ('Bimestral', 'Mensal', 'Trimestral', 'Irregular')
+
+CHROME: str = (
+    '<header><nav><ul>'
+    + ''.join(
+        f'<li><a href="/categoria/{index}/">Categoria {index}</a></li>'
+        for index in range(60)
+    )
+    + '</ul></nav></header><aside><h3>Posts recentes</h3><ul>'
+    + ''.join(
+        f'<li><a href="/{2024 - index % 5}/post-{index}/">'
+        f'Checklist de lançamentos {index}</a><span class="date">'
+        f'{index % 28 + 1:02d}/{index % 12 + 1:02d}/2024</span></li>'
+        for index in range(200)
+    )
+    + '</ul></aside>'
+    + '<script>window.__settings = {"theme": "dark", "ads": true};</script>'
+)
+
+
+def get_slug(index: int) -> str:
+    """
+    Args:
+        index (int): The index of the manga.
+
+    Returns:
+        str: The slug of the manga page.
+    """
+    return f'manga-{index}'
+
+
+def build_catalog(base_url: str, pages: int) -> bytes:
+    """
+    Builds the catalog page, listing every manga with its author, publisher,
+    demography and year.
+
+    Args:
+        base_url (str): The URL of the catalog, e.g. 'http://127.0.0.1:8000/manga/'.
+        pages (int): The number of manga pages.
+
+    Returns:
+        bytes: The HTML of the catalog page.
+    """
+    rows: str = ''.join(
+        f'<tr><td><a href="{base_url}{get_slug(index)}/">Manga {index}</a></td>'
+        f'<td>Autor {index % 97}</td>'
+        f'<td>{PUBLISHERS[index % len(PUBLISHERS)]}</td>'
+        f'<td>{DEMOGRAPHIES[index % len(DEMOGRAPHIES)]}</td>'
+        f'<td>{1990 + index % 35}</td></tr>'
+        for index in range(pages)
+    )
+
+    return (
+        f'<html><body>{CHROME}<div class="entry-content"><table>'
+        f'<thead><tr><th>Título</th><th>Autor</th><th>Editora</th>'
+        f'<th>Demografia</th><th>Ano</th></tr></thead>'
+        f'<tbody>{rows}</tbody></table></div></body></html>'
+    ).encode()
+
+
+def build_price_table(
+    generator: random.Random, columns: tuple[str, ...], rows: int
+) -> str:
+    """
+    Args:
+        generator (random.Random): The generator of the values of the page.
+        columns (tuple[str, ...]): The header of the table, among 'Vol.', 'Cap.',
+                                   'Data', 'Brasil', 'Japão' and 'Preço'.
+        rows (int): The number of volumes or chapters listed.
+
+    Returns:
+        str: The HTML of the table, with one cell per line in its header row.
+    """
+
+    def get_value(column: str, number: int) -> str:
+        if column in {'Vol.', 'Cap.'}:
+            return str(number)
+
+        if column == 'Preço':
+            return f'R$ {generator.randint(19, 89)},90'
+
+        day, month = generator.randint(1, 28), generator.randint(1, 12)
+
+        return f'{day:02d}/{month:02d}/{generator.randint(2000, 2025)}'
+
+    header: str = '\n'.join(f'<td>{column}</td>' for column in columns)
+    body: str = ''.join(
+        '<tr>'
+        + ''.join(f'<td>{get_value(column, number)}</td>' for column in columns)
+        + '</tr>'
+        for number in range(1, rows + 1)
+    )
+
+    return f'<table><tbody><tr>{header}</tr>{body}</tbody></table>'
+
+
+def build_page(index: int) -> bytes:
+    """
+    Builds the page of a manga, in the `td` layout for odd indices and in the
+    `p` layout for even ones.
+
+    Args:
+        index (int): The index of the manga.
+
+    Returns:
+        bytes: The HTML of the manga page.
+    """
+    generator: random.Random = random.Random(index)
+    volumes: int = generator.randint(1, 40)
+
+    information: str = '<br>'.join(
+        f'<strong>{key}:</strong> {value}'
+        for key, value in (
+            ('Título original', f'Original {index}'),
+            ('Editora original', 'Shueisha'),
+            ('Editora brasileira', PUBLISHERS[index % len(PUBLISHERS)]),
+            ('Volumes no Japão', f'{volumes} (completo)'),
+            ('Volumes no Brasil', f'{generator.randint(1, volumes)} (em andamento)'),
+            ('Formato', generator.choice(FORMATS)),
+            ('Miolo', 'Papel jornal'),
+            ('Acabamento', 'Brochura com sobrecapa'),
+            ('Periodicidade', generator.choice(FREQUENCIES)),
+        )
+    )
+    price_tables: str = build_price_table(
+        generator, ('Vol.', 'Data', 'Preço'), volumes
+    ) + build_price_table(generator, ('Cap.', 'Japão'), generator.randint(2, 12))
+
+    if index % 2:
+        content: str = (
+            f'<table><tbody><tr><td>{information}</td>'
+            f'<td><img src="/capa-{index}.jpg"></td>'
+            f'</tr></tbody></table>{price_tables}'
+        )
+    else:
+        content = f'<p>{information}</p>{price_tables}'
+
+    return (
+        f'<html><body>{CHROME}<article><h1>Manga {index}</h1>'
+        f'<div class="entry-content">{content}</div></article></body></html>'
+    ).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves the catalog and the manga pages of a `StandInServer`."""
+
+    protocol_version: str = 'HTTP/1.1'
+    server: 'StandInServer'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if random.random() < self.server.error_rate:
+            return self._send(503)
+
+        path: str = self.path.partition('?')[0]
+
+        if path == '/manga/':
+            body: bytes = self.server.catalog
+
+        elif (
+            slug := path.removeprefix('/manga/manga-').removesuffix('/')
+        ).isdigit() and int(slug) < self.server.pages:
+            body = build_page(int(slug))
+
+        else:
+            return self._send(404)
+
+        etag: str = f'"{hashlib.md5(body).hexdigest()}"'
+
+        if self.headers.get('If-None-Match') == etag:
+            return self._send(304, {'ETag': etag})
+
+        self._send(
+            200, {'ETag': etag, 'Content-Type': 'text/html; charset=UTF-8'}, body
+        )
+
+    def _send(
+        self, status: int, headers: dict[str, str] = {}, body: bytes = b''
+    ) -> None:
+        self.send_response(status)
+
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    A threaded HTTP server for the stand-in site.
+
+    Attributes:
+        pages (int): The number of manga pages served.
+        latency (float): Seconds waited before answering each request.
+        error_rate (float): Fraction of requests answered with `503 Service
+            Unavailable`.
+        catalog (bytes): The HTML of the catalog page.
+    """
+
+    daemon_threads: bool = True
+    request_queue_size: int = 1024
+
+    def __init__(
+        self,
+        port: int = 0,
+        pages: int = 500,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            port (int, optional): The port to listen on, 0 for a free one. Defaults
+                to 0.
+            pages (int, optional): The number of manga pages served. Defaults to 500.
+            latency (float, optional): Seconds waited before answering each request.
+                                       Defaults to 0.0.
+            error_rate (float, optional): Fraction of requests answered with `503`.
+                                          Defaults to 0.0.
+        """
+        super().__init__(('127.0.0.1', port), StandInHandler)
+        self.pages: int = pages
+        self.latency: float = latency
+        self.error_rate: float = error_rate
+        self.catalog: bytes = build_catalog(f'{self.get_url()}/manga/', pages)
+
+    def get_url(self) -> str:
+        """
+        Returns:
+            str: The root URL of the server, e.g. 'http://127.0.0.1:8000'.
+        """
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+def serve(
+    connection: Connection, pages: int, latency: float, error_rate: float
+) -> None:
+    """
+    Runs a stand-in server until its process is terminated, sending its URL once
+    listening.
+
+    Args:
+        connection (Connection): The end of the pipe receiving the URL of the server.
+        pages (int): The number of manga pages served.
+        latency (float): Seconds waited before answering each request.
+        error_rate (float): Fraction of requests answered with `503`.
+    """
+    server: StandInServer = StandInServer(
+        pages=pages, latency=latency, error_rate=error_rate
+    )
+    connection.send(server.get_url())
+    server.serve_forever()
+
+
+@contextmanager
+def run_site(
+    pages: int = 500, latency: float = 0.0, error_rate: float = 0.0
+) -> Iterator[str]:
+    """
+    Runs the stand-in site in a separate process, so it does not take part in
+    the CPU time and memory measured by the benchmarks.
+
+    Args:
+        pages (int, optional): The number of manga pages served. Defaults to 500.
+        latency (float, optional): Seconds waited before answering each request.
+                                   Defaults to 0.0.
+        error_rate (float, optional): Fraction of requests answered with `503`.
+                                      Defaults to 0.0.
+
+    Yields:
+        str: The root URL of the site.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process: multiprocessing.BaseProcess = multiprocessing.get_context(
+        'spawn'
+    ).Process(target=serve, args=(sender, pages, latency, error_rate), daemon=True)
+    process.start()
+    sender.close()
+
+    try:
+        yield receiver.recv()
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--pages', type=int, default=500)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    arguments = parser.parse_args()
+
+    server: StandInServer = StandInServer(
+        arguments.port, arguments.pages, arguments.latency, arguments.error_rate
+    )
+    print(f'Serving {arguments.pages} manga pages at {server.get_url()}/manga/')
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,390 @@
+"""
+Offline benchmark suite of the crawler and the extraction, run against the local
+stand-in site of `benchmarks.site`.
+
+Every scenario runs in its own process and working directory, so its peak RSS
+and CPU time are measured in isolation; the stand-in site runs in yet another
+process. The results are printed as a table and written as JSON, so runs of
+different revisions can be compared.
+
+Scenarios:
+    fetch_simple: Crawls every manga page with `SimpleRequestStrategy`.
+    fetch_conditional: Crawls them again, answered with `304 Not Modified`.
+    persist_structured_data: Extracts the pages stored by `fetch_simple`.
+    fetch_paginated: Crawls `PAGES_PER_PATH` pages per path with
+        `PaginatedRequestStrategy`.
+    fetch_processes: Crawls every manga page in `WORKER_PROCESSES` processes.
+    fetch_leased: Crawls them in `WORKER_PROCESSES` processes claiming leased paths
+                  from a shared work queue, as the processes of a coordinated crawl.
+    main: Refreshes the catalog, crawls the pages it lists and extracts them.
+
+Usage:
+    poetry run python3 -m benchmarks.suite --pages 500 --output bench.json
+"""
+
+# Native Libraries
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from multiprocessing.connection import Connection
+from os import chdir, cpu_count, makedirs
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable
+
+# Third-Party Libraries
+from loguru import logger
+
+# Local Modules
+from benchmarks.site import get_slug, run_site
+from src.core.metrics import CrawlMetrics
+from src.core.requester import (
+    CatalogRequestStrategy,
+    LeasedRequestStrategy,
+    PaginatedRequestStrategy,
+    SimpleRequestStrategy,
+)
+from src.core.settings import default_settings
+from src.core.store import get_page_store
+from src.entrypoint import fetch, seed_work
+from src.extraction import spider
+
+PAGES_PER_PATH: int = 5
+WORKER_PROCESSES: int = 4
+
+# Scenarios sharing a working directory run in this order, one after the other.
+SCENARIO_DIRECTORIES: dict[str, str] = {
+    'fetch_simple': 'simple',
+    'fetch_conditional': 'simple',
+    'persist_structured_data': 'simple',
+    'fetch_paginated': 'paginated',
+    'fetch_processes': 'processes',
+    'fetch_leased': 'leased',
+    'main': 'main',
+}
+
+
+def get_page_urls(site_url: str, pages: int) -> list[str]:
+    """
+    Args:
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages.
+
+    Returns:
+        list[str]: The URLs of every manga page.
+    """
+    return [f'{site_url}/manga/{get_slug(index)}/' for index in range(pages)]
+
+
+def fetch_simple(site_url: str, pages: int) -> tuple[int, CrawlMetrics | None]:
+    """
+    Args:
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages.
+
+    Returns:
+        tuple[int, CrawlMetrics | None]: The number of pages processed and the crawl
+            metrics.
+    """
+    strategy: SimpleRequestStrategy = SimpleRequestStrategy()
+    fetch(paths=get_page_urls(site_url, pages), request_strategy=strategy)
+
+    return strategy.metrics.pages, strategy.metrics
+
+
+def fetch_paginated(site_url: str, pages: int) -> tuple[int, CrawlMetrics | None]:
+    """
+    Args:
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages.
+
+    Returns:
+        tuple[int, CrawlMetrics | None]: The number of pages processed and the crawl
+            metrics.
+    """
+    strategy: PaginatedRequestStrategy = PaginatedRequestStrategy(
+        number_of_pages=PAGES_PER_PATH
+    )
+    fetch(
+        paths=get_page_urls(site_url, pages // PAGES_PER_PATH),
+        request_strategy=strategy,
+    )
+
+    return strategy.metrics.pages, strategy.metrics
+
+
+def fetch_processes(site_url: str, pages: int) -> tuple[int, CrawlMetrics | None]:
+    """
+    Args:
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages.
+
+    Returns:
+        tuple[int, CrawlMetrics | None]: The number of pages processed and the merged
+        crawl metrics of the workers.
+    """
+    strategy: SimpleRequestStrategy = SimpleRequestStrategy()
+    fetch(
+        paths=get_page_urls(site_url, pages),
+        request_strategy=strategy,
+        processes=WORKER_PROCESSES,
+    )
+
+    return strategy.metrics.pages, strategy.metrics
+
+
+def fetch_leased(site_url: str, pages: int) -> tuple[int, CrawlMetrics | None]:
+    """
+    Args:
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages.
+
+    Returns:
+        tuple[int, CrawlMetrics | None]: The number of pages processed and the merged
+        crawl metrics of the workers.
+    """
+    seed_work(get_page_urls(site_url, pages))
+
+    strategy: LeasedRequestStrategy = LeasedRequestStrategy()
+    fetch(paths=[], request_strategy=strategy, processes=WORKER_PROCESSES)
+
+    return strategy.metrics.pages, strategy.metrics
+
+
+def persist_structured_data(
+    site_url: str, pages: int
+) -> tuple[int, CrawlMetrics | None]:
+    """
+    Args:
+        site_url (str): The root URL of the stand-in site, unused.
+        pages (int): The number of manga pages, unused.
+
+    Returns:
+        tuple[int, CrawlMetrics | None]: The number of pages extracted and no
+            metrics.
+    """
+    spider.persist_structured_data()
+
+    with get_page_store() as page_store:
+        return len(page_store.get_digests()), None
+
+
+def run_main(site_url: str, pages: int) -> tuple[int, CrawlMetrics | None]:
+    """
+    Args:
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages, unused.
+
+    Returns:
+        tuple[int, CrawlMetrics | None]: The number of pages crawled, catalog
+            included, and the crawl metrics.
+    """
+    spider.BASE_URL = f'{site_url}/manga/'
+    # Keeps hold of the strategy built by `main`, to read its metrics afterwards.
+    strategy: CatalogRequestStrategy = spider.get_catalog_strategy()
+    spider.get_catalog_strategy = lambda crawl_pages=True: strategy
+    spider.main()
+
+    return strategy.metrics.pages, strategy.metrics
+
+
+SCENARIOS: dict[str, Callable[[str, int], tuple[int, CrawlMetrics | None]]] = {
+    'fetch_simple': fetch_simple,
+    'fetch_conditional': fetch_simple,
+    'persist_structured_data': persist_structured_data,
+    'fetch_paginated': fetch_paginated,
+    'fetch_processes': fetch_processes,
+    'fetch_leased': fetch_leased,
+    'main': run_main,
+}
+
+
+def run_scenario(
+    name: str, site_url: str, pages: int, directory: str, connection: Connection
+) -> None:
+    """
+    Runs a scenario in the current process, sending its measurements through the
+    pipe.
+
+    Args:
+        name (str): The name of the scenario.
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages.
+        directory (str): The working directory of the scenario.
+        connection (Connection): The end of the pipe receiving the measurements.
+    """
+    chdir(directory)
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+    default_settings.progress_interval = None
+    default_settings.worker_log_level = 'WARNING'
+
+    before: resource.struct_rusage = resource.getrusage(resource.RUSAGE_SELF)
+    started_at: float = perf_counter()
+
+    processed, metrics = SCENARIOS[name](site_url, pages)
+
+    elapsed: float = perf_counter() - started_at
+    usages: list[resource.struct_rusage] = [
+        resource.getrusage(resource.RUSAGE_SELF),
+        resource.getrusage(resource.RUSAGE_CHILDREN),
+    ]
+    cpu_time: float = sum(usage.ru_utime + usage.ru_stime for usage in usages) - (
+        before.ru_utime + before.ru_stime
+    )
+
+    connection.send({
+        'scenario': name,
+        'pages': processed,
+        'seconds': round(elapsed, 3),
+        'pages_per_second': round(processed / elapsed, 1) if elapsed else None,
+        'requests': metrics.requests if metrics else None,
+        'latency_p50': round(metrics.latency.get_quantile(0.5), 4)
+        if metrics
+        else None,
+        'latency_p99': round(metrics.latency.get_quantile(0.99), 4)
+        if metrics
+        else None,
+        'peak_rss_mib': round(max(usage.ru_maxrss for usage in usages) / 1024, 1),
+        'cpu_seconds': round(cpu_time, 3),
+    })
+
+
+def measure(name: str, site_url: str, pages: int, directory: str) -> dict[str, Any]:
+    """
+    Runs a scenario in a fresh process.
+
+    Args:
+        name (str): The name of the scenario.
+        site_url (str): The root URL of the stand-in site.
+        pages (int): The number of manga pages.
+        directory (str): The working directory of the scenario.
+
+    Returns:
+        dict[str, Any]: The measurements of the scenario.
+
+    Raises:
+        RuntimeError: If the scenario failed before sending its measurements.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process: multiprocessing.BaseProcess = multiprocessing.get_context(
+        'spawn'
+    ).Process(target=run_scenario, args=(name, site_url, pages, directory, sender))
+    process.start()
+    sender.close()
+
+    try:
+        result: dict[str, Any] = receiver.recv()
+
+    except EOFError:
+        raise RuntimeError(
+            f'The scenario {name} failed, see the traceback above.'
+        ) from None
+
+    finally:
+        process.join()
+
+    return result
+
+
+def get_environment() -> dict[str, Any]:
+    """
+    Returns:
+        dict[str, Any]: The revision, interpreter and machine the suite ran on.
+    """
+    revision: subprocess.CompletedProcess = subprocess.run(
+        ['git', 'rev-parse', '--short', 'HEAD'],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    return {
+        'revision': revision.stdout.strip() or None,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': cpu_count(),
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        '--pages', type=int, default=500, help='Manga pages of the site.'
+    )
+    parser.add_argument(
+        '--latency', type=float, default=0.0, help='Seconds per response.'
+    )
+    parser.add_argument(
+        '--error-rate', type=float, default=0.0, help='Fraction of 503s.'
+    )
+    parser.add_argument(
+        '--scenarios',
+        nargs='+',
+        choices=SCENARIOS,
+        default=list(SCENARIOS),
+        help='Scenarios to run, in order.',
+    )
+    parser.add_argument(
+        '--output', help='Path of the JSON results, printed if not given.'
+    )
+    arguments = parser.parse_args()
+
+    report: dict[str, Any] = {
+        'environment': get_environment(),
+        'site': {
+            'pages': arguments.pages,
+            'latency': arguments.latency,
+            'error_rate': arguments.error_rate,
+        },
+        'results': [],
+    }
+
+    with (
+        TemporaryDirectory() as directory,
+        run_site(
+            arguments.pages, arguments.latency, arguments.error_rate
+        ) as site_url,
+    ):
+        print(
+            f'{"scenario":<24} {"pages":>6} {"pages/s":>9} {"p50 (s)":>8} '
+            f'{"p99 (s)":>8} {"RSS (MiB)":>10} {"CPU (s)":>8}',
+            file=sys.stderr,
+        )
+
+        for name in arguments.scenarios:
+            scenario_directory: str = join(directory, SCENARIO_DIRECTORIES[name])
+            makedirs(scenario_directory, exist_ok=True)
+
+            result: dict[str, Any] = measure(
+                name, site_url, arguments.pages, scenario_directory
+            )
+            report['results'].append(result)
+
+            print(
+                f'{name:<24} {result["pages"]:>6} {result["pages_per_second"]:>9} '
+                f'{result["latency_p50"] or "-":>8} '
+                f'{result["latency_p99"] or "-":>8} '
+                f'{result["peak_rss_mib"]:>10} {result["cpu_seconds"]:>8}',
+                file=sys.stderr,
+            )
+
+    if arguments.output is None:
+        print(json.dumps(report, indent=2))
+        return None
+
+    with open(arguments.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,22 @@
 # Native Libraries
-from typing import Callable, Iterable
-from functools import cached_property
-from time import time
+import json
 import random
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from functools import cache
+from glob import glob
+from os import makedirs, stat, stat_result
+from os.path import dirname, exists, isdir, join
+from time import monotonic, time
+from typing import Iterable, Iterator, Self
 
 # Third-Party Libraries
-from ua_parser.user_agent_parser import Parse
+from httpx import codes
+from loguru import logger
+
+# Local Modules
+from src.core.cache import UserAgentCache
+from src.core.settings import default_settings
 
 user_agents: list[str] = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36 Edg/113.0.1774.35',
@@ -84,137 +95,665 @@ user_agents: list[str] = [
     'Mozilla/5.0 (Android 12; Mobile; Focus) Gecko/20100101 Firefox/114.0',
 ]
 
+BLOCKING_STATUS_CODES: frozenset[int] = frozenset({
+    codes.FORBIDDEN,
+    codes.TOO_MANY_REQUESTS,
+})
+
+
 class UserAgent:
     """
-    A class for parsing and handling user agent strings.
+    A compact record of a user agent string and its parsed attributes.
 
     Attributes:
         agent (str): The original user agent string.
-        parsed_string (dict[str, dict[str, str]]): The parsed user agent details.
+        browser (str): The browser family name.
+        browser_version (int | None): The major version of the browser.
+        os (str): The operating system family name.
         last_used (float): The timestamp of the last use.
     """
 
-    def __init__(self, agent: str) -> None:
-        """
-        Initializes a UserAgent instance and parses the user agent string.
+    __slots__ = ('agent', 'browser', 'browser_version', 'os', 'last_used')
 
+    def __init__(
+        self, agent: str, browser: str, browser_version: int | None, os: str
+    ) -> None:
+        """
         Args:
-            agent (str): The user agent string to parse.
+            agent (str): The user agent string.
+            browser (str): The browser family name.
+            browser_version (int | None): The major version of the browser.
+            os (str): The operating system family name.
         """
         self.agent: str = agent
-        self.parsed_string: dict[str, dict[str, str]] = Parse(agent)
+        self.browser: str = browser
+        self.browser_version: int | None = browser_version
+        self.os: str = os
         self.last_used: float = time()
 
-    @cached_property
-    def browser(self) -> str:
+    @classmethod
+    def parse(cls, agent: str) -> Self:
         """
-        Retrieves the browser family parsed from the user agent string.
+        Parses a user agent string with `ua_parser`, which is only imported when
+        a string is missing from the cache.
+
+        Args:
+            agent (str): The user agent string to parse.
 
         Returns:
-            str: The browser family name.
+            Self: The parsed user agent.
         """
-        return self.parsed_string['user_agent']['family']
+        # Imported on first use, so only runs that parse user agents pay for it.
+        from ua_parser.user_agent_parser import Parse  # noqa: PLC0415
 
-    @cached_property
-    def browser_version(self) -> int:
-        """
-        Retrieves the browser's major version as an integer.
+        parsed_string: dict[str, dict[str, str]] = Parse(agent)
+        major: str | None = parsed_string['user_agent']['major']
 
+        return cls(
+            agent,
+            parsed_string['user_agent']['family'],
+            int(major) if major and major.isdigit() else None,
+            parsed_string['os']['family'],
+        )
+
+    def __str__(self) -> str:
+        """
         Returns:
-            int: The major version of the browser.
+            str: The original user agent string.
         """
-        return int(self.parsed_string['user_agent']['major'])
+        return self.agent
+
+
+def load_user_agents(
+    agents: Iterable[str],
+    cache_path: str | None = None,
+) -> list[UserAgent]:
+    """
+    Builds the user agents of a pool, parsing only the strings missing from the
+    on-disk cache.
+
+    Args:
+        agents (Iterable[str]): The user agent strings.
+        cache_path (str | None, optional): The path of the parse cache, None to
+                                           always parse. Defaults to None.
+
+    Returns:
+        list[UserAgent]: The user agents, in the order of `agents`.
+    """
+    agents = list(agents)
+    attributes: dict[str, tuple[str, int | None, str]] = {}
+
+    with UserAgentCache(path=cache_path) if cache_path else nullcontext() as cache:
+        if cache is not None:
+            attributes = cache.get_many(agents)
+
+        for agent in dict.fromkeys(agents):
+            if agent in attributes:
+                continue
+
+            user_agent: UserAgent = UserAgent.parse(agent)
+            attributes[agent] = (
+                user_agent.browser,
+                user_agent.browser_version,
+                user_agent.os,
+            )
 
-    @cached_property
-    def os(self) -> str:
+            if cache is not None:
+                cache.put(agent, *attributes[agent])
+
+    return [UserAgent(agent, *attributes[agent]) for agent in agents]
+
+
+class FenwickTree:
+    """
+    A Fenwick (binary indexed) tree of floats, supporting point updates and
+    prefix-sum searches in O(log n).
+
+    Attributes:
+        total (float): The sum of every value.
+    """
+
+    def __init__(self, values: Iterable[float]) -> None:
+        """
+        Builds the tree in O(n).
+
+        Args:
+            values (Iterable[float]): The initial values.
+        """
+        self._tree: list[float] = [0.0, *values]
+        self._size: int = len(self._tree) - 1
+
+        for index in range(1, self._size + 1):
+            if (parent := index + (index & -index)) <= self._size:
+                self._tree[parent] += self._tree[index]
+
+        self.total: float = sum(self._tree[index] for index in self._roots())
+
+    def add(self, index: int, delta: float) -> None:
+        """
+        Adds a delta to a value.
+
+        Args:
+            index (int): The 0-based position of the value.
+            delta (float): The amount to add.
         """
-        Retrieves the operating system family parsed from the user agent string.
+        self.total += delta
+        index += 1
+
+        while index <= self._size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def find(
+        self, target: float, slope: float = 0.0, scales: 'FenwickTree | None' = None
+    ) -> int:
+        """
+        Finds the first position whose prefix sum exceeds a target, where every
+        value is increased by `slope`, times its scale when `scales` is given.
+
+        Args:
+            target (float): The prefix sum to exceed.
+            slope (float, optional): An amount added to every value. Defaults to 0.0.
+            scales (FenwickTree | None, optional): A tree of the same size holding
+                the scale of the slope of every value.
 
         Returns:
-            str: The operating system family name.
+            int: The 0-based position found, the last one if the target is never
+                exceeded.
         """
-        return self.parsed_string['os']['family']
+        position: int = 0
+        step: int = 1 << (self._size.bit_length() - 1) if self._size else 0
 
-    def __str__(self) -> str:
+        while step:
+            if (next_position := position + step) <= self._size:
+                block: float = self._tree[next_position] + slope * (
+                    scales._tree[next_position] if scales is not None else step
+                )
+
+                if block <= target:
+                    target -= block
+                    position = next_position
+
+            step >>= 1
+
+        return min(position, self._size - 1)
+
+    def _roots(self) -> Iterable[int]:
         """
         Returns:
-            str: The original user agent string.
+            Iterable[int]: The nodes whose ranges partition the whole tree.
         """
-        return self.agent
+        index: int = self._size
+
+        while index > 0:
+            yield index
+            index -= index & -index
+
+
+BROWSER_WEIGHTS: dict[str, int] = {
+    'Chrome': 100,
+    'Firefox': 50,
+    'Edge': 50,
+    'Firefox Mobile': 0,
+    'Chrome Mobile': 0,
+}
+
+OS_WEIGHTS: dict[str, int] = {
+    'Windows': 150,
+    'Mac OS X': 100,
+    'Android': -100,
+    'Ubuntu': -50,
+    'Linux': -50,
+}
+
+
+@dataclass
+class AgentStats:
+    """
+    Outcome statistics of the requests sent with a user agent.
+
+    Attributes:
+        requests (int): The number of responses received.
+        blocked (int): The number of `403 Forbidden` and `429 Too Many Requests`
+            responses.
+        latency (float | None): The moving average of the seconds until the response
+            headers.
+    """
+
+    requests: int = 0
+    blocked: int = 0
+    latency: float | None = None
+
+    def record(
+        self, status_code: int, latency: float, smoothing: float = 0.2
+    ) -> None:
+        """
+        Args:
+            status_code (int): The status code of the response.
+            latency (float): The seconds until the response headers were received.
+            smoothing (float, optional): The weight of the new latency in the moving
+                                         average. Defaults to 0.2.
+        """
+        self.requests += 1
+        self.blocked += status_code in BLOCKING_STATUS_CODES
+        self.latency = (
+            latency
+            if self.latency is None
+            else (smoothing * latency + (1 - smoothing) * self.latency)
+        )
+
+    def get_health(
+        self, latency_target: float, prior: int = 5, floor: float = 0.05
+    ) -> float:
+        """
+        Scores the user agent between `floor` and 1, lower when it is blocked
+        often or answered slowly. A user agent without history scores 1.
+
+        Args:
+            latency_target (float): The latency, in seconds, that halves the score.
+            prior (int, optional): Virtual successful requests smoothing the block
+                                   rate of user agents with little history. Defaults
+                                   to 5.
+            floor (float, optional): The lowest score, so blocked agents are still
+                                     probed now and then. Defaults to 0.05.
+
+        Returns:
+            float: The health score.
+        """
+        block_rate: float = self.blocked / (self.requests + prior)
+        slowness: float = (self.latency or 0.0) / latency_target
+
+        return max((1 - block_rate) ** 2 / (1 + slowness), floor)
+
+    def merge(self, other: 'AgentStats') -> None:
+        """
+        Adds the statistics of another run, e.g. of a worker process, averaging
+        the latencies by number of responses.
+
+        Args:
+            other (AgentStats): The statistics to add.
+        """
+        if other.latency is not None:
+            self.latency = (
+                other.latency
+                if self.latency is None
+                else (
+                    (self.latency * self.requests + other.latency * other.requests)
+                    / max(self.requests + other.requests, 1)
+                )
+            )
+
+        self.requests += other.requests
+        self.blocked += other.blocked
+
+
+def read_user_agent_pool(path: str) -> list[str]:
+    """
+    Reads a user agent pool, one string per line, ignoring blank lines and `#`
+    comments.
+
+    Args:
+        path (str): A text file, or a directory whose `*.txt` files are read in name
+            order.
+
+    Returns:
+        list[str]: The unique user agent strings of the pool.
+    """
+    files: list[str] = sorted(glob(join(path, '*.txt'))) if isdir(path) else [path]
+    agents: dict[str, None] = {}
+
+    for file_path in files:
+        with open(file_path, encoding='utf-8') as file:
+            for line in file:
+                if (agent := line.strip()) and not agent.startswith('#'):
+                    agents.setdefault(agent)
+
+    return list(agents)
 
 
 class Rotator:
     """
     A rotator for managing and selecting user agents based on weighted attributes.
 
+    The weight of a user agent is a static part (browser, OS and version),
+    computed once, plus the seconds elapsed since it was last used, scaled by
+    its health: user agents that get blocked (`403`/`429`) or answered slowly
+    receive less traffic. Since the recency term grows at the same pace for
+    every agent, one tree stores `health * (static weight - last use)` and
+    another the health, and the elapsed time is added while searching, so a
+    selection costs O(log n) instead of re-weighing the whole pool.
+
+    When a pool path is given, the pool is read from it and reloaded whenever
+    its files change, keeping the statistics of the user agents still listed.
+
     Attributes:
-        user_agents (list[UserAgent]): A list of UserAgent instances created from the provided strings.
+        user_agents (list[UserAgent]): A list of UserAgent instances created from the
+            provided strings.
+        stats (dict[str, AgentStats]): The outcome statistics of every user agent.
     """
 
-    def __init__(self, user_agents: Iterable[str]) -> None:
+    def __init__(
+        self,
+        user_agents: Iterable[str],
+        pool_path: str | None = None,
+        reload_interval: float = 5.0,
+        latency_target: float = 1.0,
+        cache_path: str | None = None,
+    ) -> None:
         """
         Initializes the Rotator instance with a list of user agent strings.
 
         Args:
-            user_agents (Iterable[str]): A list of user agent strings to rotate through.
+            user_agents (Iterable[str]): A list of user agent strings to rotate
+                                         through, used when there is no pool file or
+                                         it is empty.
+            pool_path (str | None, optional): A file or directory holding the pool,
+                                              watched for changes.
+            reload_interval (float, optional): Minimum seconds between two checks of
+                                               the pool files. Defaults to 5.0.
+            latency_target (float, optional): The latency, in seconds, that halves
+                                              the health of a user agent. Defaults to
+                                              1.0.
+            cache_path (str | None, optional): The path of the parse cache, None to
+                                               always parse. Defaults to None.
         """
-        self.user_agents: list[UserAgent] = [UserAgent(ua) for ua in user_agents]
+        self.user_agents: list[UserAgent] = []
+        self.stats: dict[str, AgentStats] = {}
+        self._fallback: list[str] = list(dict.fromkeys(user_agents))
+        self._pool_path: str | None = pool_path
+        self._reload_interval: float = reload_interval
+        self._latency_target: float = latency_target
+        self._cache_path: str | None = cache_path
+        self._signature: tuple | None = None
+        self._checked_at: float = monotonic()
+        # Times are measured from the creation of the rotator to keep the sums small.
+        self._epoch: float = time()
+
+        self._load(self._read_pool())
 
-    def weigh_user_agent(self, user_agent: UserAgent) -> int:
+    @staticmethod
+    def get_static_weight(user_agent: UserAgent) -> int:
         """
-        Calculates a weight for a user agent based on usage frequency, browser, OS, and version.
+        Calculates the part of the weight of a user agent that does not change over
+        time, based on its browser, OS and version.
 
         Args:
             user_agent (UserAgent): The user agent to calculate a weight for.
 
         Returns:
-            int: The calculated weight for the user agent.
+            int: The static weight of the user agent.
         """
         weight: int = 1000
 
-        browser_weights: dict[str, int] = {
-            'Chrome': 100,
-            'Firefox': 50,
-            'Edge': 50,
-            'Firefox Mobile': 0,
-            'Chrome Mobile': 0,
-        }
-
-        os_weights: dict[str, int] = {
-            'Windows': 150,
-            'Mac OS X': 100,
-            'Android': -100,
-            'Ubuntu': -50,
-            'Linux': -50,
-        }
-
-        weight += (
-            time() - user_agent.last_used if user_agent.last_used else 0
-        )
         weight += (
             user_agent.browser_version * 10 if user_agent.browser_version else 0
         )
-        weight += browser_weights.get(user_agent.browser, 0)
-        weight += os_weights.get(user_agent.os, 0)
+        weight += BROWSER_WEIGHTS.get(user_agent.browser, 0)
+        weight += OS_WEIGHTS.get(user_agent.os, 0)
 
         return weight
 
+    def get_health(self, agent: str) -> float:
+        """
+        Args:
+            agent (str): The user agent string.
+
+        Returns:
+            float: The health score of the user agent, 1 without history.
+        """
+        if (stats := self.stats.get(agent)) is None:
+            return 1.0
+
+        return stats.get_health(self._latency_target)
+
+    def weigh_user_agent(self, user_agent: UserAgent) -> float:
+        """
+        Calculates a weight for a user agent based on usage frequency, browser, OS,
+        version and health.
+
+        Args:
+            user_agent (UserAgent): The user agent to calculate a weight for.
+
+        Returns:
+            float: The calculated weight for the user agent.
+        """
+        return self.get_health(user_agent.agent) * (
+            self.get_static_weight(user_agent)
+            + (time() - user_agent.last_used if user_agent.last_used else 0)
+        )
+
     def get(self) -> str:
         """
-        Selects a user agent string based on calculated weights.
+        Selects a user agent string based on calculated weights, in O(log n).
 
         Returns:
             str: The selected user agent string.
         """
-        user_agent_weights: list[int] = [
-            self.weigh_user_agent(user_agent) for user_agent in self.user_agents
-        ]
-        user_agent: list[UserAgent] = (
-            random.choices(self.user_agents, user_agent_weights).pop(0)
+        self._reload_if_changed()
+
+        now: float = time()
+        elapsed: float = now - self._epoch
+        total: float = self._weights.total + elapsed * self._healths.total
+
+        index: int = self._weights.find(
+            random.random() * total, slope=elapsed, scales=self._healths
         )
-        user_agent.last_used = time()
+        user_agent: UserAgent = self.user_agents[index]
+
+        self._weights.add(
+            index, self._health_of[index] * (user_agent.last_used - now)
+        )
+        user_agent.last_used = now
 
         return str(user_agent)
 
+    def record(self, agent: str, status_code: int, latency: float) -> None:
+        """
+        Records the outcome of a request sent with a user agent, updating its weight.
+
+        Args:
+            agent (str): The user agent string sent.
+            status_code (int): The status code of the response.
+            latency (float): The seconds until the response headers were received.
+        """
+        self.stats.setdefault(agent, AgentStats()).record(status_code, latency)
+        self._update_health(agent)
+
+    def merge_stats(self, stats: dict[str, AgentStats]) -> None:
+        """
+        Adds the statistics gathered by another rotator, e.g. of a worker process,
+        updating the weights of the user agents.
+
+        Args:
+            stats (dict[str, AgentStats]): The statistics of every user agent, keyed
+                by string.
+        """
+        for agent, agent_stats in stats.items():
+            self.stats.setdefault(agent, AgentStats()).merge(agent_stats)
+            self._update_health(agent)
+
+    def export_stats(self, path: str) -> None:
+        """
+        Writes the statistics, health and current weight of every user agent of the
+        pool to a JSON file, from the healthiest to the least healthy.
+
+        Args:
+            path (str): The path of the JSON file.
+        """
+        rows: list[dict] = [
+            {
+                'agent': user_agent.agent,
+                'browser': user_agent.browser,
+                'os': user_agent.os,
+                **asdict(self.stats.get(user_agent.agent, AgentStats())),
+                'health': round(self._health_of[index], 4),
+                'weight': round(self.weigh_user_agent(user_agent), 2),
+            }
+            for index, user_agent in enumerate(self.user_agents)
+        ]
+        rows.sort(key=lambda row: row['health'], reverse=True)
+
+        if directory := dirname(path):
+            makedirs(directory, exist_ok=True)
+
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(rows, file, ensure_ascii=False, indent=2)
+
+    def _update_health(self, agent: str) -> None:
+        """
+        Moves the weight of a user agent to its current health.
+
+        Args:
+            agent (str): The user agent string.
+        """
+        if (index := self._indices.get(agent)) is None:
+            return None
+
+        health: float = self.get_health(agent)
+
+        if (delta := health - self._health_of[index]) == 0:
+            return None
+
+        user_agent: UserAgent = self.user_agents[index]
+        self._health_of[index] = health
+        self._healths.add(index, delta)
+        self._weights.add(
+            index,
+            delta
+            * (
+                self.get_static_weight(user_agent)
+                - (user_agent.last_used - self._epoch)
+            ),
+        )
+
+    def _read_pool(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The user agents of the pool file, or the fallback list when
+            there is no pool file or it holds no user agent.
+        """
+        if self._pool_path is None:
+            return self._fallback
+
+        self._signature = self._get_signature()
+
+        if not exists(self._pool_path):
+            logger.warning(
+                f'The user agent pool {self._pool_path} does not exist, '
+                'using the default one.'
+            )
+
+        elif agents := read_user_agent_pool(self._pool_path):
+            return agents
+
+        else:
+            logger.warning(
+                f'The user agent pool {self._pool_path} is empty, '
+                'using the default one.'
+            )
+
+        return self._fallback
+
+    def _load(self, agents: list[str]) -> None:
+        """
+        Builds the selection trees of a pool, keeping the last use of the user agents
+        that were already in the previous pool.
+
+        Args:
+            agents (list[str]): The user agent strings of the pool.
+        """
+        previous: dict[str, UserAgent] = {
+            user_agent.agent: user_agent for user_agent in self.user_agents
+        }
+        parsed: Iterator[UserAgent] = iter(
+            load_user_agents(
+                [agent for agent in agents if agent not in previous],
+                cache_path=self._cache_path,
+            )
+        )
+
+        self.user_agents = [
+            previous[agent] if agent in previous else next(parsed)
+            for agent in agents
+        ]
+        self._indices: dict[str, int] = {
+            user_agent.agent: index
+            for index, user_agent in enumerate(self.user_agents)
+        }
+        self._health_of: list[float] = [
+            self.get_health(user_agent.agent) for user_agent in self.user_agents
+        ]
+        self._healths: FenwickTree = FenwickTree(self._health_of)
+        self._weights: FenwickTree = FenwickTree(
+            health
+            * (
+                self.get_static_weight(user_agent)
+                - (user_agent.last_used - self._epoch)
+            )
+            for health, user_agent in zip(self._health_of, self.user_agents)
+        )
+
+    def _reload_if_changed(self) -> None:
+        """
+        Reloads the pool when its files changed, checking at most every
+        `reload_interval`.
+        """
+        if (
+            self._pool_path is None
+            or monotonic() - self._checked_at < self._reload_interval
+        ):
+            return None
+
+        self._checked_at = monotonic()
+
+        if self._get_signature() == self._signature:
+            return None
+
+        self._load(self._read_pool())
+        logger.info(
+            f'Reloaded {len(self.user_agents)} user agents from {self._pool_path}.'
+        )
+
+    def _get_signature(self) -> tuple:
+        """
+        Returns:
+            tuple: The path, size and modification time of every file of the pool.
+        """
+        if not exists(self._pool_path):
+            return ()
+
+        files: list[str] = (
+            sorted(glob(join(self._pool_path, '*.txt')))
+            if isdir(self._pool_path)
+            else [self._pool_path]
+        )
+
+        signature: list[tuple[str, int, int]] = []
+
+        for file_path in files:
+            file_stat: stat_result = stat(file_path)
+            signature.append((file_path, file_stat.st_size, file_stat.st_mtime_ns))
+
+        return tuple(signature)
+
 
-get_random_user_agent: Callable[[], str] = Rotator(user_agents).get
+@cache
+def get_rotator() -> Rotator:
+    """
+    Returns:
+        Rotator: The rotator shared by every request, created on first use.
+    """
+    return Rotator(
+        user_agents,
+        pool_path=default_settings.user_agent_pool_path,
+        reload_interval=default_settings.user_agent_reload_interval,
+        cache_path=default_settings.user_agent_cache_path,
+    )
+
+
+def get_random_user_agent() -> str:
+    """
+    Returns:
+        str: A user agent string selected by the shared rotator.
+    """
+    return get_rotator().get()
@@ -0,0 +1,335 @@
+# Native Libraries
+import sqlite3
+from dataclasses import dataclass
+from os import makedirs
+from os.path import dirname
+from time import time
+from typing import Iterable, Self
+
+# Third-Party Libraries
+from httpx import Response
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    HTTP validators stored for a previously fetched URL.
+
+    Attributes:
+        etag (str | None): The `ETag` header returned by the server.
+        last_modified (str | None): The `Last-Modified` header returned by the
+            server.
+        content_hash (str | None): The hash of the stored response body.
+        fetched_at (float): The timestamp of the last successful fetch.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    content_hash: str | None
+    fetched_at: float
+
+
+@dataclass
+class CacheStats:
+    """
+    Per-run counters of the validator cache.
+
+    Attributes:
+        hits (int): Requests sent with conditional headers.
+        misses (int): Requests sent without any stored validators.
+        not_modified (int): Responses answered with `304 Not Modified`.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+    def merge(self, other: 'CacheStats') -> None:
+        """
+        Adds the counters of another run, e.g. of a worker process.
+
+        Args:
+            other (CacheStats): The counters to add.
+        """
+        self.hits += other.hits
+        self.misses += other.misses
+        self.not_modified += other.not_modified
+
+
+class SQLiteStore:
+    """
+    Base class for the small SQLite-backed stores kept next to the crawled pages.
+
+    Subclasses declare their tables in `schema`; writes are buffered and committed
+    every `commit_interval` statements and when the store is closed.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+        schema (tuple[str]): The `CREATE TABLE` statements of the store.
+    """
+
+    schema: tuple[str] = ()
+
+    def __init__(self, path: str, commit_interval: int = 100) -> None:
+        """
+        Args:
+            path (str): The path of the SQLite database file.
+            commit_interval (int, optional): Number of writes buffered before a
+                                             commit. Defaults to 100.
+        """
+        self.path: str = path
+        self._commit_interval: int = commit_interval
+        self._pending_writes: int = 0
+        self._connection: sqlite3.Connection | None = None
+
+    def open(self) -> Self:
+        """
+        Opens the database, creating it when it does not exist yet.
+
+        Returns:
+            Self: The opened store.
+        """
+        if directory := dirname(self.path):
+            makedirs(directory, exist_ok=True)
+
+        # Writes may run in a worker thread, never two at a time, to keep the event
+        # loop free.
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+
+        for statement in self.schema:
+            self._connection.execute(statement)
+
+        return self
+
+    def close(self) -> None:
+        """Commits pending writes and closes the database."""
+        if self._connection is None:
+            return None
+
+        self._connection.commit()
+        self._connection.close()
+        self._connection = None
+
+    def __enter__(self) -> Self:
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _execute(self, query: str, parameters: tuple) -> None:
+        """
+        Executes a write statement, committing every `commit_interval` writes.
+
+        Args:
+            query (str): The SQL statement.
+            parameters (tuple): The statement parameters.
+        """
+        self._connection.execute(query, parameters)
+        self._pending_writes += 1
+
+        if self._pending_writes >= self._commit_interval:
+            self._connection.commit()
+            self._pending_writes = 0
+
+    def _begin(self) -> None:
+        """
+        Takes the write lock of the database, unless a transaction is already open,
+        so the reads that follow see the latest commits of every process and no
+        other connection writes before the next commit.
+        """
+        if not self._connection.in_transaction:
+            self._connection.execute('BEGIN IMMEDIATE')
+
+    def _release(self) -> None:
+        """Gives up the write lock when the transaction holds no buffered write."""
+        if not self._pending_writes:
+            self._connection.commit()
+
+
+class ValidatorCache(SQLiteStore):
+    """
+    A persistent SQLite cache of HTTP validators, keyed by URL.
+
+    It is used to turn full downloads into conditional GET requests
+    (`If-None-Match` / `If-Modified-Since`), so unchanged pages are answered
+    with `304 Not Modified` and no body transfer.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+        stats (CacheStats): The hit/miss/304 counters of the current run.
+    """
+
+    schema: tuple[str] = (
+        'CREATE TABLE IF NOT EXISTS validators ('
+        'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+        'content_hash TEXT, fetched_at REAL NOT NULL)',
+    )
+
+    def __init__(self, path: str, commit_interval: int = 100) -> None:
+        """
+        Args:
+            path (str): The path of the SQLite database file.
+            commit_interval (int, optional): Number of writes buffered before a
+                                             commit. Defaults to 100.
+        """
+        super().__init__(path=path, commit_interval=commit_interval)
+        self.stats: CacheStats = CacheStats()
+
+    def get(self, url: str) -> Validators | None:
+        """
+        Retrieves the validators stored for a URL.
+
+        Args:
+            url (str): The absolute URL of the page.
+
+        Returns:
+            Validators | None: The stored validators, or None if the URL is unknown.
+        """
+        row: tuple | None = self._connection.execute(
+            'SELECT etag, last_modified, content_hash, fetched_at '
+            'FROM validators WHERE url = ?',
+            (url,),
+        ).fetchone()
+
+        return Validators(*row) if row else None
+
+    def get_conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Builds the conditional request headers for a URL and updates the hit/miss
+        counters.
+
+        Args:
+            url (str): The absolute URL of the page.
+
+        Returns:
+            dict[str, str]: `If-None-Match` and/or `If-Modified-Since` headers,
+                            empty if nothing is stored for the URL.
+        """
+        headers: dict[str, str] = {}
+
+        if (validators := self.get(url)) is not None:
+            if validators.etag:
+                headers['If-None-Match'] = validators.etag
+
+            if validators.last_modified:
+                headers['If-Modified-Since'] = validators.last_modified
+
+        if headers:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+
+        return headers
+
+    def put(self, url: str, response: Response, content_hash: str | None) -> None:
+        """
+        Stores the validators of a successful response.
+
+        Args:
+            url (str): The absolute URL of the page.
+            response (Response): The response carrying the `ETag`/`Last-Modified`
+                headers.
+            content_hash (str | None): The hash of the stored response body.
+        """
+        self._execute(
+            'INSERT OR REPLACE INTO validators VALUES (?, ?, ?, ?, ?)',
+            (
+                url,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                content_hash,
+                time(),
+            ),
+        )
+
+    def mark_not_modified(self, url: str, response: Response) -> None:
+        """
+        Records a `304 Not Modified` answer, refreshing the fetch time and any
+        validator the server sent along with it.
+
+        Args:
+            url (str): The absolute URL of the page.
+            response (Response): The `304` response.
+        """
+        self.stats.not_modified += 1
+
+        self._execute(
+            'UPDATE validators SET '
+            'etag = COALESCE(?, etag), '
+            'last_modified = COALESCE(?, last_modified), '
+            'fetched_at = ? WHERE url = ?',
+            (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                time(),
+                url,
+            ),
+        )
+
+    def discard(self, url: str) -> None:
+        """
+        Removes the validators of a URL, e.g. when its stored page no longer exists.
+
+        Args:
+            url (str): The absolute URL of the page.
+        """
+        self._execute('DELETE FROM validators WHERE url = ?', (url,))
+
+
+class UserAgentCache(SQLiteStore):
+    """
+    A persistent cache of parsed user agents, keyed by user agent string.
+
+    Parsing runs the whole `ua_parser` regex suite, so each string is only
+    parsed once and its browser, major version and OS are stored for later runs.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+    """
+
+    schema: tuple[str] = (
+        'CREATE TABLE IF NOT EXISTS user_agents ('
+        'agent TEXT PRIMARY KEY, browser TEXT, browser_version INTEGER, os TEXT)',
+    )
+
+    def get_many(
+        self, agents: Iterable[str]
+    ) -> dict[str, tuple[str, int | None, str]]:
+        """
+        Retrieves the parsed attributes of several user agents.
+
+        Args:
+            agents (Iterable[str]): The user agent strings.
+
+        Returns:
+            dict[str, tuple[str, int | None, str]]: The browser, major version and OS
+                of every cached user agent, keyed by user agent string.
+        """
+        wanted: set[str] = set(agents)
+
+        return {
+            agent: tuple(attributes)
+            for agent, *attributes in self._connection.execute(
+                'SELECT agent, browser, browser_version, os FROM user_agents'
+            )
+            if agent in wanted
+        }
+
+    def put(
+        self, agent: str, browser: str, browser_version: int | None, os: str
+    ) -> None:
+        """
+        Stores the parsed attributes of a user agent.
+
+        Args:
+            agent (str): The user agent string.
+            browser (str): The browser family.
+            browser_version (int | None): The major version of the browser.
+            os (str): The operating system family.
+        """
+        self._execute(
+            'INSERT OR REPLACE INTO user_agents VALUES (?, ?, ?, ?)',
+            (agent, browser, browser_version, os),
+        )
@@ -0,0 +1,179 @@
+# Native Libraries
+import json
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from typing import Any, Callable
+
+# Local Modules
+from src.core.limiter import GlobalRateLimiter
+from src.core.settings import default_settings
+from src.core.work import SQLiteWorkQueue
+
+# The methods of the work queue the crawling processes may call.
+WORK_QUEUE_OPERATIONS: frozenset[str] = frozenset({
+    'add',
+    'reset',
+    'claim',
+    'renew',
+    'complete',
+    'release',
+    'get_counts',
+    'is_finished',
+})
+
+
+class CoordinatorHandler(BaseHTTPRequestHandler):
+    """
+    Answers the calls of the crawling processes, each a POST of its JSON
+    arguments to `/work/<operation>` or `/rate/reserve`, with the JSON result.
+    """
+
+    protocol_version: str = 'HTTP/1.1'
+    server: 'Coordinator'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        length: int = int(self.headers.get('Content-Length', 0))
+        operation: Callable[..., Any] | None = self.server.get_operation(
+            self.path.strip('/')
+        )
+
+        if operation is None:
+            return self._send(404, {'error': f'unknown operation: {self.path}'})
+
+        try:
+            result: Any = operation(**json.loads(self.rfile.read(length) or b'{}'))
+
+        except (TypeError, ValueError) as error:
+            return self._send(400, {'error': str(error)})
+
+        self._send(200, {'result': result})
+
+    def _send(self, status: int, content: dict[str, Any]) -> None:
+        body: bytes = json.dumps(content).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class Coordinator(ThreadingHTTPServer):
+    """
+    A threaded HTTP server sharing a work queue and a global rate limit between
+    the processes of several machines crawling together.
+
+    The processes reach the queue through an `HTTPWorkQueue` and the rate limit
+    through a `CoordinatedRateLimiter`. The queue is a `SQLiteWorkQueue` of the
+    machine of the coordinator, used by one thread at a time, and the rate limit
+    follows the `RATE_LIMIT` settings of the coordinator, one bucket for all
+    requests or one per host.
+
+    Attributes:
+        work_queue (SQLiteWorkQueue): The work queue of the crawl.
+    """
+
+    daemon_threads: bool = True
+    request_queue_size: int = 1024
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        path: str | None = None,
+        lease_duration: float | None = None,
+    ) -> None:
+        """
+        Args:
+            host (str, optional): The address to listen on, e.g. '0.0.0.0' for every
+                                  interface. Defaults to '127.0.0.1'.
+            port (int, optional): The port to listen on, 0 for a free one. Defaults
+                to 0.
+            path (str | None, optional): The path of the SQLite database of the work
+                                         queue. Defaults to the `WORK_QUEUE_PATH`
+                                         setting.
+            lease_duration (float | None, optional): The seconds a claimed path stays
+                                                     leased without renewal. Defaults
+                                                     to the `LEASE_DURATION` setting.
+        """
+        super().__init__((host, port), CoordinatorHandler)
+        self.work_queue: SQLiteWorkQueue = SQLiteWorkQueue(
+            path=path, lease_duration=lease_duration
+        ).__enter__()
+        self._limiter: GlobalRateLimiter = GlobalRateLimiter(
+            settings=default_settings
+        )
+        self._work_lock: Lock = Lock()
+        self._rate_lock: Lock = Lock()
+
+    def get_url(self) -> str:
+        """
+        Returns:
+            str: The root URL of the server, e.g. 'http://127.0.0.1:8765'.
+        """
+        return f'http://{self.server_address[0]}:{self.server_address[1]}'
+
+    def get_operation(self, name: str) -> Callable[..., Any] | None:
+        """
+        Args:
+            name (str): The name of the operation, e.g. 'work/claim'.
+
+        Returns:
+            Callable[..., Any] | None: The operation, called with the arguments of
+                the request, or None if it is unknown.
+        """
+        if name == 'rate/reserve':
+            return self._reserve
+
+        if name == 'work/lease_duration':
+            return lambda: self.work_queue.lease_duration
+
+        if (method := name.removeprefix('work/')) not in WORK_QUEUE_OPERATIONS:
+            return None
+
+        def call(**arguments) -> Any:
+            with self._work_lock:
+                return getattr(self.work_queue, method)(**arguments)
+
+        return call
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.work_queue.__exit__(None, None, None)
+
+    def _reserve(self, host: str) -> float:
+        """
+        Reserves the next free slot of the bucket of a host.
+
+        Args:
+            host (str): The host of the request.
+
+        Returns:
+            float: The seconds the process waits before sending the request.
+        """
+        with self._rate_lock:
+            return self._limiter.get_bucket(host).reserve()
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description='Shares a work queue and a rate limit between crawling machines.'
+    )
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--path', default=None)
+    arguments = parser.parse_args()
+
+    coordinator: Coordinator = Coordinator(
+        arguments.host, arguments.port, arguments.path
+    )
+    print(f'Coordinating crawls at {coordinator.get_url()}')
+    coordinator.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
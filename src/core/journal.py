@@ -0,0 +1,151 @@
+# Native Libraries
+from os import fsync, makedirs, replace
+from os.path import dirname, exists
+from time import monotonic
+from typing import Self, TextIO
+
+# Third-Party Libraries
+from trio import to_thread
+
+PENDING: str = 'pending'
+DONE: str = 'done'
+FAILED: str = 'failed'
+
+
+class CrawlJournal:
+    """
+    An append-only journal of the state of every path of a crawl.
+
+    Each line holds a status (`pending`, `done` or `failed`) and a path,
+    separated by a tab; the last line of a path wins. Writes are buffered and
+    synced to disk at most every `sync_interval` seconds, so appending stays
+    cheap at hundreds of responses per second while a crash loses at most the
+    last interval. The periodic syncs run in a worker thread, so a slow disk
+    never blocks the event loop of the crawl.
+
+    A journal can be shared by several processes crawling together: each of
+    them then appends whole lines, and the journal is truncated or compacted
+    beforehand by the process starting them, never by the processes themselves.
+
+    Attributes:
+        path (str): The path of the journal file.
+        completed (set[str]): The paths already completed in a previous run.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        resume: bool = False,
+        sync_interval: float = 1.0,
+        shared: bool = False,
+    ) -> None:
+        """
+        Args:
+            path (str): The path of the journal file.
+            resume (bool, optional): Whether to keep the journal of the previous run
+                                     and skip its completed paths. Defaults to False.
+            sync_interval (float, optional): Maximum number of seconds between two
+                                             syncs to disk. Defaults to 1.0.
+            shared (bool, optional): Whether other processes append to the journal at
+                                     the same time. Defaults to False.
+        """
+        self.path: str = path
+        self.completed: set[str] = set()
+        self._resume: bool = resume
+        self._shared: bool = shared
+        self._sync_interval: float = sync_interval
+        self._last_sync: float = monotonic()
+        self._file: TextIO | None = None
+
+    def __enter__(self) -> Self:
+        if directory := dirname(self.path):
+            makedirs(directory, exist_ok=True)
+
+        if self._resume and exists(self.path):
+            statuses: dict[str, str] = self._load()
+
+            if not self._shared:
+                self._compact(statuses)
+
+        # Shared journals are written line by line, so the lines of the processes
+        # never interleave.
+        self._file = open(
+            self.path,
+            'a' if self._resume or self._shared else 'w',
+            buffering=1 if self._shared else -1,
+            encoding='utf-8',
+        )
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._sync()
+        self._file.close()
+        self._file = None
+
+    async def record(self, status: str, path: str) -> None:
+        """
+        Appends the new status of a path.
+
+        Args:
+            status (str): One of `pending`, `done` or `failed`.
+            path (str): The path of the request.
+        """
+        self._file.write(f'{status}\t{path}\n')
+
+        if monotonic() - self._last_sync >= self._sync_interval:
+            # Set first, so the records made while the disk syncs do not sync again.
+            self._last_sync = monotonic()
+            self._file.flush()
+            await to_thread.run_sync(fsync, self._file.fileno())
+
+    def _load(self) -> dict[str, str]:
+        """
+        Reads the last status of every path, filling `completed`.
+
+        Returns:
+            dict[str, str]: The last status of every path.
+        """
+        statuses: dict[str, str] = {}
+
+        with open(self.path, encoding='utf-8') as file:
+            for line in file:
+                # Skips a torn last line, left behind by a crash in the middle of a
+                # write.
+                if not line.endswith('\n'):
+                    continue
+
+                status, _, path = line.removesuffix('\n').partition('\t')
+
+                if path and status in {PENDING, DONE, FAILED}:
+                    statuses[path] = status
+
+        self.completed = {
+            path for path, status in statuses.items() if status == DONE
+        }
+
+        return statuses
+
+    def _compact(self, statuses: dict[str, str]) -> None:
+        """
+        Rewrites the journal with a single line per path.
+
+        Args:
+            statuses (dict[str, str]): The last status of every path.
+        """
+        temp_path: str = f'{self.path}.tmp'
+
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.writelines(
+                f'{status}\t{path}\n' for path, status in statuses.items()
+            )
+            file.flush()
+            fsync(file.fileno())
+
+        replace(temp_path, self.path)
+
+    def _sync(self) -> None:
+        """Flushes the buffered lines and syncs them to disk."""
+        self._file.flush()
+        fsync(self._file.fileno())
+        self._last_sync = monotonic()
@@ -0,0 +1,642 @@
+# Native Libraries
+import multiprocessing
+import zlib
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from math import inf, isnan, nan
+from multiprocessing.synchronize import Lock
+from time import monotonic
+from typing import Any, Sequence
+
+# Third-Party Libraries
+from httpx import AsyncClient, Response, codes
+from trio import current_time, sleep
+
+# Local Modules
+from src.core.settings import ClientSettings
+
+THROTTLING_STATUS_CODES: frozenset[int] = frozenset({
+    codes.TOO_MANY_REQUESTS,
+    codes.SERVICE_UNAVAILABLE,
+})
+
+# Consecutive 429s taken as pushback from the origin, without a `Retry-After` header.
+REJECTION_THRESHOLD: int = 3
+# Seconds over which the actual request rate is measured.
+OBSERVATION_WINDOW: float = 5.0
+
+SHARED_BUCKET_SLOTS: int = 64
+SHARED_BUCKET_SIZE: int = 8
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a `Retry-After` header into a delay in seconds.
+
+    Args:
+        value (str | None): The header value, either a number of seconds or an HTTP
+            date.
+
+    Returns:
+        float | None: The delay in seconds, or None if the header is missing or
+            invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """
+    An async token bucket implemented with the generic cell rate algorithm (GCRA).
+
+    Every acquisition reserves the next free slot synchronously, so concurrent
+    tasks are spread evenly over time instead of firing together in bursts.
+
+    With `adaptive` enabled, pushback from the origin halves the rate (bounded
+    by `min_rate`), starting from the rate actually measured over a sliding
+    window, and successful responses restore it multiplicatively up to the
+    configured ceiling. An unlimited bucket only slows down on real pushback,
+    a `Retry-After` header or repeated 429s, not on isolated 5xx responses,
+    and becomes unlimited again once its recovered rate no longer binds.
+
+    Attributes:
+        rate (float | None): The current rate in requests per second, None when
+            unlimited.
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        burst: int = 1,
+        adaptive: bool = True,
+        min_rate: float = 0.5,
+        recovery: float = 0.05,
+    ) -> None:
+        """
+        Args:
+            rate (float | None): Maximum rate in requests per second, None for no
+                limit.
+            burst (int, optional): Number of requests allowed back to back. Defaults
+                to 1.
+            adaptive (bool, optional): Whether to adapt the rate to throttling
+                                       responses. Defaults to True.
+            min_rate (float, optional): Lower bound of the adapted rate. Defaults to
+                0.5.
+            recovery (float, optional): Relative rate increase applied after each
+                                        successful response. Defaults to 0.05.
+        """
+        self._ceiling: float = rate or inf
+        self._burst: int = max(burst, 1)
+        self._adaptive: bool = adaptive
+        self._min_rate: float = min_rate
+        self._recovery: float = recovery
+        self._lock: AbstractContextManager = nullcontext()
+
+        self._reset(rate)
+
+    async def acquire(self) -> None:
+        """Waits until the next request is allowed to be sent."""
+        if (delay := self.reserve()) > 0:
+            await sleep(delay)
+
+    def reserve(self) -> float:
+        """
+        Reserves the next free slot of the bucket, for a request sent once it
+        comes.
+
+        Returns:
+            float: The seconds to wait before sending the request.
+        """
+        now: float = self._get_time()
+
+        with self._lock:
+            return self._reserve(now) - now
+
+    def update(self, response: Response) -> None:
+        """
+        Adapts the bucket to a response received from the origin.
+
+        Args:
+            response (Response): The received response.
+        """
+        if response.status_code in THROTTLING_STATUS_CODES:
+            self.penalize(
+                parse_retry_after(response.headers.get('Retry-After')),
+                rejected=response.status_code == codes.TOO_MANY_REQUESTS,
+            )
+
+        elif response.is_success or response.is_redirect:
+            self.reward()
+
+    def penalize(
+        self, retry_after: float | None = None, rejected: bool = False
+    ) -> None:
+        """
+        Slows the bucket down after a throttling response.
+
+        Args:
+            retry_after (float | None, optional): Seconds to pause every request for,
+                                                  as requested by the origin.
+            rejected (bool, optional): Whether the response was a `429 Too Many
+                                       Requests`. Defaults to False.
+        """
+        now: float = self._get_time()
+
+        with self._lock:
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            if rejected:
+                self._rejections += 1
+
+            # In-flight requests tend to be throttled together, so they count as one
+            # signal.
+            if not self._adaptive or now - self._last_decrease < 1.0:
+                return None
+
+            if (
+                self.rate is None
+                and retry_after is None
+                and self._rejections < REJECTION_THRESHOLD
+            ):
+                return None
+
+            measured_rate: float | None = self._get_observed_rate(now)
+            rates: list[float] = [
+                rate for rate in (self.rate, measured_rate) if rate is not None
+            ]
+
+            # Without any measurement yet, the pause alone slows the bucket down.
+            if not rates:
+                return None
+
+            self.rate = max(min(rates) / 2, self._min_rate)
+            self._last_decrease = now
+
+    def reward(self) -> None:
+        """Speeds the bucket back up towards its ceiling after a success."""
+        if not self._adaptive:
+            return None
+
+        with self._lock:
+            self._rejections = 0
+
+            if self.rate is None:
+                return None
+
+            rate: float = self.rate * (1 + self._recovery)
+
+            if self._ceiling < inf:
+                self.rate = min(rate, self._ceiling)
+                return None
+
+            # An unlimited bucket is lifted once its rate is well above the one it
+            # sends at.
+            measured_rate: float | None = self._get_observed_rate(self._get_time())
+            self.rate = None if measured_rate and rate > 2 * measured_rate else rate
+
+    def _reset(self, rate: float | None) -> None:
+        """
+        Args:
+            rate (float | None): The initial rate in requests per second, None when
+                unlimited.
+        """
+        self.rate: float | None = rate
+        self._theoretical_arrival: float = 0.0
+        self._paused_until: float = 0.0
+        self._last_decrease: float = -inf
+
+        self._rejections: int = 0
+
+        self._window_start: float = self._get_time()
+        self._window_count: int = 0
+        self._previous_count: int | None = None
+
+    def _get_time(self) -> float:  # noqa: PLR6301
+        """
+        Returns:
+            float: The current time of the clock of the bucket.
+        """
+        return current_time()
+
+    def _reserve(self, now: float) -> float:
+        """
+        Reserves the next free slot of the bucket.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            float: The time at which the request is allowed to be sent.
+        """
+        self._observe(now)
+
+        start: float = max(now, self._paused_until)
+
+        if self.rate is None:
+            return start
+
+        interval: float = 1 / self.rate
+        arrival: float = max(self._theoretical_arrival, start)
+        self._theoretical_arrival = arrival + interval
+
+        return max(arrival - (self._burst - 1) * interval, start)
+
+    def _observe(self, now: float) -> None:
+        """
+        Counts a request in the current window of the measured rate.
+
+        Args:
+            now (float): The current time.
+        """
+        self._roll_window(now)
+        self._window_count += 1
+
+    def _get_observed_rate(self, now: float) -> float | None:
+        """
+        Measures the actual request rate over the last `OBSERVATION_WINDOW` seconds,
+        weighting the count of the previous window by its overlap with them.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            float | None: The requests per second, or None before any request.
+        """
+        self._roll_window(now)
+        elapsed: float = now - self._window_start
+
+        if self._previous_count is None:
+            return (
+                self._window_count / elapsed
+                if self._window_count and elapsed > 0
+                else None
+            )
+
+        overlap: float = (OBSERVATION_WINDOW - elapsed) / OBSERVATION_WINDOW
+
+        return (
+            self._previous_count * overlap + self._window_count
+        ) / OBSERVATION_WINDOW
+
+    def _roll_window(self, now: float) -> None:
+        """
+        Starts a new window once the current one is over.
+
+        Args:
+            now (float): The current time.
+        """
+        if (elapsed := now - self._window_start) < OBSERVATION_WINDOW:
+            return None
+
+        # After a whole window without requests, the previous one is empty.
+        if elapsed < 2 * OBSERVATION_WINDOW:
+            self._previous_count = self._window_count
+            self._window_start += OBSERVATION_WINDOW
+        else:
+            self._previous_count = 0
+            self._window_start = now
+
+        self._window_count = 0
+
+
+class MonotonicTokenBucket(TokenBucket):
+    """
+    A token bucket timed with the monotonic clock of the system rather than with
+    the clock of an event loop, so it can be used outside of one.
+    """
+
+    def _get_time(self) -> float:  # noqa: PLR6301
+        """
+        Returns:
+            float: The monotonic time of the system.
+        """
+        return monotonic()
+
+
+class SharedField:
+    """An attribute of a `SharedTokenBucket`, kept in the shared memory of a slot."""
+
+    def __init__(self, index: int) -> None:
+        """
+        Args:
+            index (int): The position of the attribute in the state of a bucket.
+        """
+        self._index: int = index
+
+    def __get__(
+        self, bucket: 'SharedTokenBucket | None', owner: type | None = None
+    ) -> Any:
+        if bucket is None:
+            return self
+
+        value: float = bucket._values[bucket._offset + self._index]
+
+        return None if isnan(value) else value
+
+    def __set__(self, bucket: 'SharedTokenBucket', value: float | None) -> None:
+        bucket._values[bucket._offset + self._index] = (
+            nan if value is None else value
+        )
+
+
+class SharedTokenBucket(MonotonicTokenBucket):
+    """
+    A token bucket whose state lives in shared memory, so the buckets of several
+    processes bound to the same slot behave as a single one.
+
+    The state is read and updated under a lock shared by the processes, and
+    timed with the monotonic clock of the system, which they all share, rather
+    than with the clock of their own event loop.
+    """
+
+    rate: SharedField = SharedField(0)
+    _theoretical_arrival: SharedField = SharedField(1)
+    _paused_until: SharedField = SharedField(2)
+    _last_decrease: SharedField = SharedField(3)
+    _window_start: SharedField = SharedField(4)
+    _window_count: SharedField = SharedField(5)
+    _previous_count: SharedField = SharedField(6)
+    _rejections: SharedField = SharedField(7)
+
+    def __init__(
+        self,
+        values: Sequence[float],
+        lock: Lock,
+        slot: int,
+        reset: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Args:
+            values (Sequence[float]): The shared memory holding the state of every
+                slot.
+            lock (Lock): The lock guarding the shared memory.
+            slot (int): The slot of the bucket.
+            reset (bool, optional): Whether to initialize the state of the slot,
+                                    which is done once, before the processes start.
+                                    Defaults to False.
+            **kwargs: The configuration of the bucket, as taken by `TokenBucket`.
+        """
+        self._values: Sequence[float] = values
+        self._offset: int = slot * SHARED_BUCKET_SIZE
+        self._resets: bool = reset
+
+        super().__init__(**kwargs)
+        self._lock = lock
+
+    def _reset(self, rate: float | None) -> None:
+        """
+        Args:
+            rate (float | None): The initial rate in requests per second, None when
+                unlimited.
+        """
+        if self._resets:
+            super()._reset(rate)
+
+
+class RateLimiter:
+    """
+    A rate limiter shared by every task of a client, with one bucket for all
+    requests or one bucket per host.
+    """
+
+    def __init__(self, settings: ClientSettings) -> None:
+        """
+        Args:
+            settings (ClientSettings): The settings holding the rate limit
+                configuration.
+        """
+        self._settings: ClientSettings = settings
+        self._buckets: dict[str | None, TokenBucket] = {}
+
+    def get_bucket(self, host: str) -> TokenBucket:
+        """
+        Retrieves the bucket responsible for a host, creating it on first use.
+
+        Args:
+            host (str): The host of the request.
+
+        Returns:
+            TokenBucket: The bucket of the host, or the shared one.
+        """
+        key: str | int | None = self._get_key(host)
+
+        if (bucket := self._buckets.get(key)) is None:
+            bucket = self._buckets[key] = self._create_bucket(key)
+
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        """
+        Waits until a request to the host is allowed to be sent.
+
+        Args:
+            host (str): The host of the request.
+        """
+        await self.get_bucket(host).acquire()
+
+    def update(self, response: Response) -> None:
+        """
+        Feeds a response back into the bucket of its host.
+
+        Args:
+            response (Response): The received response.
+        """
+        self.get_bucket(response.request.url.host).update(response)
+
+    async def aclose(self) -> None:
+        """Releases the resources of the limiter, once its client is closed."""
+
+    def _get_key(self, host: str) -> str | int | None:
+        """
+        Args:
+            host (str): The host of the request.
+
+        Returns:
+            str | int | None: The key of the bucket of the host, None for the shared
+                one.
+        """
+        return host if self._settings.rate_limit_per_host else None
+
+    def _create_bucket(self, key: str | int | None) -> TokenBucket:
+        """
+        Args:
+            key (str | int | None): The key of the bucket.
+
+        Returns:
+            TokenBucket: A new bucket, configured by the settings.
+        """
+        return TokenBucket(**self._get_bucket_options())
+
+    def _get_bucket_options(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: The configuration of the buckets, taken from the
+                settings.
+        """
+        return {
+            'rate': self._settings.rate_limit,
+            'burst': self._settings.rate_limit_burst,
+            'adaptive': self._settings.adaptive_rate_limit,
+            'min_rate': self._settings.min_rate_limit,
+            'recovery': self._settings.rate_limit_recovery,
+        }
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    A rate limiter shared by several processes, so their requests add up to
+    the configured rate rather than to a multiple of it.
+
+    It is created before the processes are started and handed to each of them,
+    its buckets living in shared memory. Hosts are hashed into a fixed number
+    of slots, and hosts sharing a slot share a bucket, which is only stricter.
+    """
+
+    def __init__(
+        self, settings: ClientSettings, slots: int = SHARED_BUCKET_SLOTS
+    ) -> None:
+        """
+        Args:
+            settings (ClientSettings): The settings holding the rate limit
+                configuration.
+            slots (int, optional): The number of buckets when limiting per host.
+                                   Defaults to `SHARED_BUCKET_SLOTS`.
+        """
+        super().__init__(settings=settings)
+        context: multiprocessing.context.SpawnContext = multiprocessing.get_context(
+            'spawn'
+        )
+
+        self._slots: int = slots if settings.rate_limit_per_host else 1
+        self._values: Sequence[float] = context.RawArray(
+            'd', self._slots * SHARED_BUCKET_SIZE
+        )
+        self._lock: Lock = context.Lock()
+
+        for slot in range(self._slots):
+            self._create_bucket(slot, reset=True)
+
+    def _get_key(self, host: str) -> int:
+        """
+        Args:
+            host (str): The host of the request.
+
+        Returns:
+            int: The slot of the host, the same in every process.
+        """
+        return zlib.crc32(host.encode()) % self._slots
+
+    def _create_bucket(self, key: int, reset: bool = False) -> SharedTokenBucket:
+        """
+        Args:
+            key (int): The slot of the bucket.
+            reset (bool, optional): Whether to initialize the state of the slot.
+                                    Defaults to False.
+
+        Returns:
+            SharedTokenBucket: A view of the bucket of the slot.
+        """
+        return SharedTokenBucket(
+            self._values, self._lock, key, reset=reset, **self._get_bucket_options()
+        )
+
+
+class GlobalRateLimiter(RateLimiter):
+    """
+    The rate limiter of a `Coordinator`, reserving slots for the processes of
+    every machine crawling together, so their requests add up to the configured
+    rate.
+
+    Its buckets are timed with the monotonic clock, as they are used by the
+    threads of the coordinator rather than by an event loop, and do not adapt,
+    as the pushback of the origin is handled by the buckets of each process.
+    """
+
+    def _create_bucket(self, key: str | int | None) -> MonotonicTokenBucket:
+        """
+        Args:
+            key (str | int | None): The key of the bucket.
+
+        Returns:
+            MonotonicTokenBucket: A new bucket, configured by the settings.
+        """
+        return MonotonicTokenBucket(
+            **self._get_bucket_options() | {'adaptive': False}
+        )
+
+
+class CoordinatedRateLimiter(RateLimiter):
+    """
+    A rate limiter whose requests also wait for a slot of the global rate limit of
+    a `Coordinator`, shared by the processes of every machine crawling together.
+
+    The buckets of the process still adapt to the pushback of the origin, while
+    the coordinator caps the aggregate rate at its own `RATE_LIMIT`.
+    """
+
+    def __init__(self, settings: ClientSettings, url: str | None = None) -> None:
+        """
+        Args:
+            settings (ClientSettings): The settings holding the rate limit
+                configuration.
+            url (str | None, optional): The root URL of the coordinator. Defaults to
+                                        the `RATE_LIMIT_URL` setting.
+        """
+        super().__init__(settings=settings)
+        self._client: AsyncClient = AsyncClient(
+            base_url=url or settings.rate_limit_url
+        )
+
+    async def acquire(self, host: str) -> None:
+        """
+        Waits until a request to the host is allowed to be sent, by this process
+        and by the coordinator.
+
+        Args:
+            host (str): The host of the request.
+        """
+        await super().acquire(host)
+
+        response: Response = await self._client.post(
+            '/rate/reserve', json={'host': host}
+        )
+        response.raise_for_status()
+
+        if (delay := response.json()['result']) > 0:
+            await sleep(delay)
+
+    async def aclose(self) -> None:
+        """Closes the connections to the coordinator."""
+        await self._client.aclose()
+
+
+def get_rate_limiter(settings: ClientSettings) -> RateLimiter:
+    """
+    Args:
+        settings (ClientSettings): The settings holding the rate limit configuration.
+
+    Returns:
+        RateLimiter: A limiter drawing from the coordinator at `RATE_LIMIT_URL` if
+            set, or a limiter of its own otherwise.
+    """
+    if settings.rate_limit_url is None:
+        return RateLimiter(settings=settings)
+
+    return CoordinatedRateLimiter(settings=settings)
@@ -0,0 +1,332 @@
+# Native Libraries
+from bisect import bisect_left
+from collections import Counter
+from math import inf
+from os import makedirs, replace
+from os.path import dirname
+from time import monotonic
+
+LATENCY_BUCKETS: tuple[float] = tuple(0.001 * 2**exponent for exponent in range(17))
+
+METRIC_PREFIX: str = 'manga_scraper'
+
+
+class Histogram:
+    """
+    A cumulative histogram with fixed bucket bounds, as exposed by Prometheus.
+
+    Observing a value is a binary search plus an increment, so it stays cheap
+    at any request rate; quantiles are estimated by interpolating inside the
+    bucket holding the wanted rank.
+
+    Attributes:
+        bounds (tuple[float]): The upper bound of every bucket, in ascending order.
+        counts (list[int]): The number of observations of every bucket, plus one for
+            `+Inf`.
+        total (float): The sum of every observation.
+        count (int): The number of observations.
+    """
+
+    def __init__(self, bounds: tuple[float] = LATENCY_BUCKETS) -> None:
+        """
+        Args:
+            bounds (tuple[float], optional): The upper bounds of the buckets.
+                                             Defaults to powers of two from 1 ms to
+                                             about 65 s.
+        """
+        self.bounds: tuple[float] = bounds
+        self.counts: list[int] = [0] * (len(bounds) + 1)
+        self.total: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: 'Histogram') -> None:
+        """
+        Adds the observations of another histogram with the same bounds.
+
+        Args:
+            other (Histogram): The histogram to add.
+        """
+        self.counts = [
+            count + other_count
+            for count, other_count in zip(self.counts, other.counts)
+        ]
+        self.total += other.total
+        self.count += other.count
+
+    def get_quantile(self, quantile: float) -> float:
+        """
+        Args:
+            quantile (float): The wanted quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated value of the quantile, 0.0 without observations.
+        """
+        if not self.count:
+            return 0.0
+
+        rank: float = quantile * self.count
+        cumulative: int = 0
+
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower: float = self.bounds[index - 1] if index else 0.0
+                upper: float = (
+                    self.bounds[index] if index < len(self.bounds) else lower
+                )
+
+                return lower + (upper - lower) * (rank - cumulative) / count
+
+            cumulative += count
+
+        return self.bounds[-1]
+
+    def get_mean(self) -> float:
+        """
+        Returns:
+            float: The mean of the observations, 0.0 without observations.
+        """
+        return self.total / self.count if self.count else 0.0
+
+
+class CrawlMetrics:
+    """
+    The counters and histograms of a single crawl.
+
+    They are updated in place by the client and the request strategy, with no
+    locking nor formatting on the hot path; a summary is only built when the
+    progress is reported, at the end of the run, or when exporting them in the
+    Prometheus text format.
+
+    Attributes:
+        started_at (float): The monotonic time at which the crawl started.
+        requests (int): Requests sent, retries included.
+        in_flight (int): Requests sent and not answered yet.
+        statuses (Counter[int]): Responses received, by status code.
+        errors (Counter[str]): Requests that failed without a response, by exception
+            name.
+        bytes_received (int): Bytes of the response bodies, as transferred over the
+            wire.
+        latency (Histogram): Seconds between sending a request and receiving its
+            headers.
+        limiter_wait (Histogram): Seconds spent waiting for the rate limiter.
+        retries (int): Attempts scheduled again after a transient failure.
+        failed (int): Paths given up on and recorded as dead letters.
+        pages (int): Paths completed successfully.
+        unchanged (int): Downloaded pages skipped because their hash did not change.
+        not_modified (int): Pages answered with `304 Not Modified`.
+    """
+
+    def __init__(self) -> None:
+        self.started_at: float = monotonic()
+        self.requests: int = 0
+        self.in_flight: int = 0
+        self.statuses: Counter[int] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.bytes_received: int = 0
+        self.latency: Histogram = Histogram()
+        self.limiter_wait: Histogram = Histogram()
+        self.retries: int = 0
+        self.failed: int = 0
+        self.pages: int = 0
+        self.unchanged: int = 0
+        self.not_modified: int = 0
+
+    def merge(self, other: 'CrawlMetrics') -> None:
+        """
+        Adds the counters and histograms of another crawl, e.g. of a worker process.
+
+        Args:
+            other (CrawlMetrics): The metrics to add.
+        """
+        for name in (
+            'requests',
+            'in_flight',
+            'bytes_received',
+            'retries',
+            'failed',
+            'pages',
+            'unchanged',
+            'not_modified',
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+        self.statuses.update(other.statuses)
+        self.errors.update(other.errors)
+        self.latency.merge(other.latency)
+        self.limiter_wait.merge(other.limiter_wait)
+
+    def get_elapsed(self) -> float:
+        """
+        Returns:
+            float: The seconds elapsed since the crawl started.
+        """
+        return monotonic() - self.started_at
+
+    def get_pages_per_second(self) -> float:
+        """
+        Returns:
+            float: The paths completed per second since the crawl started.
+        """
+        return self.pages / elapsed if (elapsed := self.get_elapsed()) > 0 else 0.0
+
+    def get_progress(self) -> str:
+        """
+        Returns:
+            str: A one-line report of the crawl so far.
+        """
+        return (
+            f'{self.pages} pages ({self.get_pages_per_second():.1f}/s), '
+            f'{self.in_flight} in flight, {self.retries} retries, '
+            f'{self.failed} failed, '
+            f'latency p50 {self.latency.get_quantile(0.5):.3f}s '
+            f'p99 {self.latency.get_quantile(0.99):.3f}s.'
+        )
+
+    def get_summary(self) -> str:
+        """
+        Returns:
+            str: A multi-line report of the whole crawl.
+        """
+        statuses: str = ', '.join(
+            f'{status}: {count}' for status, count in sorted(self.statuses.items())
+        )
+        errors: str = ', '.join(
+            f'{name}: {count}' for name, count in self.errors.most_common()
+        )
+
+        return '\n'.join((
+            f'Crawled {self.pages} pages in {self.get_elapsed():.1f}s '
+            f'({self.get_pages_per_second():.1f} pages/s).',
+            f'Requests: {self.requests}, retries: {self.retries}, '
+            f'failed: {self.failed}.',
+            f'Responses: {statuses or "none"}; errors: {errors or "none"}.',
+            f'Unchanged pages: {self.unchanged}, not modified: {self.not_modified}.',
+            f'Received {self.bytes_received / 1024**2:.1f} MiB.',
+            f'Latency: mean {self.latency.get_mean():.3f}s, '
+            f'p50 {self.latency.get_quantile(0.5):.3f}s, '
+            f'p90 {self.latency.get_quantile(0.9):.3f}s, '
+            f'p99 {self.latency.get_quantile(0.99):.3f}s.',
+            f'Rate limiter wait: {self.limiter_wait.total:.1f}s in total, '
+            f'p99 {self.limiter_wait.get_quantile(0.99):.3f}s.',
+        ))
+
+    def to_prometheus(self) -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text, ending with a newline.
+        """
+        lines: list[str] = []
+
+        def add(
+            name: str, kind: str, help: str, samples: list[tuple[str, float]]
+        ) -> None:
+            lines.append(f'# HELP {METRIC_PREFIX}_{name} {help}')
+            lines.append(f'# TYPE {METRIC_PREFIX}_{name} {kind}')
+            lines.extend(
+                f'{METRIC_PREFIX}_{name}{labels} {value}'
+                for labels, value in samples
+            )
+
+        def add_histogram(name: str, help: str, histogram: Histogram) -> None:
+            cumulative: int = 0
+            samples: list[tuple[str, float]] = []
+
+            for bound, count in zip((*histogram.bounds, inf), histogram.counts):
+                cumulative += count
+                label: str = '+Inf' if bound == inf else str(bound)
+                samples.append((f'_bucket{{le="{label}"}}', cumulative))
+
+            samples += [('_sum', histogram.total), ('_count', histogram.count)]
+            add(name, 'histogram', help, samples)
+
+        add('requests_total', 'counter', 'Requests sent.', [('', self.requests)])
+        add(
+            'requests_in_flight',
+            'gauge',
+            'Requests not answered yet.',
+            [('', self.in_flight)],
+        )
+        add(
+            'responses_total',
+            'counter',
+            'Responses received, by status code.',
+            [
+                (f'{{status="{status}"}}', count)
+                for status, count in sorted(self.statuses.items())
+            ],
+        )
+        add(
+            'request_errors_total',
+            'counter',
+            'Requests failed without a response.',
+            [
+                (f'{{error="{name}"}}', count)
+                for name, count in sorted(self.errors.items())
+            ],
+        )
+        add(
+            'received_bytes_total',
+            'counter',
+            'Bytes received.',
+            [('', self.bytes_received)],
+        )
+        add('retries_total', 'counter', 'Retried attempts.', [('', self.retries)])
+        add('failed_total', 'counter', 'Paths given up on.', [('', self.failed)])
+        add('pages_total', 'counter', 'Paths completed.', [('', self.pages)])
+        add(
+            'unchanged_pages_total',
+            'counter',
+            'Unchanged pages.',
+            [('', self.unchanged)],
+        )
+        add(
+            'not_modified_total',
+            'counter',
+            'Pages not modified.',
+            [('', self.not_modified)],
+        )
+        add(
+            'pages_per_second',
+            'gauge',
+            'Paths completed per second.',
+            [('', self.get_pages_per_second())],
+        )
+        add_histogram(
+            'request_duration_seconds', 'Time to the response headers.', self.latency
+        )
+        add_histogram(
+            'limiter_wait_seconds',
+            'Time waiting for the rate limiter.',
+            self.limiter_wait,
+        )
+
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: str) -> None:
+        """
+        Writes the metrics to a Prometheus text file, atomically, e.g. for the
+        textfile collector of the node exporter.
+
+        Args:
+            path (str): The path of the `.prom` file.
+        """
+        if directory := dirname(path):
+            makedirs(directory, exist_ok=True)
+
+        temp_path: str = f'{path}.tmp'
+
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(self.to_prometheus())
+
+        replace(temp_path, path)
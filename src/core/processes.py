@@ -0,0 +1,202 @@
+# Native Libraries
+import multiprocessing
+import signal
+import sys
+from dataclasses import replace
+from multiprocessing.connection import Connection
+
+# Third-Party Libraries
+import trio
+from loguru import logger
+
+# Local Modules
+from src.core.agents import get_rotator
+from src.core.cache import CacheStats
+from src.core.journal import CrawlJournal
+from src.core.limiter import SharedRateLimiter
+from src.core.metrics import CrawlMetrics
+from src.core.requester import RequestContext, RequestStrategy, report_crawl
+from src.core.settings import ClientSettings, default_settings
+
+# The limits of the run, split between the workers so that their sum stays within
+# them.
+SPLIT_SETTINGS: tuple[str, ...] = (
+    'max_concurrent_requests',
+    'max_connections',
+    'max_keepalive_connections',
+    'failure_budget',
+)
+
+
+def get_share(total: int, workers: int, worker: int) -> int:
+    """
+    Args:
+        total (int): The amount split between the workers.
+        workers (int): The number of workers.
+        worker (int): The index of the worker.
+
+    Returns:
+        int: The share of the worker, at least 1, the remainder going to the first
+            workers.
+    """
+    return max(total // workers + (worker < total % workers), 1)
+
+
+def run_worker(
+    request_strategy: RequestStrategy,
+    settings: ClientSettings,
+    context: RequestContext,
+    connection: Connection,
+) -> None:
+    """
+    Runs the event loop of a worker process, sending its results through the pipe.
+
+    The settings of the parent process are applied first, with the limits of the
+    run split between the workers, as a spawned process starts from the defaults,
+    and its logs are filtered at the `WORKER_LOG_LEVEL` setting.
+
+    Args:
+        request_strategy (RequestStrategy): The copy of the strategy run by the
+            worker.
+        settings (ClientSettings): The settings of the parent process.
+        context (RequestContext): The context of the worker, with its share of the
+            paths.
+        connection (Connection): The end of the pipe receiving the results.
+    """
+    workers: int = settings.processes
+
+    for name, value in settings.model_dump().items():
+        if name in SPLIT_SETTINGS and value is not None:
+            setattr(
+                default_settings, name, get_share(value, workers, context.worker)
+            )
+        else:
+            setattr(default_settings, name, value)
+
+    logger.remove()
+    logger.add(sys.stderr, level=default_settings.worker_log_level)
+
+    trio.run(request_strategy.fetch, context)
+
+    connection.send((
+        request_strategy.metrics,
+        request_strategy.validator_cache.stats,
+        request_strategy.dead_letters.count,
+        get_rotator().stats,
+    ))
+
+
+def fetch_in_processes(
+    request_strategy: RequestStrategy, context: RequestContext, processes: int
+) -> None:
+    """
+    Partitions the paths of a run across worker processes, each running its own
+    event loop with a copy of the strategy, so parsing, hashing and TLS use
+    several cores.
+
+    The workers draw from a rate limiter in shared memory, or from the one of the
+    coordinator at `RATE_LIMIT_URL`, so the aggregate rate respects the settings,
+    and their metrics are merged into `request_strategy.metrics` once they are
+    done, as are their user agent statistics, exported once. The first SIGINT
+    reaches every worker, which drain their queues on their own; SIGTERM is
+    forwarded to them.
+
+    Args:
+        request_strategy (RequestStrategy): The strategy copied into every worker.
+        context (RequestContext): The context of the run.
+        processes (int): The number of worker processes.
+
+    Raises:
+        RuntimeError: If a worker failed before sending its results.
+    """
+    paths: list[str] = list(context.paths)
+    settings: ClientSettings = default_settings.model_copy(
+        update={'processes': processes}
+    )
+
+    # The journal is truncated, or compacted when resuming, before the workers append
+    # to it, unless other processes append to it as well, as it is then truncated by
+    # `seed_work`.
+    if not request_strategy.concurrent:
+        with CrawlJournal(path=default_settings.journal_path, resume=context.resume):
+            pass
+
+    # Workers drawing from a coordinator already share its rate limit.
+    limiter: SharedRateLimiter | None = (
+        SharedRateLimiter(settings=default_settings)
+        if default_settings.rate_limit_url is None
+        else None
+    )
+    spawn: multiprocessing.context.SpawnContext = multiprocessing.get_context(
+        'spawn'
+    )
+    workers: list[tuple[multiprocessing.Process, Connection]] = []
+
+    logger.info(f'Crawling {len(paths)} paths in {processes} processes.')
+
+    for worker in range(processes):
+        receiver, sender = spawn.Pipe(duplex=False)
+        process: multiprocessing.Process = spawn.Process(
+            target=run_worker,
+            args=(
+                request_strategy,
+                settings,
+                replace(
+                    context,
+                    paths=paths[worker::processes],
+                    worker=worker,
+                    limiter=limiter,
+                ),
+                sender,
+            ),
+        )
+        process.start()
+        sender.close()
+        workers.append((process, receiver))
+
+    def forward(signum: int, frame) -> None:
+        for process, _ in workers:
+            process.terminate()
+
+    previous_handlers: list = [
+        signal.signal(signal.SIGINT, signal.SIG_IGN),
+        signal.signal(signal.SIGTERM, forward),
+    ]
+
+    metrics: CrawlMetrics = CrawlMetrics()
+    cache_stats: CacheStats = CacheStats()
+    dead_letters: int = 0
+    failed: list[int] = []
+
+    try:
+        for worker, (process, receiver) in enumerate(workers):
+            try:
+                (
+                    worker_metrics,
+                    worker_cache_stats,
+                    worker_dead_letters,
+                    agent_stats,
+                ) = receiver.recv()
+
+            except EOFError:
+                failed.append(worker)
+                continue
+
+            metrics.merge(worker_metrics)
+            cache_stats.merge(worker_cache_stats)
+            dead_letters += worker_dead_letters
+            get_rotator().merge_stats(agent_stats)
+
+    finally:
+        for process, _ in workers:
+            process.join()
+
+        signal.signal(signal.SIGINT, previous_handlers[0])
+        signal.signal(signal.SIGTERM, previous_handlers[1])
+
+    request_strategy.metrics = metrics
+    get_rotator().export_stats(default_settings.user_agent_stats_path)
+    report_crawl(metrics, cache_stats, dead_letters)
+
+    if failed:
+        raise RuntimeError(f'The workers {failed} failed, see the traceback above.')
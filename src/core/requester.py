@@ -1,32 +1,67 @@
 # Native Libraries
+import hashlib
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
-from os import makedirs
-from typing import Callable, Iterable
 from functools import wraps
+from os import getpid, makedirs
 from os.path import exists
+from signal import SIGINT, SIGTERM
+from socket import gethostname
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Callable, Iterable, Iterator
 
 # Third-Party Libraries
-from httpx import AsyncClient, HTTPStatusError, Limits, RequestError, Response
-from trio import Semaphore, open_nursery, sleep
+from httpx import (
+    AsyncClient,
+    HTTPStatusError,
+    Limits,
+    RequestError,
+    Response,
+    codes,
+)
 from loguru import logger
-from tenacity import (
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-    retry,
+from trio import (
+    CancelScope,
+    CapacityLimiter,
+    MemoryChannelStatistics,
+    MemoryReceiveChannel,
+    MemorySendChannel,
+    current_time,
+    open_memory_channel,
+    open_nursery,
+    open_signal_receiver,
+    sleep,
+    to_thread,
+    wrap_file,
 )
 
 # Local Modules
+from src.core.agents import Rotator, get_rotator
+from src.core.cache import CacheStats, ValidatorCache, Validators
+from src.core.journal import DONE, FAILED, PENDING, CrawlJournal
+from src.core.limiter import RateLimiter, get_rate_limiter, parse_retry_after
+from src.core.metrics import CrawlMetrics
+from src.core.retry import CircuitBreaker, DeadLetterQueue, RetryPolicy
 from src.core.settings import ClientSettings, default_settings
-from src.core.agents import get_random_user_agent
-from src.core.utils import hashes_are_equal
+from src.core.store import PageStore, canonicalize_url, get_page_store
+from src.core.work import WorkQueue, get_work_queue
+
+GONE_STATUS_CODES: frozenset[int] = frozenset({codes.NOT_FOUND, codes.GONE})
 
 
 @dataclass(frozen=True)
 class RequestContext:
     base_url: str
     paths: Iterable[str]
+    resume: bool = False
+    # Receives the URL and body of every crawled page, and None as the body of
+    # the pages gone from the site.
+    page_sink: MemorySendChannel | None = None
+    archive: bool = True
+    # Set when the run is one of the worker processes of a multi-process crawl.
+    worker: int | None = None
+    limiter: RateLimiter | None = None
 
     def to_dict(self):
         return self.__dict__
@@ -36,21 +71,51 @@ class RateLimitedClient(AsyncClient):
     """Asynchronous HTTP client with built-in rate limiting.
 
     Extends httpx.AsyncClient to add rate limiting and automatic User-Agent rotation.
+    The outcome of every response is fed back to the rotator, so user agents that get
+    blocked or answered slowly are picked less often. Every task sharing a client
+    draws from the same token bucket (or one bucket per host), which adapts to
+    `429`/`503` responses and `Retry-After` headers. Requests, statuses, bytes,
+    latency and rate limiter waits are counted in `metrics`.
 
     Args:
         settings (ClientSettings): Configuration settings for the client
+        metrics (CrawlMetrics | None): The metrics to update, fresh ones if not given
+        limiter (RateLimiter | None): The rate limiter to draw from, e.g. one shared
+            with other processes, a new one if not given, drawing from the
+            coordinator at `RATE_LIMIT_URL` if set
         **kwargs: Additional arguments passed to AsyncClient
     """
 
-    def __init__(self, settings: ClientSettings = default_settings, **kwargs) -> None:
+    def __init__(
+        self,
+        settings: ClientSettings = default_settings,
+        metrics: CrawlMetrics | None = None,
+        limiter: RateLimiter | None = None,
+        **kwargs,
+    ) -> None:
         """Initialize with rate limiting settings."""
         super().__init__(
-            limits=Limits(max_connections=settings.max_connections),
+            limits=Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            http2=settings.http2,
             follow_redirects=settings.follow_redirects,
             timeout=settings.timeout,
             **kwargs,
         )
-        self._interval: float = settings.interval
+        self._limiter: RateLimiter = limiter or get_rate_limiter(settings)
+        # A limiter handed over by the caller may outlive the client.
+        self._owns_limiter: bool = limiter is None
+        self._rotator: Rotator = get_rotator()
+        self.metrics: CrawlMetrics = metrics or CrawlMetrics()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await super().__aexit__(*exc_info)
+
+        if self._owns_limiter:
+            await self._limiter.aclose()
 
     @wraps(AsyncClient.get)
     async def get(self, url: str, **kwargs) -> Response:
@@ -63,9 +128,114 @@ class RateLimitedClient(AsyncClient):
         Returns:
             httpx.Response: The HTTP response
         """
-        kwargs.setdefault('headers', {})['User-Agent'] = get_random_user_agent()
-        await sleep(self._interval)
-        return await super().get(url=url, **kwargs)
+        user_agent: str = self._rotator.get()
+        kwargs.setdefault('headers', {})['User-Agent'] = user_agent
+        await self._acquire(url)
+
+        started_at: float = current_time()
+
+        with self._track():
+            response: Response = await super().get(url=url, **kwargs)
+
+        self._record(user_agent, response, current_time() - started_at)
+        self.metrics.bytes_received += response.num_bytes_downloaded
+
+        return response
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: str, **kwargs
+    ) -> AsyncIterator[Response]:
+        """Stream a request with rate limiting and random User-Agent.
+
+        The response body is not loaded into memory; it must be consumed with
+        `Response.aiter_bytes` inside the context.
+
+        Args:
+            method: HTTP method
+            url: Target URL
+            **kwargs: Additional request parameters
+
+        Yields:
+            httpx.Response: The HTTP response, with its body still unread
+        """
+        user_agent: str = self._rotator.get()
+        kwargs.setdefault('headers', {})['User-Agent'] = user_agent
+        await self._acquire(url)
+
+        started_at: float = current_time()
+
+        with self._track():
+            async with super().stream(method=method, url=url, **kwargs) as response:
+                self._record(user_agent, response, current_time() - started_at)
+
+                try:
+                    yield response
+                finally:
+                    self.metrics.bytes_received += response.num_bytes_downloaded
+
+    async def _acquire(self, url: str) -> None:
+        """Wait for the rate limiter, measuring the time waited.
+
+        Args:
+            url: Target URL
+        """
+        started_at: float = current_time()
+        await self._limiter.acquire(self.base_url.join(url).host)
+        self.metrics.limiter_wait.observe(current_time() - started_at)
+
+    @contextmanager
+    def _track(self) -> Iterator[None]:
+        """Count a request as in flight until its response is read or it fails."""
+        self.metrics.requests += 1
+        self.metrics.in_flight += 1
+
+        try:
+            yield
+
+        except RequestError as error:
+            self.metrics.errors[type(error).__name__] += 1
+            raise
+
+        finally:
+            self.metrics.in_flight -= 1
+
+    def _record(self, user_agent: str, response: Response, latency: float) -> None:
+        """Feed a response back into the rate limiter, the rotator and the metrics.
+
+        Args:
+            user_agent: The User-Agent the request was sent with
+            response: The received response
+            latency: Seconds until the response headers arrived
+        """
+        self._limiter.update(response)
+        self._rotator.record(user_agent, response.status_code, latency)
+        self.metrics.statuses[response.status_code] += 1
+        self.metrics.latency.observe(latency)
+
+
+def report_crawl(
+    metrics: CrawlMetrics, cache_stats: CacheStats, dead_letters: int
+) -> None:
+    """
+    Logs the summary of a run and exports its metrics when `metrics_path` is set.
+
+    Args:
+        metrics (CrawlMetrics): The metrics of the run.
+        cache_stats (CacheStats): The counters of the validator cache.
+        dead_letters (int): The number of URLs that permanently failed.
+    """
+    logger.info(metrics.get_summary())
+    logger.info(f'Validator cache: {cache_stats}.')
+
+    if default_settings.metrics_path is not None:
+        metrics.export(default_settings.metrics_path)
+
+    if dead_letters:
+        logger.warning(
+            f'{dead_letters} URLs permanently failed, '
+            f'see {default_settings.dead_letter_path}.'
+        )
 
 
 class RequestStrategy(ABC):
@@ -73,9 +243,45 @@ class RequestStrategy(ABC):
     Abstract base class defining a strategy for handling HTTP requests.
 
     Attributes:
-        context (RequestContext): The request context containing base URL and path details.
+        context (RequestContext): The request context containing base URL and path
+            details.
+        validator_cache (ValidatorCache): The conditional GET cache of the current
+                                          run, whose `stats` hold the hit/miss/304
+                                          counts.
+        page_store (PageStore): The store of the raw pages, keyed by canonical URL.
+        client (RateLimitedClient): The client shared by every request of the current
+            run.
+        retry_policy (RetryPolicy): Decides which failures are retried and the
+            backoff delays.
+        circuit_breaker (CircuitBreaker): Holds back requests to hosts that keep
+            failing.
+        dead_letters (DeadLetterQueue): The file recording the URLs that permanently
+            failed.
+        journal (CrawlJournal): The checkpoint of the pending, completed and failed
+                                paths, used to skip completed work when
+                                `context.resume` is set.
+        metrics (CrawlMetrics): The counters and histograms of the current run,
+                                reported every `progress_interval` seconds and
+                                summarized at its end.
+        partitionable (bool): Whether the paths of a run can be split across worker
+                              processes, each crawling its share with a copy of the
+                              strategy.
+        concurrent (bool): Whether other processes crawl with the same stores and
+                           journal at the same time, even outside of the worker
+                           processes of a single run.
     """
+
     context: RequestContext
+    validator_cache: ValidatorCache
+    page_store: PageStore
+    client: RateLimitedClient
+    retry_policy: RetryPolicy
+    circuit_breaker: CircuitBreaker
+    dead_letters: DeadLetterQueue
+    journal: CrawlJournal
+    metrics: CrawlMetrics
+    partitionable: bool = True
+    concurrent: bool = False
 
     @abstractmethod
     async def fetch(self, context: RequestContext) -> None:
@@ -83,72 +289,532 @@ class RequestStrategy(ABC):
         Fetches data based on the implemented strategy.
 
         Args:
-            context (RequestContext): The context with the necessary data for requests.
+            context (RequestContext): The context with the necessary data for
+                requests.
         """
         pass
 
+    @asynccontextmanager
+    async def _session(self, context: RequestContext) -> AsyncIterator[None]:
+        """
+        Sets up the resources shared by every request of a single run, including
+        one long-lived client, so connections and TLS sessions are reused across
+        all of its requests.
+
+        In a worker process, or when the strategy is `concurrent`, the stores and
+        the journal are shared with other processes: the stores commit every write,
+        so no process holds the database lock across requests, and the journal is
+        appended to line by line instead of being truncated. The results and user
+        agent statistics of a worker process are reported by its parent process.
+
+        Args:
+            context (RequestContext): The context with the necessary data for
+                requests.
+        """
+        self.context = context
+        self.metrics = CrawlMetrics()
+        makedirs('./contents', exist_ok=True)
+
+        # The page store and validator cache are SQLite databases, used from one
+        # worker thread at a time so their writes never block the event loop.
+        self._store_limiter: CapacityLimiter = CapacityLimiter(1)
+
+        shared: bool = self.concurrent or context.worker is not None
+        store_options: dict[str, int] = {'commit_interval': 1} if shared else {}
+
+        self.retry_policy = RetryPolicy(
+            max_attempts=default_settings.max_retry_attempts,
+            backoff_base=default_settings.retry_backoff_base,
+            backoff_max=default_settings.retry_backoff_max,
+        )
+        self.circuit_breaker = CircuitBreaker(
+            threshold=default_settings.circuit_breaker_threshold,
+            cooldown=default_settings.circuit_breaker_cooldown,
+        )
+
+        with (
+            ValidatorCache(
+                path=default_settings.validator_cache_path, **store_options
+            ) as self.validator_cache,
+            get_page_store(**store_options) as self.page_store,
+            DeadLetterQueue(
+                path=default_settings.dead_letter_path
+            ) as self.dead_letters,
+            CrawlJournal(
+                path=default_settings.journal_path,
+                resume=context.resume,
+                shared=shared,
+            ) as self.journal,
+        ):
+            if self.journal.completed:
+                logger.info(
+                    f'Resuming the crawl, skipping {len(self.journal.completed)} '
+                    'completed paths.'
+                )
+
+            async with RateLimitedClient(
+                base_url=context.base_url,
+                metrics=self.metrics,
+                limiter=context.limiter,
+            ) as self.client:
+                yield
+
+        if context.worker is None:
+            get_rotator().export_stats(default_settings.user_agent_stats_path)
+            report_crawl(
+                self.metrics, self.validator_cache.stats, self.dead_letters.count
+            )
+
+    def drain(self) -> None:
+        """
+        Stops feeding new paths to the workers, letting them finish the requests
+        already queued or in flight before the run ends.
+        """
+        self._draining = True
+
+        if (drain_scope := getattr(self, '_drain_scope', None)) is not None:
+            drain_scope.cancel()
+
     async def _send_requests(self, paths: Iterable[str] = None) -> None:
         """
-        Sends asynchronous requests, managed with rate limiting and concurrency.
+        Sends asynchronous requests through a bounded pool of workers.
+
+        Paths are fed lazily into a bounded memory channel, so `paths` can be a
+        generator and memory stays flat regardless of the number of paths. Failed
+        requests are put back into the same queue after their backoff, so waiting
+        retries never hold a worker. The first SIGINT/SIGTERM drains the queue
+        gracefully, a second one cancels the run.
 
         Args:
             paths (Iterable[str], optional): Specific paths for the requests.
-                                             Defaults to None, in which case it uses context paths.
+                                             Defaults to None, in which case it uses
+                                             context paths.
+        """
+        workers: int = default_settings.max_concurrent_requests
+        logger.info(f'Sending requests through {workers} workers.')
+
+        self._draining = False
+        self._feeding = True
+        self._outstanding = 0
+        self._attempts: dict[str, int] = {}
+
+        send_channel, receive_channel = open_memory_channel(
+            default_settings.queue_size
+        )
+        self._receive_channel: MemoryReceiveChannel = receive_channel
+        self._retry_channel: MemorySendChannel = send_channel.clone()
+
+        async with open_nursery() as nursery:
+            self._nursery = nursery
+            nursery.start_soon(self._watch_signals, nursery.cancel_scope)
+            nursery.start_soon(self._report_progress)
+            nursery.start_soon(
+                self._produce,
+                send_channel,
+                self.context.paths if paths is None else paths,
+            )
+
+            async with open_nursery() as worker_nursery, receive_channel:
+                for _ in range(workers):
+                    worker_nursery.start_soon(
+                        self._consume, self.client, receive_channel.clone()
+                    )
+
+            nursery.cancel_scope.cancel()
+
+    async def _produce(
+        self, send_channel: MemorySendChannel, paths: Iterable[str]
+    ) -> None:
+        """
+        Feeds paths into the work queue, blocking while the queue is full.
+
+        Args:
+            send_channel (MemorySendChannel): The sending end of the work queue.
+            paths (Iterable[str]): The paths to request.
+        """
+        async with send_channel:
+            with CancelScope() as self._drain_scope:
+                if not self._draining:
+                    await self._feed(send_channel, paths)
+
+        self._feeding = False
+        self._close_if_idle()
+
+    async def _feed(
+        self, send_channel: MemorySendChannel, paths: Iterable[str]
+    ) -> None:
+        """
+        Sends every path into the work queue, in order.
+
+        Args:
+            send_channel (MemorySendChannel): The sending end of the work queue.
+            paths (Iterable[str]): The paths to request.
         """
-        logger.info(f'Sending {len(paths or self.context.paths)} requests.')
+        for path in paths:
+            await self._enqueue(send_channel, path)
 
-        async with RateLimitedClient(base_url=self.context.base_url) as client:
+    async def _enqueue(self, send_channel: MemorySendChannel, path: str) -> None:
+        """
+        Sends a path into the work queue, unless it was completed by the run being
+        resumed.
 
-            async with open_nursery() as nursery:
-                semaphore: Semaphore = Semaphore(default_settings.max_concurrent_requests)
+        Args:
+            send_channel (MemorySendChannel): The sending end of the work queue.
+            path (str): The path to request.
+        """
+        if path in self.journal.completed:
+            return None
+
+        await self.journal.record(PENDING, path)
+        self._outstanding += 1
+
+        try:
+            await send_channel.send(path)
+        except BaseException:
+            # The path never made it into the queue, e.g. because the run is
+            # draining.
+            self._release()
+            raise
+
+    async def _consume(
+        self, client: RateLimitedClient, receive_channel: MemoryReceiveChannel
+    ) -> None:
+        """
+        Processes paths from the work queue until it is closed and empty.
 
-                for path in paths or self.context.paths:
-                    nursery.start_soon(self._process_request, client, semaphore, path)
+        Args:
+            client (RateLimitedClient): The rate-limited client for making requests.
+            receive_channel (MemoryReceiveChannel): The receiving end of the work
+                queue.
+        """
+        async with receive_channel:
+            async for path in receive_channel:
+                await self._attempt(client, path)
 
-    @retry(
-        retry=retry_if_exception_type((HTTPStatusError, RequestError)),
-        stop=stop_after_attempt(default_settings.max_retry_attempts),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
-    async def _process_request(self, client: RateLimitedClient, semaphore: Semaphore, path: str) -> None:
+    async def _attempt(self, client: RateLimitedClient, path: str) -> None:
         """
-        Processes a single HTTP request within rate limits, with retries on failure.
+        Makes one attempt at a request, classifying its failure.
+
+        Transient failures (network errors, 408, 429, 500, 502, 503 and 504) are
+        retried with backoff up to `max_retry_attempts`; other failures, including
+        unexpected exceptions, and transient ones that ran out of attempts, are
+        recorded as dead letters instead of aborting the run.
 
         Args:
             client (RateLimitedClient): The rate-limited client for making requests.
-            semaphore (Semaphore): Concurrency control semaphore.
             path (str): The specific request path.
         """
-        async with semaphore:
-            response: Response = await client.get(path)
-            await self._process_response(response)
+        host: str = client.base_url.join(path).host
+
+        if (wait_time := self.circuit_breaker.get_wait_time(host)) > 0:
+            self._schedule_retry(path, wait_time)
+            return None
+
+        retry_after: float | None = None
+
+        try:
+            await self._process_request(client, path)
+
+        except HTTPStatusError as error:
+            reason: str = str(error.response.status_code)
+            retryable: bool = self.retry_policy.is_retryable(
+                error.response.status_code
+            )
+            retry_after = parse_retry_after(
+                error.response.headers.get('Retry-After')
+            )
+
+        except RequestError as error:
+            reason, retryable = f'{type(error).__name__}: {error}', True
+
+        # A bug or a broken page must not take down the whole run, only its path.
+        except Exception as error:
+            logger.exception(f'Unexpected error while processing {path}.')
+            reason, retryable = f'{type(error).__name__}: {error}', False
+
+        else:
+            self.circuit_breaker.record_success(host)
+            await self._complete(DONE, path)
+            self.metrics.pages += 1
+            self._attempts.pop(path, None)
+            return None
+
+        if retryable and self.circuit_breaker.record_failure(host):
+            logger.warning(
+                f'Too many consecutive failures, pausing requests to {host}.'
+            )
+
+        attempts: int = self._attempts.pop(path, 0) + 1
 
-    async def _process_response(self, response: Response) -> None:
+        if retryable and attempts < self.retry_policy.max_attempts:
+            logger.debug(
+                f'Attempt {attempts} at {path} failed ({reason}), retrying.'
+            )
+            self.metrics.retries += 1
+            self._attempts[path] = attempts
+            self._schedule_retry(
+                path, self.retry_policy.get_delay(attempts, retry_after)
+            )
+            return None
+
+        logger.error(f'Giving up on {path} after {attempts} attempts ({reason}).')
+        self.dead_letters.record(str(client.base_url.join(path)), reason, attempts)
+        await self._complete(FAILED, path)
+        self.metrics.failed += 1
+
+        if (
+            default_settings.failure_budget is not None
+            and self.dead_letters.count > default_settings.failure_budget
+            and not self._draining
+        ):
+            logger.error('Failure budget exhausted, draining the work queue.')
+            self.drain()
+
+    async def _complete(self, status: str, path: str) -> None:
         """
-        Processes and stores the HTTP response content on disk.
+        Records the final status of a path once its last attempt is over.
 
         Args:
-            response (Response): The HTTP response to process and store.
+            status (str): Either `done` or `failed`.
+            path (str): The specific request path.
         """
-        logger.info(
-            f'Received response {response.status_code} from: {response.url}.'
+        await self.journal.record(status, path)
+        self._release()
+
+    def _schedule_retry(self, path: str, delay: float) -> None:
+        """
+        Puts a path back into the work queue once `delay` seconds have passed.
+
+        The path stays outstanding while it waits, so the queue is kept open for
+        it.
+
+        Args:
+            path (str): The specific request path.
+            delay (float): The delay in seconds.
+        """
+        self._nursery.start_soon(self._requeue, path, delay)
+
+    async def _requeue(self, path: str, delay: float) -> None:
+        """
+        Args:
+            path (str): The specific request path.
+            delay (float): The delay in seconds.
+        """
+        await sleep(delay)
+        await self._retry_channel.send(path)
+
+    def _release(self) -> None:
+        """Marks a unit of work as over, closing the queue once the run is idle."""
+        self._outstanding -= 1
+        self._close_if_idle()
+
+    def _close_if_idle(self) -> None:
+        """
+        Closes the retry end of the work queue once nothing is being fed and every
+        path sent into it was completed, letting the workers exit.
+
+        A path is outstanding from the moment it is enqueued until its final status
+        is recorded, whether it is queued, in flight or waiting for a retry, so the
+        queue cannot be closed under a path that is still being processed.
+        """
+        if not self._feeding and self._outstanding == 0:
+            self._retry_channel.close()
+
+    async def _watch_signals(self, cancel_scope: CancelScope) -> None:
+        """
+        Drains the work queue on the first termination signal and cancels the run on
+        the second.
+
+        Args:
+            cancel_scope (CancelScope): The scope cancelled on the second signal.
+        """
+        with open_signal_receiver(SIGINT, SIGTERM) as signals:
+            async for signal_number in signals:
+                if self._draining:
+                    logger.warning('Cancelling the run.')
+                    cancel_scope.cancel()
+                    return None
+
+                logger.warning(
+                    f'Received signal {signal_number}, draining the work queue.'
+                )
+                self.drain()
+
+    async def _report_progress(self) -> None:
+        """
+        Logs the progress of the run every `progress_interval` seconds, refreshing
+        the Prometheus text file when `metrics_path` is set.
+        """
+        if (interval := default_settings.progress_interval) is None:
+            return None
+
+        worker: int | None = self.context.worker
+
+        while True:
+            await sleep(interval)
+
+            if worker is not None:
+                # The metrics file holds the merged metrics, written by the parent
+                # process.
+                logger.info(
+                    f'Progress of worker {worker}: {self.metrics.get_progress()}'
+                )
+                continue
+
+            logger.info(f'Progress: {self.metrics.get_progress()}')
+
+            if default_settings.metrics_path is not None:
+                await to_thread.run_sync(
+                    self.metrics.export, default_settings.metrics_path
+                )
+
+    async def _process_request(self, client: RateLimitedClient, path: str) -> None:
+        """
+        Processes a single HTTP request within rate limits.
+
+        Args:
+            client (RateLimitedClient): The rate-limited client for making requests.
+            path (str): The specific request path.
+
+        Raises:
+            HTTPStatusError: If the response has an error status code.
+            RequestError: If the request could not be completed.
+        """
+        url: str = canonicalize_url(client.build_request('GET', path).url)
+        validators: Validators | None = await to_thread.run_sync(
+            self.validator_cache.get, url, limiter=self._store_limiter
+        )
+
+        # A 304 stands for the stored body, so validators of any other body are
+        # dropped.
+        if validators is not None and validators.content_hash != (
+            await to_thread.run_sync(
+                self.page_store.get_digest, url, limiter=self._store_limiter
+            )
+        ):
+            await to_thread.run_sync(
+                self.validator_cache.discard, url, limiter=self._store_limiter
+            )
+
+        headers: dict[str, str] = await to_thread.run_sync(
+            self.validator_cache.get_conditional_headers,
+            url,
+            limiter=self._store_limiter,
         )
-        if not exists('./contents'):
-            makedirs('./contents')
 
-        file_name: str = response.url.path.split('/')[-2]
-        file_path: str = f'./contents/{file_name}.html'
+        async with client.stream('GET', path, headers=headers) as response:
+            if response.status_code == codes.NOT_MODIFIED:
+                logger.debug(f'Skipping {url}, not modified since the last run.')
+                await to_thread.run_sync(
+                    self.validator_cache.mark_not_modified,
+                    url,
+                    response,
+                    limiter=self._store_limiter,
+                )
+                self.metrics.not_modified += 1
+
+                if self.context.page_sink is not None:
+                    # Reading and decompressing the stored body must not hold up the
+                    # other requests.
+                    page: bytes = await to_thread.run_sync(
+                        self.page_store.get, url, limiter=self._store_limiter
+                    )
+                    await self.context.page_sink.send((url, page))
+
+                return None
+
+            # Pages gone from the site are dropped from the datasets by the next
+            # extraction, or right away by the one the pages are streamed to.
+            if response.status_code in GONE_STATUS_CODES:
+                if await to_thread.run_sync(
+                    self.page_store.delete, url, limiter=self._store_limiter
+                ):
+                    logger.info(
+                        f'Page {url} no longer exists, removed it from the page '
+                        'store.'
+                    )
+                    await to_thread.run_sync(
+                        self.validator_cache.discard,
+                        url,
+                        limiter=self._store_limiter,
+                    )
+
+                if self.context.page_sink is not None:
+                    await self.context.page_sink.send((url, None))
 
-        if exists(file_path) and hashes_are_equal(file_path=file_path, bytes_data=response.content):
-            logger.info(
-                f'Skipping file {file_name}, unchanged data since the last run.'
+            response.raise_for_status()
+            content_hash: str | None = await self._process_response(url, response)
+
+        if content_hash is not None:
+            await to_thread.run_sync(
+                self.validator_cache.put,
+                url,
+                response,
+                content_hash,
+                limiter=self._store_limiter,
             )
-            return None
-    
 
-        with open(file_path, 'w') as file:
-            file.write(response.text)
-            logger.info(f'File {file_name} has been saved.')
+    async def _process_response(self, url: str, response: Response) -> str | None:
+        """
+        Processes the HTTP response content, storing it in the page store and/or
+        handing it over to the page sink of the context.
+
+        The body is read in chunks of `chunk_size` bytes, hashed as they arrive and
+        spooled to a temporary file once larger than a chunk, so it is never held
+        whole in memory unless the page sink takes it. It is compressed and stored
+        from that file in a worker thread, one page at a time, so the event loop
+        keeps serving the other requests meanwhile.
+
+        Args:
+            url (str): The canonical URL of the page.
+            response (Response): The streamed HTTP response to process.
+
+        Returns:
+            str | None: The MD5 hash of the response body, or None if the page store
+            does not hold it, in which case its validators must not be kept.
+        """
+        logger.debug(
+            f'Received response {response.status_code} from: {response.url}.'
+        )
+        hasher: hashlib.Hash = hashlib.md5()
+        page_sink: MemorySendChannel | None = self.context.page_sink
+
+        async with wrap_file(
+            SpooledTemporaryFile(max_size=default_settings.chunk_size)
+        ) as body:
+            async for chunk in response.aiter_bytes(default_settings.chunk_size):
+                hasher.update(chunk)
+                await body.write(chunk)
+
+            content_hash: str | None = hasher.hexdigest()
+
+            if page_sink is None or self.context.archive:
+                # Compressing and writing the page must not hold up the other
+                # requests.
+                if await to_thread.run_sync(
+                    self.page_store.put_file,
+                    url,
+                    body.wrapped,
+                    content_hash,
+                    limiter=self._store_limiter,
+                ):
+                    logger.debug(f'Page {url} has been saved.')
+                else:
+                    logger.debug(
+                        f'Skipping page {url}, unchanged data since the last run.'
+                    )
+                    self.metrics.unchanged += 1
+
+            elif content_hash != await to_thread.run_sync(
+                self.page_store.get_digest, url, limiter=self._store_limiter
+            ):
+                content_hash = None
+
+            if page_sink is not None:
+                await body.seek(0)
+                await page_sink.send((url, await body.read()))
+
+        return content_hash
 
 
 class SimpleRequestStrategy(RequestStrategy):
@@ -161,22 +827,182 @@ class SimpleRequestStrategy(RequestStrategy):
         Executes fetch using the simple request strategy.
 
         Args:
-            context (RequestContext): The context with URLs and settings for requests.
+            context (RequestContext): The context with URLs and settings for
+                requests.
         """
-        self.context = context
-        await self._send_requests()
+        async with self._session(context):
+            await self._send_requests()
+
+
+class CatalogRequestStrategy(RequestStrategy):
+    """
+    A request strategy that crawls the pages listed in a catalog page, refreshing
+    the catalog within the same run.
+
+    The catalog is requested through the work queue like any other path, so it
+    shares the client, rate limiter, retries and conditional GET of the run. The
+    pages already known from the cached catalog (the context paths) are crawled
+    right away; when the catalog changed, it is parsed and cached by
+    `parse_catalog`, and the pages it newly lists are queued as soon as it is.
+    It discovers its own paths, so it always runs in a single process.
+    """
+
+    partitionable: bool = False
+
+    def __init__(
+        self,
+        catalog_path: str,
+        cache_path: str,
+        parse_catalog: Callable[[bytes], list[str]],
+        crawl_pages: bool = True,
+    ) -> None:
+        """
+        Args:
+            catalog_path (str): The path of the catalog page.
+            cache_path (str): The file where `parse_catalog` caches the catalog rows;
+                              when it is missing, the catalog is downloaded
+                              unconditionally.
+            parse_catalog (Callable[[bytes], list[str]]): Parses and caches the
+                catalog page, returning the paths it lists. It runs in a worker
+                thread.
+            crawl_pages (bool, optional): Whether to crawl the pages listed in the
+                                          catalog, or only refresh it. Defaults to
+                                          True.
+        """
+        self._catalog_path: str = catalog_path
+        self._cache_path: str = cache_path
+        self._parse_catalog: Callable[[bytes], list[str]] = parse_catalog
+        self._crawl_pages: bool = crawl_pages
+
+    async def fetch(self, context: RequestContext) -> None:
+        """
+        Executes fetch of the catalog and of the pages it lists.
+
+        Args:
+            context (RequestContext): The context whose paths are the pages of the
+                cached catalog.
+        """
+        async with self._session(context):
+            await self._send_requests()
+
+    async def _feed(
+        self, send_channel: MemorySendChannel, paths: Iterable[str]
+    ) -> None:
+        """
+        Sends the catalog, then every known page, into the work queue.
+
+        Args:
+            send_channel (MemorySendChannel): The sending end of the work queue.
+            paths (Iterable[str]): The pages of the cached catalog.
+        """
+        paths = list(paths) if self._crawl_pages else []
+        self._known_paths: set[str] = set(paths)
+
+        await self._enqueue(send_channel, self._catalog_path)
+
+        for path in paths:
+            await self._enqueue(send_channel, path)
+
+    async def _process_request(self, client: RateLimitedClient, path: str) -> None:
+        """
+        Processes the catalog with a conditional GET, and any other page as usual.
+
+        Args:
+            client (RateLimitedClient): The rate-limited client for making requests.
+            path (str): The specific request path.
+
+        Raises:
+            HTTPStatusError: If the response has an error status code.
+            RequestError: If the request could not be completed.
+        """
+        if path != self._catalog_path:
+            return await super()._process_request(client, path)
+
+        url: str = canonicalize_url(client.build_request('GET', path).url)
+
+        if not exists(self._cache_path):
+            await to_thread.run_sync(
+                self.validator_cache.discard, url, limiter=self._store_limiter
+            )
+
+        headers: dict[str, str] = await to_thread.run_sync(
+            self.validator_cache.get_conditional_headers,
+            url,
+            limiter=self._store_limiter,
+        )
+
+        async with client.stream('GET', path, headers=headers) as response:
+            if response.status_code == codes.NOT_MODIFIED:
+                logger.info(
+                    'The catalog has not changed since the last run, '
+                    'using the cached rows.'
+                )
+                await to_thread.run_sync(
+                    self.validator_cache.mark_not_modified,
+                    url,
+                    response,
+                    limiter=self._store_limiter,
+                )
+                self.metrics.not_modified += 1
+                return None
+
+            response.raise_for_status()
+            page: bytes = await response.aread()
+
+        paths: list[str] = await to_thread.run_sync(self._parse_catalog, page)
+        await to_thread.run_sync(
+            self.validator_cache.put,
+            url,
+            response,
+            hashlib.md5(page).hexdigest(),
+            limiter=self._store_limiter,
+        )
+
+        new_paths: list[str] = [
+            path for path in paths if path not in self._known_paths
+        ]
+        logger.info(
+            f'The catalog lists {len(paths)} pages, {len(new_paths)} of them new.'
+        )
+
+        if self._crawl_pages and new_paths:
+            self._known_paths.update(new_paths)
+            # Keeps the queue open until the new paths are enqueued, as the
+            # catalog itself is completed right after this.
+            self._outstanding += 1
+            self._nursery.start_soon(self._enqueue_new_paths, new_paths)
+
+    async def _enqueue_new_paths(self, paths: list[str]) -> None:
+        """
+        Sends the pages newly listed in the catalog into the work queue.
+
+        Args:
+            paths (list[str]): The new paths.
+        """
+        try:
+            for path in paths:
+                if self._draining:
+                    break
+
+                await self._enqueue(self._retry_channel, path)
+        finally:
+            self._release()
 
 
 class PaginatedRequestStrategy(RequestStrategy):
     """
-    A paginated request strategy that fetches multiple pages of data from specified paths.
+    A paginated request strategy that fetches multiple pages of data from specified
+    paths.
+
+    The number of pages of up to `max_connections` paths is discovered concurrently,
+    and the pages of those paths are interleaved in the single work queue of the run.
     """
 
     def __init__(self, number_of_pages: Callable[[str], int] | int) -> None:
         """
         Args:
-            number_of_pages (Callable[[str], int] | int): Number of pages to request per path,
-                                                          or a function to calculate this value.
+            number_of_pages (Callable[[str], int] | int): Number of pages to request
+                per path, or a function to calculate this value.
         """
         self._number_of_pages = number_of_pages
 
@@ -187,25 +1013,58 @@ class PaginatedRequestStrategy(RequestStrategy):
         Args:
             context (RequestContext): The request context with base URL and paths.
         """
-        self.context = context
+        async with self._session(context):
+            await self._send_requests()
 
-        for path in context.paths:
-            await self._paginate(path)
+    async def _feed(
+        self, send_channel: MemorySendChannel, paths: Iterable[str]
+    ) -> None:
+        """
+        Paginates up to `max_connections` paths concurrently into the work queue.
 
+        A path only gets a task once a slot of the limiter is free, so the number
+        of tasks stays bounded regardless of the number of paths. Blocked senders
+        are woken up in FIFO order, so the pages of different paths end up
+        interleaved in the queue.
 
-    async def _paginate(self, path: str) -> None:
+        Args:
+            send_channel (MemorySendChannel): The sending end of the work queue.
+            paths (Iterable[str]): The base paths for paginated requests.
+        """
+        limiter: CapacityLimiter = CapacityLimiter(default_settings.max_connections)
+
+        async with open_nursery() as nursery:
+            for path in paths:
+                borrower: object = object()
+                await limiter.acquire_on_behalf_of(borrower)
+                nursery.start_soon(
+                    self._paginate, send_channel, path, limiter, borrower
+                )
+
+    async def _paginate(
+        self,
+        send_channel: MemorySendChannel,
+        path: str,
+        limiter: CapacityLimiter,
+        borrower: object,
+    ) -> None:
         """
         Paginates requests over the specified path by generating URLs for each page.
 
         Args:
+            send_channel (MemorySendChannel): The sending end of the work queue.
             path (str): The base path for paginated requests.
+            limiter (CapacityLimiter): The limiter of the concurrent paginations.
+            borrower (object): The token holding the slot of the pagination.
         """
-        number_of_pages: int = await self._get_number_of_pages(path)
+        try:
+            number_of_pages: int = await self._get_number_of_pages(path)
 
-        paths: list[str] = [
-            f'{path}?page={page}' for page in range(1, number_of_pages + 1)
-        ]
-        await self._send_requests(paths)
+            for page in range(1, number_of_pages + 1):
+                await self._enqueue(send_channel, f'{path}?page={page}')
+
+        finally:
+            limiter.release_on_behalf_of(borrower)
 
     async def _get_number_of_pages(self, path: str) -> int:
         """
@@ -221,3 +1080,166 @@ class PaginatedRequestStrategy(RequestStrategy):
             return await self._number_of_pages(path)
 
         return self._number_of_pages
+
+
+class LeasedRequestStrategy(RequestStrategy):
+    """
+    A request strategy that claims its paths from a `WorkQueue` shared with other
+    processes, so they crawl a catalog together.
+
+    The context paths are added to the queue first, then paths are claimed in
+    batches of `batch_size` whenever the work queue of the run has room for them,
+    and their leases are renewed by a heartbeat while they are queued, in flight
+    or waiting for a retry. The paths of a process that stops renewing its
+    leases, e.g. because it crashed, are claimed by the others once they expire.
+    Completions are idempotent: a path keeps its first final status unless a
+    later attempt succeeds, and an unchanged page crawled twice adds no version
+    to the page store. The run ends once every path of the queue is completed.
+
+    The queue comes from the `WORK_QUEUE_BACKEND` setting. The default `sqlite`
+    queue is a SQLite database in WAL mode, which only works on a local
+    filesystem, so every process must then run on the machine holding it. With
+    the `http` queue, the processes of several machines claim their paths from a
+    `Coordinator`, each machine keeping the pages it crawled in its own stores.
+    Processes started by separate `fetch` calls share a rate limit through the
+    coordinator at `RATE_LIMIT_URL`, without which each of them applies the whole
+    `RATE_LIMIT`.
+    """
+
+    work_queue: WorkQueue
+    concurrent: bool = True
+
+    def __init__(
+        self,
+        path: str | None = None,
+        lease_duration: float | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+    ) -> None:
+        """
+        Args:
+            path (str | None, optional): The location of the work queue, the path of
+                                         its database for the SQLite backend or
+                                         the URL of the coordinator for the HTTP
+                                         one. Defaults to the `WORK_QUEUE_PATH`
+                                         setting.
+            lease_duration (float | None, optional): The seconds a claimed path stays
+                                                     leased without renewal. Defaults
+                                                     to the `LEASE_DURATION` setting.
+            batch_size (int | None, optional): The maximum number of paths claimed
+                                               at once. Defaults to the
+                                               `LEASE_BATCH_SIZE` setting.
+            poll_interval (float | None, optional): The seconds waited before
+                                                    claiming again when every
+                                                    pending path is leased by
+                                                    others. Defaults to the
+                                                    `LEASE_POLL_INTERVAL` setting.
+        """
+        self._path: str | None = path
+        self._lease_duration: float | None = lease_duration
+        self._batch_size: int | None = batch_size
+        self._poll_interval: float | None = poll_interval
+
+    async def fetch(self, context: RequestContext) -> None:
+        """
+        Executes fetch using the leased request strategy.
+
+        Args:
+            context (RequestContext): The context with the paths added to the work
+                queue.
+        """
+        # Computed here rather than on creation, as the strategy is copied into
+        # worker processes.
+        self._owner: str = f'{gethostname()}:{getpid()}'
+        # The queue commits every call, waiting on the locks of the other
+        # processes, so it is used from one worker thread at a time.
+        self._queue_limiter: CapacityLimiter = CapacityLimiter(1)
+
+        with get_work_queue(
+            path=self._path, lease_duration=self._lease_duration
+        ) as self.work_queue:
+            if added := await to_thread.run_sync(
+                self.work_queue.add, context.paths, limiter=self._queue_limiter
+            ):
+                logger.info(f'Added {added} paths to the work queue.')
+
+            async with self._session(context), open_nursery() as nursery:
+                nursery.start_soon(self._renew_leases)
+                await self._send_requests(paths=())
+                nursery.cancel_scope.cancel()
+
+            # Paths left over by a drained run are claimed by the other processes
+            # right away.
+            await to_thread.run_sync(
+                self.work_queue.release, self._owner, limiter=self._queue_limiter
+            )
+
+    async def _feed(
+        self, send_channel: MemorySendChannel, paths: Iterable[str]
+    ) -> None:
+        """
+        Claims paths from the work queue and sends them into the work queue of the
+        run, until every path of the queue is completed.
+
+        Args:
+            send_channel (MemorySendChannel): The sending end of the work queue.
+            paths (Iterable[str]): Unused, the paths come from the work queue.
+        """
+        while True:
+            statistics: MemoryChannelStatistics = send_channel.statistics()
+            room: int = statistics.max_buffer_size - statistics.current_buffer_used
+            batch_size: int = self._batch_size or default_settings.lease_batch_size
+            claimed: list[str] = await to_thread.run_sync(
+                self.work_queue.claim,
+                self._owner,
+                max(min(batch_size, room), 1),
+                limiter=self._queue_limiter,
+            )
+
+            if not claimed:
+                if await to_thread.run_sync(
+                    self.work_queue.is_finished, limiter=self._queue_limiter
+                ):
+                    return None
+
+                # The remaining paths are leased, by this process or by others whose
+                # leases may expire.
+                await sleep(
+                    default_settings.lease_poll_interval
+                    if self._poll_interval is None
+                    else self._poll_interval
+                )
+                continue
+
+            for path in claimed:
+                if path in self.journal.completed:
+                    await to_thread.run_sync(
+                        self.work_queue.complete,
+                        path,
+                        DONE,
+                        limiter=self._queue_limiter,
+                    )
+                    continue
+
+                await self._enqueue(send_channel, path)
+
+    async def _complete(self, status: str, path: str) -> None:
+        """
+        Records the final status of a path in the journal and in the work queue.
+
+        Args:
+            status (str): Either `done` or `failed`.
+            path (str): The specific request path.
+        """
+        await super()._complete(status, path)
+        await to_thread.run_sync(
+            self.work_queue.complete, path, status, limiter=self._queue_limiter
+        )
+
+    async def _renew_leases(self) -> None:
+        """Renews the leases of the claimed paths three times per lease duration."""
+        while True:
+            await sleep(self.work_queue.lease_duration / 3)
+            await to_thread.run_sync(
+                self.work_queue.renew, self._owner, limiter=self._queue_limiter
+            )
@@ -0,0 +1,219 @@
+# Native Libraries
+import json
+import random
+from dataclasses import dataclass
+from os import makedirs
+from os.path import dirname
+from time import time
+from typing import Self, TextIO
+
+# Third-Party Libraries
+from httpx import codes
+from trio import current_time
+
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({
+    codes.REQUEST_TIMEOUT,
+    codes.TOO_MANY_REQUESTS,
+    codes.INTERNAL_SERVER_ERROR,
+    codes.BAD_GATEWAY,
+    codes.SERVICE_UNAVAILABLE,
+    codes.GATEWAY_TIMEOUT,
+})
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to back off between attempts.
+
+    Attributes:
+        max_attempts (int): The maximum number of attempts per URL.
+    """
+
+    def __init__(
+        self, max_attempts: int, backoff_base: float, backoff_max: float
+    ) -> None:
+        """
+        Args:
+            max_attempts (int): The maximum number of attempts per URL.
+            backoff_base (float): The delay before the first retry, doubled on every
+                attempt.
+            backoff_max (float): The upper bound of the exponential backoff.
+        """
+        self.max_attempts: int = max_attempts
+        self._backoff_base: float = backoff_base
+        self._backoff_max: float = backoff_max
+
+    @staticmethod
+    def is_retryable(status_code: int) -> bool:
+        """
+        Args:
+            status_code (int): The status code of a failed response.
+
+        Returns:
+            bool: True if the failure is transient and worth retrying, False for
+            permanent ones such as `501 Not Implemented`.
+        """
+        return status_code in RETRYABLE_STATUS_CODES
+
+    def get_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Computes the delay before the next attempt, using exponential backoff with
+        full jitter and never retrying earlier than the origin asked for.
+
+        Args:
+            attempt (int): The number of attempts already made.
+            retry_after (float | None, optional): The `Retry-After` delay sent by the
+                origin.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        backoff: float = min(
+            self._backoff_max, self._backoff_base * 2 ** (attempt - 1)
+        )
+
+        return max(random.uniform(backoff / 2, backoff), retry_after or 0.0)
+
+
+class CircuitBreaker:
+    """
+    A per-host circuit breaker.
+
+    After `threshold` consecutive failures a host is opened for `cooldown`
+    seconds, during which no request is sent to it. Once the cooldown is over
+    a single probe is let through: a success closes the circuit again, a
+    failure re-opens it.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """
+        Args:
+            threshold (int): Consecutive failures that open the circuit of a host.
+            cooldown (float): Seconds a host stays open before being probed again.
+        """
+        self._threshold: int = threshold
+        self._cooldown: float = cooldown
+        self._failures: dict[str, int] = {}
+        self._opened_until: dict[str, float] = {}
+
+    def get_wait_time(self, host: str) -> float:
+        """
+        Args:
+            host (str): The host of the request.
+
+        Returns:
+            float: Seconds until requests to the host are allowed again, 0 if they
+                are now.
+        """
+        if (opened_until := self._opened_until.get(host)) is None:
+            return 0.0
+
+        if (wait_time := opened_until - current_time()) > 0:
+            return wait_time
+
+        # Half-open: let one probe through and hold the others back for another
+        # cooldown.
+        self._opened_until[host] = current_time() + self._cooldown
+
+        return 0.0
+
+    def record_success(self, host: str) -> None:
+        """
+        Closes the circuit of a host.
+
+        Args:
+            host (str): The host of the request.
+        """
+        self._failures.pop(host, None)
+        self._opened_until.pop(host, None)
+
+    def record_failure(self, host: str) -> bool:
+        """
+        Counts a failure, opening the circuit of the host when it reaches the
+        threshold.
+
+        Args:
+            host (str): The host of the request.
+
+        Returns:
+            bool: True if the circuit has just been opened.
+        """
+        failures: int = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+
+        if failures < self._threshold:
+            return False
+
+        self._opened_until[host] = current_time() + self._cooldown
+        self._failures[host] = 0
+
+        return True
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """
+    A URL that permanently failed.
+
+    Attributes:
+        url (str): The URL of the request.
+        reason (str): The status code or error that made the last attempt fail.
+        attempts (int): The number of attempts made.
+        failed_at (float): The timestamp of the last attempt.
+    """
+
+    url: str
+    reason: str
+    attempts: int
+    failed_at: float
+
+
+class DeadLetterQueue:
+    """
+    An append-only JSON Lines file of the URLs that permanently failed during a run.
+
+    Attributes:
+        path (str): The path of the dead-letter file.
+        count (int): The number of dead letters recorded during the current run.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): The path of the dead-letter file.
+        """
+        self.path: str = path
+        self.count: int = 0
+        self._file: TextIO | None = None
+
+    def __enter__(self) -> Self:
+        if directory := dirname(self.path):
+            makedirs(directory, exist_ok=True)
+
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._file.close()
+        self._file = None
+
+    def record(self, url: str, reason: str, attempts: int) -> DeadLetter:
+        """
+        Appends a permanently failed URL to the file.
+
+        Args:
+            url (str): The URL of the request.
+            reason (str): The status code or error that made the last attempt fail.
+            attempts (int): The number of attempts made.
+
+        Returns:
+            DeadLetter: The recorded dead letter.
+        """
+        dead_letter: DeadLetter = DeadLetter(url, reason, attempts, time())
+
+        self._file.write(json.dumps(dead_letter.__dict__, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.count += 1
+
+        return dead_letter
@@ -4,15 +4,68 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class ClientSettings(BaseSettings):
     max_concurrent_requests: int = 185
+    processes: int = 1
+    queue_size: int = 100
     max_retry_attempts: int = 3
+    retry_backoff_base: float = 2.0
+    retry_backoff_max: float = 60.0
+    circuit_breaker_threshold: int = 20
+    circuit_breaker_cooldown: float = 30.0
+    failure_budget: int | None = None
     max_connections: int = 100
-    interval: int | float = 0
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    rate_limit: float | None = None
+    rate_limit_burst: int = 1
+    rate_limit_per_host: bool = False
+    adaptive_rate_limit: bool = True
+    min_rate_limit: float = 0.5
+    rate_limit_recovery: float = 0.05
+    rate_limit_url: str | None = None
     timeout: int | None = None
     follow_redirects: bool = True
+    chunk_size: int = 64 * 1024
+    validator_cache_path: str = './contents/validators.db'
+    page_store_backend: str = 'compressed'
+    page_store_path: str = './contents/pages.db'
+    page_store_compression_level: int = 3
+    dead_letter_path: str = './contents/dead_letters.jsonl'
+    journal_path: str = './contents/journal.tsv'
+    work_queue_backend: str = 'sqlite'
+    work_queue_path: str = './contents/work.db'
+    lease_duration: float = 60.0
+    lease_batch_size: int = 20
+    lease_poll_interval: float = 1.0
+    user_agent_cache_path: str = './contents/user_agents.db'
+    user_agent_pool_path: str | None = None
+    user_agent_reload_interval: float = 5.0
+    user_agent_stats_path: str = './contents/user_agent_stats.json'
+    progress_interval: float | None = 10.0
+    worker_log_level: str = 'INFO'
+    metrics_path: str | None = None
+
 
 default_settings: ClientSettings = ClientSettings()
 
 
+class ExtractionSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='extraction_')
+
+    workers: int | None = 1
+    chunk_size: int = 64
+    row_group_size: int = 10_000
+    incremental: bool = False
+    stream: bool = False
+    archive: bool = True
+    queue_size: int = 64
+    manifest_path: str = 'data/extraction_manifest.json'
+    price_history_path: str = 'data/manga_price_history'
+
+
+default_extraction_settings: ExtractionSettings = ExtractionSettings()
+
+
 class BaseConfig(SettingsConfigDict):
     env_file: str = '.env'
     env_file_encoding: str = 'utf-8'
@@ -0,0 +1,498 @@
+# Native Libraries
+import hashlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from time import time
+from typing import BinaryIO, Callable, Iterable, Iterator, Self
+
+# Third-Party Libraries
+import pyarrow as pa
+from httpx import URL
+
+# Local Modules
+from src.core.cache import SQLiteStore
+from src.core.settings import default_settings
+
+
+def canonicalize_url(url: URL | str) -> str:
+    """
+    Builds the key under which the page behind a URL is stored.
+
+    The scheme and host are lowercased, default ports and fragments are dropped
+    and query parameters are sorted, so equivalent URLs share a page while
+    `?page=N` URLs keep one page each.
+
+    Args:
+        url (URL | str): The absolute URL of the page.
+
+    Returns:
+        str: The canonical URL.
+    """
+    url = URL(url)
+
+    return str(url.copy_with(params=sorted(url.params.multi_items()), fragment=None))
+
+
+@dataclass(frozen=True)
+class PageVersion:
+    """
+    A version of a stored page.
+
+    Attributes:
+        version (int): The number of the version, starting at 1.
+        digest (str): The MD5 hash of the page body.
+        fetched_at (float): The timestamp at which the version was stored.
+    """
+
+    version: int
+    digest: str
+    fetched_at: float
+
+
+class PageStore(ABC):
+    """
+    Interface of the stores of the raw pages of the crawl, keyed by canonical URL.
+
+    Every body that differs from the latest one of its URL is kept as a new
+    version, so the history of a page remains available; a deleted page is no
+    longer listed, but its history is kept. Stores are opened and closed as
+    context managers.
+    """
+
+    @abstractmethod
+    def __enter__(self) -> Self:
+        pass
+
+    @abstractmethod
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, url: str, version: int | None = None) -> bytes | None:
+        """
+        Args:
+            url (str): The canonical URL of the page.
+            version (int | None, optional): The version to read, the latest one if
+                None.
+
+        Returns:
+            bytes | None: The page body, or None if the page or version is unknown.
+        """
+
+    @abstractmethod
+    def get_digest(self, url: str) -> str | None:
+        """
+        Args:
+            url (str): The canonical URL of the page.
+
+        Returns:
+            str | None: The digest of the latest version, or None if the page is
+                unknown.
+        """
+
+    @abstractmethod
+    def get_digests(self) -> dict[str, str]:
+        """
+        Returns:
+            dict[str, str]: The digest of the latest version of every page, keyed by
+                URL.
+        """
+
+    @abstractmethod
+    def get_versions(self, url: str) -> list[PageVersion]:
+        """
+        Args:
+            url (str): The canonical URL of the page.
+
+        Returns:
+            list[PageVersion]: Every version of the page, oldest first.
+        """
+
+    @abstractmethod
+    def put(self, url: str, page: bytes, digest: str | None = None) -> bool:
+        """
+        Stores a page body as the latest version of its URL, unless it is unchanged.
+
+        Args:
+            url (str): The canonical URL of the page.
+            page (bytes): The page body.
+            digest (str | None, optional): The MD5 hash of the body, computed if not
+                given.
+
+        Returns:
+            bool: True if a new version was stored, False if the body is unchanged.
+        """
+
+    def put_file(self, url: str, file: BinaryIO, digest: str) -> bool:
+        """
+        Stores a page body read from a file, e.g. one spooled while it was
+        downloaded, as the latest version of its URL, unless it is unchanged.
+
+        Args:
+            url (str): The canonical URL of the page.
+            file (BinaryIO): The file holding the page body, read from its start.
+            digest (str): The MD5 hash of the body.
+
+        Returns:
+            bool: True if a new version was stored, False if the body is unchanged.
+        """
+        file.seek(0)
+
+        return self.put(url, file.read(), digest)
+
+    @abstractmethod
+    def delete(self, url: str) -> bool:
+        """
+        Removes a page, e.g. one that no longer exists on the site, keeping its
+        history.
+
+        Args:
+            url (str): The canonical URL of the page.
+
+        Returns:
+            bool: True if the page was stored, False if it is unknown.
+        """
+
+    @abstractmethod
+    def iter_pages(
+        self, urls: Iterable[str] | None = None
+    ) -> Iterator[tuple[str, bytes]]:
+        """
+        Args:
+            urls (Iterable[str] | None, optional): The URLs to read, every page if
+                None.
+
+        Yields:
+            tuple[str, bytes]: The URL and the latest body of every page, ordered by
+                URL.
+        """
+
+    def put_many(self, pages: Iterable[tuple[str, bytes]]) -> int:
+        """
+        Stores several page bodies.
+
+        Args:
+            pages (Iterable[tuple[str, bytes]]): The URL and body of every page.
+
+        Returns:
+            int: The number of new versions stored.
+        """
+        return sum(self.put(url, page) for url, page in pages)
+
+
+class CompressedPageStore(SQLiteStore, PageStore):
+    """
+    A page store keeping zstd-compressed bodies in a single SQLite database.
+
+    Bodies are addressed by their digest, so identical bodies, whether versions
+    of the same URL or different URLs, are stored and compressed only once. The
+    versions of every URL point to those blobs, and the latest one of each URL
+    is indexed for change detection and sequential reads.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+    """
+
+    schema: tuple[str] = (
+        'CREATE TABLE IF NOT EXISTS blobs ('
+        'digest TEXT PRIMARY KEY, size INTEGER NOT NULL, data BLOB NOT NULL)',
+        'CREATE TABLE IF NOT EXISTS versions ('
+        'url TEXT NOT NULL, version INTEGER NOT NULL, digest TEXT NOT NULL, '
+        'fetched_at REAL NOT NULL, PRIMARY KEY (url, version))',
+        'CREATE TABLE IF NOT EXISTS pages ('
+        'url TEXT PRIMARY KEY, version INTEGER NOT NULL, digest TEXT NOT NULL)',
+    )
+
+    def __init__(
+        self,
+        path: str | None = None,
+        compression_level: int | None = None,
+        commit_interval: int = 100,
+    ) -> None:
+        """
+        Args:
+            path (str | None, optional): The path of the SQLite database file.
+                                         Defaults to the `PAGE_STORE_PATH` setting.
+            compression_level (int | None, optional): The zstd compression level.
+                                                      Defaults to the
+                                                      `PAGE_STORE_COMPRESSION_LEVEL`
+                                                      setting.
+            commit_interval (int, optional): Number of writes buffered before a
+                                             commit. Defaults to 100.
+        """
+        super().__init__(
+            path=path or default_settings.page_store_path,
+            commit_interval=commit_interval,
+        )
+        self._codec: pa.Codec = pa.Codec(
+            'zstd',
+            compression_level=(
+                default_settings.page_store_compression_level
+                if compression_level is None
+                else compression_level
+            ),
+        )
+
+    def get(self, url: str, version: int | None = None) -> bytes | None:
+        """
+        Args:
+            url (str): The canonical URL of the page.
+            version (int | None, optional): The version to read, the latest one if
+                None.
+
+        Returns:
+            bytes | None: The page body, or None if the page or version is unknown.
+        """
+        row: tuple | None = self._connection.execute(
+            'SELECT size, data FROM blobs WHERE digest = ('
+            'SELECT digest FROM pages WHERE url = ?)'
+            if version is None
+            else 'SELECT size, data FROM blobs WHERE digest = ('
+            'SELECT digest FROM versions WHERE url = ? AND version = ?)',
+            (url,) if version is None else (url, version),
+        ).fetchone()
+
+        return self._decompress(*row) if row else None
+
+    def get_digest(self, url: str) -> str | None:
+        """
+        Args:
+            url (str): The canonical URL of the page.
+
+        Returns:
+            str | None: The digest of the latest version, or None if the page is
+                unknown.
+        """
+        row: tuple | None = self._connection.execute(
+            'SELECT digest FROM pages WHERE url = ?', (url,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def get_digests(self) -> dict[str, str]:
+        """
+        Returns:
+            dict[str, str]: The digest of the latest version of every page, keyed by
+                URL.
+        """
+        return dict(self._connection.execute('SELECT url, digest FROM pages'))
+
+    def get_versions(self, url: str) -> list[PageVersion]:
+        """
+        Args:
+            url (str): The canonical URL of the page.
+
+        Returns:
+            list[PageVersion]: Every version of the page, oldest first.
+        """
+        return [
+            PageVersion(*row)
+            for row in self._connection.execute(
+                'SELECT version, digest, fetched_at FROM versions '
+                'WHERE url = ? ORDER BY version',
+                (url,),
+            )
+        ]
+
+    def put(self, url: str, page: bytes, digest: str | None = None) -> bool:
+        """
+        Stores a page body as the latest version of its URL, unless it is unchanged.
+
+        Args:
+            url (str): The canonical URL of the page.
+            page (bytes): The page body.
+            digest (str | None, optional): The MD5 hash of the body, computed if not
+                given.
+
+        Returns:
+            bool: True if a new version was stored, False if the body is unchanged.
+        """
+        return self._store(
+            url,
+            digest or hashlib.md5(page).hexdigest(),
+            lambda: (len(page), self._codec.compress(page, asbytes=True)),
+        )
+
+    def put_file(self, url: str, file: BinaryIO, digest: str) -> bool:
+        """
+        Stores a page body read from a file as the latest version of its URL,
+        unless it is unchanged.
+
+        The body is read and compressed `chunk_size` bytes at a time, each chunk
+        into a zstd frame of its own, so only its compressed form is ever held in
+        memory. The frames of a body are decompressed together, as a single one.
+
+        Args:
+            url (str): The canonical URL of the page.
+            file (BinaryIO): The file holding the page body, read from its start.
+            digest (str): The MD5 hash of the body.
+
+        Returns:
+            bool: True if a new version was stored, False if the body is unchanged.
+        """
+
+        def compress() -> tuple[int, bytes]:
+            file.seek(0)
+            size: int = 0
+            frames: list[bytes] = []
+
+            while chunk := file.read(default_settings.chunk_size):
+                size += len(chunk)
+                frames.append(self._codec.compress(chunk, asbytes=True))
+
+            return size, b''.join(frames)
+
+        return self._store(url, digest, compress)
+
+    def _store(
+        self, url: str, digest: str, compress: Callable[[], tuple[int, bytes]]
+    ) -> bool:
+        """
+        Args:
+            url (str): The canonical URL of the page.
+            digest (str): The MD5 hash of the body.
+            compress (Callable[[], tuple[int, bytes]]): Returns the size and the
+                compressed form of the body, only called if no blob holds it yet.
+
+        Returns:
+            bool: True if a new version was stored, False if the body is unchanged.
+        """
+        # The latest version is read and the next one written in a single write
+        # transaction, so processes sharing the store never number the same version
+        # twice.
+        self._begin()
+        latest: tuple | None = self._connection.execute(
+            'SELECT version, digest FROM pages WHERE url = ?', (url,)
+        ).fetchone()
+
+        if latest is not None and latest[1] == digest:
+            self._release()
+            return False
+
+        if (
+            self._connection.execute(
+                'SELECT 1 FROM blobs WHERE digest = ?', (digest,)
+            ).fetchone()
+            is None
+        ):
+            self._connection.execute(
+                'INSERT OR IGNORE INTO blobs VALUES (?, ?, ?)', (digest, *compress())
+            )
+
+        # A page stored again after being deleted continues its history.
+        version: int = (
+            latest[0]
+            if latest
+            else self._connection.execute(
+                'SELECT COALESCE(MAX(version), 0) FROM versions WHERE url = ?',
+                (url,),
+            ).fetchone()[0]
+        ) + 1
+        self._connection.execute(
+            'INSERT INTO versions VALUES (?, ?, ?, ?)',
+            (url, version, digest, time()),
+        )
+        # The three statements count as one write, so they are committed together.
+        self._execute(
+            'INSERT OR REPLACE INTO pages VALUES (?, ?, ?)', (url, version, digest)
+        )
+
+        return True
+
+    def put_many(self, pages: Iterable[tuple[str, bytes]]) -> int:
+        """
+        Stores several page bodies in a single transaction.
+
+        Args:
+            pages (Iterable[tuple[str, bytes]]): The URL and body of every page.
+
+        Returns:
+            int: The number of new versions stored.
+        """
+        stored: int = super().put_many(pages)
+        self._connection.commit()
+        self._pending_writes = 0
+
+        return stored
+
+    def delete(self, url: str) -> bool:
+        """
+        Removes a page, e.g. one that no longer exists on the site, keeping its
+        history.
+
+        Args:
+            url (str): The canonical URL of the page.
+
+        Returns:
+            bool: True if the page was stored, False if it is unknown.
+        """
+        deleted: bool = (
+            self._connection.execute(
+                'DELETE FROM pages WHERE url = ?', (url,)
+            ).rowcount
+            > 0
+        )
+        self._connection.commit()
+        self._pending_writes = 0
+
+        return deleted
+
+    def iter_pages(
+        self, urls: Iterable[str] | None = None
+    ) -> Iterator[tuple[str, bytes]]:
+        """
+        Reads the latest body of the pages, in a single sequential scan of the
+        store when reading every page, or through the index of the pages table
+        when reading some of them, so reading the changed pages of a run costs
+        the number of changed pages rather than the size of the store.
+
+        Args:
+            urls (Iterable[str] | None, optional): The URLs to read, every page if
+                None.
+
+        Yields:
+            tuple[str, bytes]: The URL and the latest body of every page, ordered by
+                URL.
+        """
+        if urls is None:
+            for url, size, data in self._connection.execute(
+                'SELECT pages.url, blobs.size, blobs.data '
+                'FROM pages JOIN blobs USING (digest) ORDER BY pages.url'
+            ):
+                yield url, self._decompress(size, data)
+
+            return None
+
+        for url in sorted(set(urls)):
+            if (page := self.get(url)) is not None:
+                yield url, page
+
+    def _decompress(self, size: int, data: bytes) -> bytes:
+        """
+        Args:
+            size (int): The size of the uncompressed body.
+            data (bytes): The compressed body.
+
+        Returns:
+            bytes: The page body.
+        """
+        return self._codec.decompress(data, decompressed_size=size, asbytes=True)
+
+
+PAGE_STORES: dict[str, type[PageStore]] = {
+    'compressed': CompressedPageStore,
+}
+
+
+def get_page_store(backend: str | None = None, **kwargs) -> PageStore:
+    """
+    Args:
+        backend (str | None, optional): The name of the page store in `PAGE_STORES`.
+                                        Defaults to the `PAGE_STORE_BACKEND` setting.
+        **kwargs: Options of the store overriding its default settings, e.g.
+            `commit_interval`.
+
+    Returns:
+        PageStore: A new, unopened store of the backend.
+    """
+    return PAGE_STORES[backend or default_settings.page_store_backend](**kwargs)
@@ -0,0 +1,431 @@
+# Native Libraries
+from abc import ABC, abstractmethod
+from time import time
+from typing import Any, Iterable, Self
+
+# Third-Party Libraries
+from httpx import Client, Response
+
+# Local Modules
+from src.core.cache import SQLiteStore
+from src.core.journal import DONE, FAILED, PENDING
+from src.core.settings import default_settings
+
+
+class WorkQueue(ABC):
+    """
+    Interface of the work queues shared by the processes of a coordinated crawl.
+
+    Every path is claimed with a lease of `lease_duration` seconds, which its
+    owner renews while working on it; paths whose lease expired, e.g. because
+    their owner crashed, are claimed again by the others. Each path is leased by
+    a single owner at a time. Queues are opened and closed as context managers.
+
+    The backend is picked by the `WORK_QUEUE_BACKEND` setting among
+    `WORK_QUEUES`: `sqlite` for the processes of a single machine, or `http` for
+    the processes of several machines, through a `Coordinator`.
+
+    Attributes:
+        lease_duration (float): The seconds a claimed path stays leased without
+            renewal.
+    """
+
+    lease_duration: float
+
+    @abstractmethod
+    def __enter__(self) -> Self:
+        pass
+
+    @abstractmethod
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    @abstractmethod
+    def add(self, paths: Iterable[str]) -> int:
+        """
+        Adds paths to the queue, leaving the ones it already holds untouched.
+
+        Args:
+            paths (Iterable[str]): The paths to crawl.
+
+        Returns:
+            int: The number of paths added.
+        """
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Removes every path, before the queue is filled for a new crawl."""
+
+    @abstractmethod
+    def claim(self, owner: str, count: int) -> list[str]:
+        """
+        Leases pending paths that are not leased yet, or whose lease expired.
+
+        Args:
+            owner (str): The identifier of the claiming process.
+            count (int): The maximum number of paths claimed.
+
+        Returns:
+            list[str]: The claimed paths, empty if none is available.
+        """
+
+    @abstractmethod
+    def renew(self, owner: str) -> None:
+        """
+        Extends the leases of every path an owner is working on.
+
+        Args:
+            owner (str): The identifier of the owning process.
+        """
+
+    @abstractmethod
+    def complete(self, path: str, status: str) -> None:
+        """
+        Records the final status of a path, whichever process finishes it.
+
+        A path completed by several processes, e.g. after its lease expired while
+        it was in flight, keeps the first status, unless a later attempt succeeded.
+
+        Args:
+            path (str): The path of the request.
+            status (str): Either `done` or `failed`.
+        """
+
+    @abstractmethod
+    def release(self, owner: str) -> None:
+        """
+        Gives up the leases of an owner, so its pending paths are claimed right away.
+
+        Args:
+            owner (str): The identifier of the owning process.
+        """
+
+    @abstractmethod
+    def get_counts(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: The number of paths of every status.
+        """
+
+    @abstractmethod
+    def is_finished(self) -> bool:
+        """
+        Returns:
+            bool: Whether every path is done or failed.
+        """
+
+
+class SQLiteWorkQueue(SQLiteStore, WorkQueue):
+    """
+    A work table shared by the processes of a coordinated crawl on one machine.
+
+    Claims, renewals and completions are single statements committed right away,
+    so the table never stays locked. The table lives in a SQLite database in WAL
+    mode, which needs a local filesystem, so it cannot be shared through a
+    network filesystem: the processes of several machines reach it through a
+    `Coordinator` instead.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+        lease_duration (float): The seconds a claimed path stays leased without
+            renewal.
+    """
+
+    schema: tuple[str] = (
+        'CREATE TABLE IF NOT EXISTS work ('
+        'path TEXT PRIMARY KEY, status TEXT NOT NULL, owner TEXT, '
+        'lease_expires REAL, '
+        'claims INTEGER NOT NULL DEFAULT 0, finished_at REAL)',
+        'CREATE INDEX IF NOT EXISTS work_leases ON work (status, lease_expires)',
+    )
+
+    def __init__(
+        self,
+        path: str | None = None,
+        lease_duration: float | None = None,
+    ) -> None:
+        """
+        Args:
+            path (str | None, optional): The path of the SQLite database file.
+                                         Defaults to the `WORK_QUEUE_PATH` setting.
+            lease_duration (float | None, optional): The seconds a claimed path stays
+                                                     leased without renewal. Defaults
+                                                     to the `LEASE_DURATION` setting.
+        """
+        super().__init__(
+            path=path or default_settings.work_queue_path, commit_interval=1
+        )
+        self.lease_duration: float = (
+            default_settings.lease_duration
+            if lease_duration is None
+            else lease_duration
+        )
+
+    def add(self, paths: Iterable[str]) -> int:
+        """
+        Adds paths to the table, leaving the ones it already holds untouched.
+
+        Args:
+            paths (Iterable[str]): The paths to crawl.
+
+        Returns:
+            int: The number of paths added.
+        """
+        added: int = self._connection.executemany(
+            'INSERT OR IGNORE INTO work (path, status) VALUES (?, ?)',
+            ((path, PENDING) for path in paths),
+        ).rowcount
+        self._connection.commit()
+
+        return added
+
+    def reset(self) -> None:
+        """Removes every path, before the table is filled for a new crawl."""
+        self._execute('DELETE FROM work', ())
+
+    def claim(self, owner: str, count: int) -> list[str]:
+        """
+        Leases pending paths that are not leased yet, or whose lease expired.
+
+        Args:
+            owner (str): The identifier of the claiming process.
+            count (int): The maximum number of paths claimed.
+
+        Returns:
+            list[str]: The claimed paths, empty if none is available.
+        """
+        now: float = time()
+        paths: list[str] = [
+            path
+            for (path,) in self._connection.execute(
+                'UPDATE work SET owner = ?, lease_expires = ?, claims = claims + 1 '
+                'WHERE path IN (SELECT path FROM work WHERE status = ? '
+                'AND (lease_expires IS NULL OR lease_expires < ?) LIMIT ?) '
+                'RETURNING path',
+                (owner, now + self.lease_duration, PENDING, now, count),
+            )
+        ]
+        self._connection.commit()
+
+        return paths
+
+    def renew(self, owner: str) -> None:
+        """
+        Extends the leases of every path an owner is working on.
+
+        Args:
+            owner (str): The identifier of the owning process.
+        """
+        self._execute(
+            'UPDATE work SET lease_expires = ? WHERE owner = ? AND status = ?',
+            (time() + self.lease_duration, owner, PENDING),
+        )
+
+    def complete(self, path: str, status: str) -> None:
+        """
+        Records the final status of a path, whichever process finishes it.
+
+        A path completed by several processes, e.g. after its lease expired while
+        it was in flight, keeps the first status, unless a later attempt succeeded.
+
+        Args:
+            path (str): The path of the request.
+            status (str): Either `done` or `failed`.
+        """
+        self._execute(
+            'UPDATE work SET status = ?, owner = NULL, lease_expires = NULL, '
+            'finished_at = ? '
+            'WHERE path = ? AND (status = ? OR (status = ? AND ? = ?))',
+            (status, time(), path, PENDING, FAILED, status, DONE),
+        )
+
+    def release(self, owner: str) -> None:
+        """
+        Gives up the leases of an owner, so its pending paths are claimed right away.
+
+        Args:
+            owner (str): The identifier of the owning process.
+        """
+        self._execute(
+            'UPDATE work SET owner = NULL, lease_expires = NULL '
+            'WHERE owner = ? AND status = ?',
+            (owner, PENDING),
+        )
+
+    def get_counts(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: The number of paths of every status.
+        """
+        return dict(
+            self._connection.execute(
+                'SELECT status, COUNT(*) FROM work GROUP BY status'
+            )
+        )
+
+    def is_finished(self) -> bool:
+        """
+        Returns:
+            bool: Whether every path is done or failed.
+        """
+        return (
+            self._connection.execute(
+                'SELECT 1 FROM work WHERE status = ? LIMIT 1', (PENDING,)
+            ).fetchone()
+            is None
+        )
+
+
+class HTTPWorkQueue(WorkQueue):
+    """
+    A work queue served over HTTP by a `Coordinator`, so the processes of several
+    machines claim the paths of the same crawl.
+
+    Every call is a request to the coordinator, which keeps the paths in a
+    `SQLiteWorkQueue` of its own machine and times the leases with its own
+    clock, so the clocks of the machines do not have to agree.
+
+    Attributes:
+        url (str): The root URL of the coordinator.
+        lease_duration (float): The seconds a claimed path stays leased without
+            renewal, set by the coordinator.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        lease_duration: float | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            path (str | None, optional): The root URL of the coordinator, e.g.
+                                         'http://10.0.0.2:8765'. Defaults to the
+                                         `WORK_QUEUE_PATH` setting.
+            lease_duration (float | None, optional): Unused, as the leases are
+                                                     granted by the coordinator
+                                                     for its own duration.
+            timeout (float, optional): The seconds a call waits for the
+                                       coordinator. Defaults to 30.0.
+        """
+        self.url: str = path or default_settings.work_queue_path
+        self._timeout: float = timeout
+        self._client: Client | None = None
+
+    def __enter__(self) -> Self:
+        self._client = Client(base_url=self.url, timeout=self._timeout)
+        self.lease_duration = self._call('lease_duration')
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._client.close()
+        self._client = None
+
+    def add(self, paths: Iterable[str]) -> int:
+        """
+        Adds paths to the queue, leaving the ones it already holds untouched.
+
+        Args:
+            paths (Iterable[str]): The paths to crawl.
+
+        Returns:
+            int: The number of paths added.
+        """
+        return self._call('add', paths=list(paths))
+
+    def reset(self) -> None:
+        """Removes every path, before the queue is filled for a new crawl."""
+        self._call('reset')
+
+    def claim(self, owner: str, count: int) -> list[str]:
+        """
+        Leases pending paths that are not leased yet, or whose lease expired.
+
+        Args:
+            owner (str): The identifier of the claiming process.
+            count (int): The maximum number of paths claimed.
+
+        Returns:
+            list[str]: The claimed paths, empty if none is available.
+        """
+        return self._call('claim', owner=owner, count=count)
+
+    def renew(self, owner: str) -> None:
+        """
+        Extends the leases of every path an owner is working on.
+
+        Args:
+            owner (str): The identifier of the owning process.
+        """
+        self._call('renew', owner=owner)
+
+    def complete(self, path: str, status: str) -> None:
+        """
+        Records the final status of a path, whichever process finishes it.
+
+        Args:
+            path (str): The path of the request.
+            status (str): Either `done` or `failed`.
+        """
+        self._call('complete', path=path, status=status)
+
+    def release(self, owner: str) -> None:
+        """
+        Gives up the leases of an owner, so its pending paths are claimed right away.
+
+        Args:
+            owner (str): The identifier of the owning process.
+        """
+        self._call('release', owner=owner)
+
+    def get_counts(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: The number of paths of every status.
+        """
+        return self._call('get_counts')
+
+    def is_finished(self) -> bool:
+        """
+        Returns:
+            bool: Whether every path is done or failed.
+        """
+        return self._call('is_finished')
+
+    def _call(self, operation: str, **arguments) -> Any:
+        """
+        Args:
+            operation (str): The name of the work queue method to call.
+            **arguments: The arguments of the method.
+
+        Returns:
+            Any: The result of the method on the queue of the coordinator.
+
+        Raises:
+            HTTPStatusError: If the coordinator could not carry out the call.
+        """
+        response: Response = self._client.post(f'/work/{operation}', json=arguments)
+        response.raise_for_status()
+
+        return response.json()['result']
+
+
+WORK_QUEUES: dict[str, type[WorkQueue]] = {
+    'sqlite': SQLiteWorkQueue,
+    'http': HTTPWorkQueue,
+}
+
+
+def get_work_queue(backend: str | None = None, **kwargs) -> WorkQueue:
+    """
+    Args:
+        backend (str | None, optional): The name of the work queue in `WORK_QUEUES`.
+                                        Defaults to the `WORK_QUEUE_BACKEND` setting.
+        **kwargs: Options of the queue overriding its default settings, e.g.
+            `lease_duration`.
+
+    Returns:
+        WorkQueue: A new, unopened queue of the backend.
+    """
+    return WORK_QUEUES[backend or default_settings.work_queue_backend](**kwargs)
@@ -2,20 +2,27 @@
 from typing import Iterable, List, Literal
 
 # Third-Party Libraries
+from loguru import logger
 from trio import run
 
 # Local Modules
+from src.core.journal import CrawlJournal
+from src.core.processes import fetch_in_processes
 from src.core.requester import (
     RequestContext,
     RequestStrategy,
     SimpleRequestStrategy,
 )
+from src.core.settings import default_settings
+from src.core.work import WorkQueue, get_work_queue
 
 
 def fetch(
     base_url: str = '',
     paths: Iterable[str] | List[Literal['/']] = ['/'],
     request_strategy: RequestStrategy = SimpleRequestStrategy(),
+    resume: bool = False,
+    processes: int | None = None,
 ) -> None:
     """
     This function performs asynchronous HTTP requests to multiple paths
@@ -24,13 +31,58 @@ def fetch(
 
     Args:
         base_url (str): The base URL for all HTTP requests.
-        paths (Iterable[str] | List[Literal['/']], optional): The endpoint paths
-                                                              for requests. Defaults to ['/'] if not specified.
-        request_strategy (RequestStrategy, optional): The strategy used for managing HTTP requests,
-                                                       e.g., `SimpleRequestStrategy`
-                                                       or    `PaginatedRequestStrategy`.
-                                                       Defaults to `SimpleRequestStrategy`.
+        paths (Iterable[str] | List[Literal['/']], optional): The endpoint paths for
+            requests. Defaults to ['/'] if not specified.
+        request_strategy (RequestStrategy, optional): The strategy used for managing
+            HTTP requests, e.g., `SimpleRequestStrategy` or
+            `PaginatedRequestStrategy`. Defaults to `SimpleRequestStrategy`.
+        resume (bool, optional): Whether to resume an interrupted crawl, skipping the
+                                 paths it already completed. Defaults to False.
+        processes (int | None, optional): The number of worker processes the paths
+                                          are split across, each running its own
+                                          event loop. Defaults to the `PROCESSES`
+                                          setting.
     """
-    return run(
-        request_strategy.fetch, RequestContext(base_url=base_url, paths=paths)
+    processes = processes or default_settings.processes
+    context: RequestContext = RequestContext(
+        base_url=base_url, paths=paths, resume=resume
     )
+
+    if processes > 1 and not request_strategy.partitionable:
+        logger.warning(
+            f'{type(request_strategy).__name__} cannot be split across processes, '
+            'running it in a single one.'
+        )
+        processes = 1
+
+    if processes > 1:
+        return fetch_in_processes(request_strategy, context, processes)
+
+    return run(request_strategy.fetch, context)
+
+
+def seed_work(paths: Iterable[str], reset: bool = True) -> int:
+    """
+    Fills the shared work queue of a coordinated crawl, before the processes of the
+    machine run `fetch` with a `LeasedRequestStrategy` and claim its paths.
+
+    Args:
+        paths (Iterable[str]): The paths to crawl.
+        reset (bool, optional): Whether to remove the paths of the previous crawl,
+                                completed or not, and truncate its journal first.
+                                Defaults to True.
+
+    Returns:
+        int: The number of paths added.
+    """
+    work_queue: WorkQueue
+
+    with get_work_queue() as work_queue:
+        if reset:
+            work_queue.reset()
+
+            # The processes append to the shared journal, so it is truncated here.
+            with CrawlJournal(path=default_settings.journal_path):
+                pass
+
+        return work_queue.add(paths)
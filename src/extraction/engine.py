@@ -0,0 +1,194 @@
+# Native Libraries
+import re
+from typing import Iterable
+
+# Third-Party Libraries
+import pyarrow as pa
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+# Local Modules
+from src.extraction.static import allowed_content_keys, columns_replace_mapping
+from src.extraction.utils import replace_columns
+
+CONTENT_SELECTOR: str = '.entry-content'
+IGNORED_TABLE_HEADER: str = 'título editora'
+# A header and at least two rows, the second one deciding whether the table fits.
+MIN_TABLE_ROWS: int = 3
+TAG_PATTERN: re.Pattern = re.compile(r'^(Nº de\s*)?|^[\s:]+|[\s:]+$')
+
+
+class PageExtractor:
+    """
+    Extracts the informative content and the price tables of a manga page in a single
+    parse.
+
+    The page is parsed once with Lexbor, and each rule runs a single native
+    query on it: the keys of the first `.entry-content` cell both decide the
+    layout and, in the `td` layout, make the informative content, the first
+    paragraph is only queried in the `p` layout, and the tables come from one
+    query. The key filter, the cleaning pattern and the column mapping are
+    compiled when the extractor is created.
+
+    The `td` layout is used when the first cell of the content holds more than
+    one `<strong>` key, and the first table is then skipped as the informative
+    one. Every row of the other price tables is kept, in a record batch per
+    page, so prices reach the datasets without a dictionary per row.
+    """
+
+    def __init__(
+        self,
+        allowed_keys: Iterable[str] = allowed_content_keys,
+        column_mapping: Iterable[tuple[str, str]] = columns_replace_mapping,
+    ) -> None:
+        """
+        Args:
+            allowed_keys (Iterable[str], optional): The keys kept from the
+                informative content. Defaults to `allowed_content_keys`.
+            column_mapping (Iterable[tuple[str, str]], optional): The renaming of the
+                table columns. Defaults to `columns_replace_mapping`.
+        """
+        self._allowed_keys: frozenset[str] = frozenset(allowed_keys)
+        self._column_mapping: tuple[tuple[str, str], ...] = tuple(column_mapping)
+
+    def extract(
+        self, page: bytes, manga: str
+    ) -> tuple[dict[str, str] | None, pa.RecordBatch | None]:
+        """
+        Args:
+            page (bytes): The HTML content of the page.
+            manga (str): The name of the manga.
+
+        Returns:
+            tuple[dict[str, str] | None, pa.RecordBatch | None]: The informative
+                content and the price rows of the page, each None when the page has
+                none.
+        """
+        parser: LexborHTMLParser = LexborHTMLParser(page)
+
+        # The keys of the first cell decide the layout, and are the informative
+        # content itself in the `td` layout, so they are only queried once.
+        first_cell: LexborNode | None = parser.css_first(f'{CONTENT_SELECTOR} td')
+        strongs: list[LexborNode] | None = (
+            first_cell.css('strong') if first_cell is not None else []
+        )
+        is_cell_layout: bool = len(strongs) > 1
+
+        if not is_cell_layout:
+            paragraph: LexborNode | None = parser.css_first(f'{CONTENT_SELECTOR} p')
+            strongs = paragraph.css('strong') if paragraph is not None else None
+
+        informative_content: dict[str, str] | None = (
+            self._get_informative_content(strongs, manga)
+            if strongs is not None
+            else None
+        )
+
+        return informative_content, self._get_price_batch(
+            parser.css('table'), is_cell_layout, manga
+        )
+
+    def _get_informative_content(
+        self, strongs: list[LexborNode], manga: str
+    ) -> dict[str, str]:
+        """
+        Args:
+            strongs (list[LexborNode]): The `<strong>` keys of the informative block.
+            manga (str): The name of the manga.
+
+        Returns:
+            dict[str, str]: The allowed keys and the text following each of them.
+        """
+        content: dict[str, str] = {}
+
+        for strong in strongs:
+            key: str = TAG_PATTERN.sub('', strong.text()).lower()
+
+            if key not in self._allowed_keys:
+                continue
+
+            value: LexborNode | None = strong.next
+            content[key] = TAG_PATTERN.sub(
+                '', value.text() if value is not None else ''
+            ).lower()
+
+        content['manga'] = manga
+
+        return content
+
+    def _get_price_batch(
+        self, tables: list[LexborNode], is_cell_layout: bool, manga: str
+    ) -> pa.RecordBatch | None:
+        """
+        Collects every row of every price table into one buffer per column.
+
+        The header of each table is normalized once, and its cells are appended
+        column by column; columns missing from a table are padded with nulls.
+
+        Args:
+            tables (list[LexborNode]): Every table of the document.
+            is_cell_layout (bool): Whether the first table holds the informative
+                content.
+            manga (str): The name of the manga.
+
+        Returns:
+            pa.RecordBatch | None: The rows of the price tables as text columns, plus
+            the `manga` column, or None if the page has no price table.
+        """
+        if len(tables) <= 1:
+            return None
+
+        buffers: dict[str, list[str | None]] = {}
+        size: int = 0
+
+        for table in tables[1:] if is_cell_layout else tables:
+            rows: list[LexborNode] = table.css('tr')
+
+            if len(rows) < MIN_TABLE_ROWS:
+                continue
+
+            header: str = rows[0].text()
+            columns: list[str] = header.strip('\n\t ').lower().split('\n')
+            # Cells are read from the children of each row, cheaper than a query per
+            # row.
+            cells: list[list[LexborNode]] = [
+                [cell for cell in row.iter() if cell.tag == 'td'] for row in rows[1:]
+            ]
+
+            if (
+                len(cells[1]) > len(columns)
+                or header.strip().lower() == IGNORED_TABLE_HEADER
+            ):
+                continue
+
+            replace_columns(columns=columns, mapping=self._column_mapping)
+            # Rows without data cells, e.g. repeated `th` headers, are left out.
+            cells = [row for row in cells if row]
+
+            # A repeated column keeps its last cell, as the row dictionaries used to.
+            positions: dict[str, int] = {
+                column: index for index, column in enumerate(columns)
+            }
+
+            for column, index in positions.items():
+                buffer: list[str | None] = buffers.setdefault(column, [None] * size)
+                buffer.extend(
+                    row[index].text() if index < len(row) else None for row in cells
+                )
+
+            size += len(cells)
+
+            for buffer in buffers.values():
+                buffer.extend([None] * (size - len(buffer)))
+
+        if not size:
+            return None
+
+        buffers['manga'] = [manga] * size
+
+        return pa.RecordBatch.from_arrays(
+            [pa.array(buffer, pa.string()) for buffer in buffers.values()],
+            names=list(buffers),
+        )
+
+
+default_page_extractor: PageExtractor = PageExtractor()
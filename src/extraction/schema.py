@@ -0,0 +1,372 @@
+# Native Libraries
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable
+
+# Third-Party Libraries
+import pyarrow as pa
+from loguru import logger
+from pyarrow.parquet import read_schema
+
+INTEGER: str = 'integer'
+DATE: str = 'date'
+DECIMAL: str = 'decimal'
+CATEGORY: str = 'category'
+
+ARROW_TYPES: dict[str, pa.DataType] = {
+    INTEGER: pa.int32(),
+    DATE: pa.date32(),
+    DECIMAL: pa.decimal128(10, 2),
+    CATEGORY: pa.dictionary(pa.int32(), pa.string()),
+}
+
+CATALOG_SCHEMA: dict[str, str] = {
+    'publisher': CATEGORY,
+    'demography': CATEGORY,
+    'year': INTEGER,
+}
+
+INFORMATION_SCHEMA: dict[str, str] = {
+    'editora original': CATEGORY,
+    'editora brasileira (1)': CATEGORY,
+    'editora brasileira (2)': CATEGORY,
+    'formato': CATEGORY,
+    'miolo': CATEGORY,
+    'acabamento': CATEGORY,
+    'periodicidade': CATEGORY,
+    'volumes': INTEGER,
+    'volumes no japão': INTEGER,
+    'volumes no brasil': INTEGER,
+    'volumes no brasil (1)': INTEGER,
+    'volumes no brasil (2)': INTEGER,
+    'volumes no japão/frança': INTEGER,
+    'volumes nos eua e japão': INTEGER,
+}
+
+PRICE_TRACKING_SCHEMA: dict[str, str] = {
+    'vol': INTEGER,
+    'cap': INTEGER,
+    'data de lançamento': DATE,
+    'data no brasil': DATE,
+    'data no japão': DATE,
+    'preço': DECIMAL,
+}
+
+# The largest values the Arrow types hold, beyond which a value is rejected.
+MAX_INTEGER: int = 2**31 - 1
+MAX_DECIMAL: Decimal = Decimal(10) ** (
+    ARROW_TYPES[DECIMAL].precision - ARROW_TYPES[DECIMAL].scale
+) - Decimal('0.01')
+
+# Years written with two digits, taken as years of the 2000s.
+TWO_DIGIT_YEARS: int = 100
+
+MISSING_VALUES: frozenset[str] = frozenset({'', '-', '—', '?', 'n/a'})
+
+MONTHS: dict[str, int] = {
+    month: number
+    for number, month in enumerate(
+        (
+            'jan',
+            'fev',
+            'mar',
+            'abr',
+            'mai',
+            'jun',
+            'jul',
+            'ago',
+            'set',
+            'out',
+            'nov',
+            'dez',
+        ),
+        start=1,
+    )
+}
+
+
+def parse_integer(value: str) -> int:
+    """
+    Parses the leading number of a value, e.g. '20 (completo)' into 20, or
+    '1.000' into 1000, dots separating the thousands in Brazilian Portuguese.
+
+    Args:
+        value (str): The extracted text.
+
+    Returns:
+        int: The parsed number.
+
+    Raises:
+        ValueError: If the value is not a number or does not fit in an int32.
+    """
+    if (match := re.match(r'\s*(\d{1,3}(?:\.\d{3})+|\d+)', value)) is None:
+        raise ValueError(f'not an integer: {value!r}')
+
+    if (number := int(match.group(1).replace('.', ''))) > MAX_INTEGER:
+        raise ValueError(f'integer out of range: {value!r}')
+
+    return number
+
+
+def parse_date(value: str) -> date:
+    """
+    Parses a release date written as 'dd/mm/yyyy', 'mm/yyyy' or 'month/yyyy'
+    (Portuguese month names); dates without a day fall on the first of the month.
+
+    Args:
+        value (str): The extracted text.
+
+    Returns:
+        date: The parsed date.
+    """
+    text: str = value.strip().lower()
+
+    if match := re.fullmatch(r'(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})', text):
+        day, month, year = map(int, match.groups())
+        return date(year + 2000 if year < TWO_DIGIT_YEARS else year, month, day)
+
+    if match := re.fullmatch(r'(\d{1,2})/(\d{4})', text):
+        month, year = map(int, match.groups())
+        return date(year, month, 1)
+
+    if match := re.fullmatch(
+        r'([a-zç]{3})[a-zç]*\.?(?:/|\s+de\s+|\s+)(\d{4})', text
+    ):
+        if (month := MONTHS.get(match.group(1))) is not None:
+            return date(int(match.group(2)), month, 1)
+
+    raise ValueError(f'not a date: {value!r}')
+
+
+def parse_decimal(value: str) -> Decimal:
+    """
+    Parses a price such as 'R$ 1.029,90' or '29.90' into a decimal with two places.
+
+    Args:
+        value (str): The extracted text.
+
+    Returns:
+        Decimal: The parsed price.
+
+    Raises:
+        ValueError: If the value is not a price or has more than 8 integer digits.
+    """
+    text: str = value.lower().replace('r$', '').strip()
+
+    if ',' in text:
+        text = text.replace('.', '').replace(',', '.')
+
+    if not re.fullmatch(r'\d+(\.\d{1,2})?', text):
+        raise ValueError(f'not a price: {value!r}')
+
+    if (price := Decimal(text).quantize(Decimal('0.01'))) > MAX_DECIMAL:
+        raise ValueError(f'price out of range: {value!r}')
+
+    return price
+
+
+def parse_category(value: str) -> str:
+    """
+    Args:
+        value (str): The extracted text.
+
+    Returns:
+        str: The value without surrounding whitespace.
+    """
+    return value.strip()
+
+
+PARSERS: dict[str, Callable[[str], Any]] = {
+    INTEGER: parse_integer,
+    DATE: parse_date,
+    DECIMAL: parse_decimal,
+    CATEGORY: parse_category,
+}
+
+
+@dataclass(frozen=True)
+class RejectedValue:
+    """
+    A value that does not fit the type of its column.
+
+    Attributes:
+        column (str): The column of the value.
+        value (str): The extracted text.
+        key (str | None): The key of the row holding the value, e.g. the manga.
+    """
+
+    column: str
+    value: str
+    key: str | None
+
+
+class SchemaValidator:
+    """
+    Coerces the extracted rows of a dataset into typed values.
+
+    Columns listed in the schema are parsed into integers, dates, decimals or
+    dictionary-encoded categories; the other columns are kept as text. Values
+    that cannot be parsed are stored as null and recorded, so they can be
+    reported at the end of the run instead of silently reaching the datasets.
+
+    Attributes:
+        dataset (str): The name of the dataset.
+        arrow_schema (pa.Schema): The Arrow types of the typed columns.
+        rejected (list[RejectedValue]): The values rejected so far.
+    """
+
+    def __init__(
+        self, dataset: str, schema: dict[str, str], key: str = 'manga'
+    ) -> None:
+        """
+        Args:
+            dataset (str): The name of the dataset.
+            schema (dict[str, str]): The kind (`integer`, `date`, `decimal` or
+                                     `category`) of every typed column.
+            key (str, optional): The column identifying a row in the report. Defaults
+                to 'manga'.
+        """
+        self.dataset: str = dataset
+        self.arrow_schema: pa.Schema = pa.schema([
+            (column, ARROW_TYPES[kind]) for column, kind in schema.items()
+        ])
+        self.rejected: list[RejectedValue] = []
+        self._parsers: dict[str, Callable[[str], Any]] = {
+            column: PARSERS[kind] for column, kind in schema.items()
+        }
+        self._key: str = key
+
+    def coerce(self, row: dict[str, Any]) -> dict[str, Any]:
+        """
+        Parses the typed columns of a row.
+
+        Args:
+            row (dict[str, Any]): The extracted row.
+
+        Returns:
+            dict[str, Any]: The row with typed values, None where a value is missing
+                or rejected.
+        """
+        coerced: dict[str, Any] = dict(row)
+
+        for column, value in row.items():
+            if column in self._parsers:
+                coerced[column] = self._parse(column, value, row.get(self._key))
+
+        return coerced
+
+    def coerce_batch(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Parses the typed columns of a batch of rows, column by column.
+
+        Args:
+            batch (pa.RecordBatch): The extracted rows, as text columns.
+
+        Returns:
+            pa.RecordBatch: The batch with its typed columns converted to their Arrow
+            types, null where a value is missing or rejected.
+        """
+        names: list[str] = batch.schema.names
+        keys: list[Any] = (
+            batch.column(self._key).to_pylist()
+            if self._key in names
+            else [None] * len(batch)
+        )
+        columns: list[pa.Array] = [
+            pa.array(
+                [
+                    self._parse(name, value, key)
+                    for value, key in zip(column.to_pylist(), keys)
+                ],
+                type=self.arrow_schema.field(name).type,
+            )
+            if name in self._parsers
+            else column
+            for name, column in zip(names, batch.columns)
+        ]
+
+        return pa.RecordBatch.from_arrays(columns, names=names)
+
+    def is_compatible(self, path: str) -> bool:
+        """
+        Checks whether a stored dataset was written with the same column types.
+
+        Args:
+            path (str): The path of the Parquet file.
+
+        Returns:
+            bool: True if every typed column of the file has the type of the schema.
+        """
+        stored: pa.Schema = read_schema(path)
+
+        return all(
+            stored.field(field.name).type == field.type
+            for field in self.arrow_schema
+            if field.name in stored.names
+        )
+
+    def report(self, path: str) -> None:
+        """
+        Writes the rejected values to a JSON Lines file and logs a summary per
+        column.
+
+        Args:
+            path (str): The path of the report file.
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            file.writelines(
+                json.dumps(rejected.__dict__, ensure_ascii=False) + '\n'
+                for rejected in self.rejected
+            )
+
+        if not self.rejected:
+            return None
+
+        counts: Counter[str] = Counter(rejected.column for rejected in self.rejected)
+        summary: str = ', '.join(
+            f'{column}: {count}' for column, count in counts.most_common()
+        )
+
+        logger.warning(
+            f'{len(self.rejected)} values of {self.dataset} do not fit their type '
+            f'and were stored as null ({summary}), see {path}.'
+        )
+
+    def _parse(self, column: str, value: Any, key: Any) -> Any:
+        """
+        Args:
+            column (str): The typed column of the value.
+            value (Any): The extracted value, parsed only if it is text.
+            key (Any): The key of the row holding the value, for the report.
+
+        Returns:
+            Any: The typed value, None if it is missing or rejected.
+        """
+        if not isinstance(value, str):
+            return value
+
+        if value.strip().lower() in MISSING_VALUES:
+            return None
+
+        try:
+            return self._parsers[column](value)
+
+        except ValueError:
+            self.rejected.append(RejectedValue(column, value, key))
+            return None
+
+
+def get_validators() -> tuple[SchemaValidator, SchemaValidator]:
+    """
+    Returns:
+        tuple[SchemaValidator, SchemaValidator]: Fresh validators of the manga
+        information and the price tracking datasets.
+    """
+    return (
+        SchemaValidator('manga_information', INFORMATION_SCHEMA),
+        SchemaValidator('manga_price_tracking', PRICE_TRACKING_SCHEMA),
+    )
@@ -1,42 +1,74 @@
 # Native Libraries
-from typing import Iterable
+import hashlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import date
 from glob import glob
+from itertools import batched
+from os import cpu_count
+from os.path import basename, exists
+from typing import Iterable, Iterator
 
 # Third-Party Libraries
+import pyarrow as pa
+import pyarrow.compute as pc
+from loguru import logger
+from pandas import DataFrame, read_parquet
+from pyarrow.parquet import read_table
 from selectolax.parser import HTMLParser, Node
-from pandas import DataFrame
+from trio import (
+    MemoryReceiveChannel,
+    open_memory_channel,
+    open_nursery,
+    run,
+    to_thread,
+)
 
 # Local Modules
-from src.extraction.static import columns_replace_mapping, allowed_content_keys
+from src.core.requester import (
+    CatalogRequestStrategy,
+    RequestContext,
+    RequestStrategy,
+    SimpleRequestStrategy,
+)
+from src.core.settings import default_extraction_settings, default_settings
+from src.core.store import PageStore, canonicalize_url, get_page_store
 from src.entrypoint import fetch
+from src.extraction.engine import default_page_extractor
+from src.extraction.schema import CATALOG_SCHEMA, SchemaValidator, get_validators
 from src.extraction.utils import (
-    get_html_parser,
-    determine_dynamic_tag,
-    format_tag,
-    get_columns,
-    replace_columns,
-    save_as_parquet,
+    get_manga_name,
+    read_manifest,
+    read_publishers,
+    write_manifest,
+)
+from src.extraction.writer import (
+    ParquetStreamWriter,
+    PartitionedParquetWriter,
+    copy_retained_rows,
+    read_partitioned_dataset,
 )
-
 
 BASE_URL: str = 'https://blogbbm.com/manga/'
+CATALOG_PATH: str = 'data/manga_catalog.parquet'
 
 
-def get_catalog() -> DataFrame:
+def store_catalog(page: bytes) -> list[str]:
     """
-    Scrapes manga catalog data from a predefined URL, processes it into a structured format,
-    and saves the resulting data as a Parquet file.
+    Parses the manga catalog page and caches its rows as a Parquet file, with typed
+    `year`, `publisher` and `demography` columns.
+
+    It is called by `CatalogRequestStrategy` only when the catalog page changed since
+    the last run, so the cached rows are reused otherwise.
+
+    Args:
+        page (bytes): The HTML content of the catalog page.
 
     Returns:
-        DataFrame: A pandas DataFrame containing the manga catalog data with the following columns:
-            - 'url': The URL linking to the manga details.
-            - 'title': The title of the manga.
-            - 'author': The author(s) of the manga.
-            - 'publisher': The publisher of the manga.
-            - 'demography': The target demographic of the manga.
-            - 'year': The year of publication.
+        list[str]: The URLs of the manga pages listed in the catalog.
     """
-    parser: HTMLParser = get_html_parser(url=BASE_URL)
+    parser: HTMLParser = HTMLParser(page)
     table_data: list[dict[str, str]] = []
 
     rows: list[Node] = parser.css_first('tbody').css('tr')
@@ -44,134 +76,584 @@ def get_catalog() -> DataFrame:
     for row in rows:
         title, author, publisher, demography, year = row.css('td')
 
-        table_data.append(
-            {
-                'url': title.css_first('a').attrs['href'],
-                'title': title.text(),
-                'author': author.text(),
-                'publisher': publisher.text(),
-                'demography': demography.text(),
-                'year': year.text(),
-            }
-        )
-    df: DataFrame = DataFrame(data=table_data)
-    save_as_parquet(dataframe=df, file_name='manga_catalog')
+        table_data.append({
+            'url': title.css_first('a').attrs['href'],
+            'title': title.text(),
+            'author': author.text(),
+            'publisher': publisher.text(),
+            'demography': demography.text(),
+            'year': year.text(),
+        })
+    validator: SchemaValidator = SchemaValidator(
+        'manga_catalog', CATALOG_SCHEMA, key='url'
+    )
+
+    with ParquetStreamWriter(CATALOG_PATH, validator=validator) as writer:
+        writer.write_rows(table_data)
 
-    return df
+    validator.report(f'data/{validator.dataset}_rejected.jsonl')
 
+    return [row['url'] for row in table_data]
 
-def get_informative_content(parser: HTMLParser, dynamic_tag: str, manga: str) -> dict[str, str]:
+
+def read_catalog_urls() -> list[str]:
     """
-    Extracts and formats manga informative content from a parsed HTML document based on a dynamic tag.
+    Returns:
+        list[str]: The URLs of the manga pages of the cached catalog, empty before
+            the first run.
+    """
+    if not exists(CATALOG_PATH):
+        return []
+
+    return read_table(CATALOG_PATH, columns=['url']).column('url').to_pylist()
 
-    This function searches for a specific HTML element (identified by `dynamic_tag`) within a
-    container (`.entry-content`) and extracts key-value pairs defined by `<strong>` tags and their
-    associated sibling elements. The extracted data is filtered by a predefined list of allowed keys.
 
+def get_catalog_strategy(crawl_pages: bool = True) -> CatalogRequestStrategy:
+    """
     Args:
-        parser (HTMLParser): The HTML parser object used to navigate and query the DOM.
-        dynamic_tag (str): The dynamic HTML tag within `.entry-content` used as a scope for extraction.
-        manga (str): The name of the manga, which will be included as part of the resulting dictionary.
+        crawl_pages (bool, optional): Whether to crawl the pages listed in the
+                                      catalog, or only refresh it. Defaults to True.
 
     Returns:
-        dict[str, str]: A dictionary containing the extracted key-value pairs. The keys are taken from
-        `<strong>` tags, and their corresponding values are taken from the next sibling element.
-        Additionally, the `manga` key is included in the output dictionary with the given manga name.
+        CatalogRequestStrategy: The strategy refreshing the catalog within the crawl.
     """
-    strongs: list[Node] = parser.css_first(f'.entry-content {dynamic_tag}').css('strong')
+    return CatalogRequestStrategy(
+        catalog_path=BASE_URL,
+        cache_path=CATALOG_PATH,
+        parse_catalog=store_catalog,
+        crawl_pages=crawl_pages,
+    )
 
-    content: dict[str, str] = {}
 
-    for strong in strongs:
-        content_key, content_value = format_tag(strong), format_tag(strong.next)
+def get_catalog() -> DataFrame:
+    """
+    Retrieves the manga catalog through the async client of the crawler, with a
+    conditional GET, so the cached rows are reused when the catalog page has not
+    changed.
 
-        if content_key not in allowed_content_keys:
-            continue
+    Returns:
+        DataFrame: A pandas DataFrame containing the manga catalog data with the
+            following columns:
+            - 'url': The URL linking to the manga details.
+            - 'title': The title of the manga.
+            - 'author': The author(s) of the manga.
+            - 'publisher': The publisher of the manga.
+            - 'demography': The target demographic of the manga.
+            - 'year': The year of publication, as an integer.
+    """
+    fetch(paths=[], request_strategy=get_catalog_strategy(crawl_pages=False))
 
-        content[content_key] = content_value
+    return read_parquet(CATALOG_PATH)
 
-    content['manga'] = manga
 
-    return content
+def extract_page(
+    page: bytes, manga: str
+) -> tuple[dict[str, str] | None, pa.RecordBatch | None]:
+    """
+    Extracts the informative content and the price rows of a manga page.
 
+    Args:
+        page (bytes): The HTML content of the page.
+        manga (str): The name of the manga.
 
-def get_tables_content(parser: HTMLParser, dynamic_tag: str, manga: str) -> dict[str, str]:
+    Returns:
+        tuple[dict[str, str] | None, pa.RecordBatch | None]: The informative content
+        and the price rows of the page, each None when the page has none.
     """
-    It is simply impossible to improve this function.
+    return default_page_extractor.extract(page, manga)
+
+
+def extract_pages(
+    pages: Iterable[tuple[str, bytes]],
+) -> tuple[list[dict[str, str]], list[pa.RecordBatch]]:
     """
-    tables: list[Node] = parser.css('table')
+    Extracts a batch of stored manga pages into row batches.
+
+    It is the unit of work of the parallel extraction, so it only returns plain
+    dictionaries and Arrow record batches, which are cheap to send back from a
+    worker process.
+
+    Args:
+        pages (Iterable[tuple[str, bytes]]): The URL and the HTML content of every
+            page.
 
-    if len(tables) <= 1:
+    Returns:
+        tuple[list[dict[str, str]], list[pa.RecordBatch]]: The informative contents
+        and the price rows of the pages, in the order of `pages`.
+    """
+    informative_contents: list[dict[str, str]] = []
+    price_batches: list[pa.RecordBatch] = []
+
+    for url, page in pages:
+        informative_content, price_batch = extract_page(page, get_manga_name(url))
+
+        if informative_content is not None:
+            informative_contents.append(informative_content)
+
+        if price_batch is not None:
+            price_batches.append(price_batch)
+
+    return informative_contents, price_batches
+
+
+def import_legacy_contents(page_store: PageStore) -> None:
+    """
+    Imports the pages stored by previous versions as './contents/<manga>.html' files
+    into an empty page store, under the URL of their manga page.
+
+    Args:
+        page_store (PageStore): The opened page store.
+    """
+    files: list[str] = sorted(glob('./contents/*.html'))
+
+    if not files or page_store.get_digests():
         return None
 
-    filtered_tables: list[Node] = (
-        tables[1:] if dynamic_tag == 'td' else tables
+    def read_file(file_path: str) -> bytes:
+        with open(file_path, 'rb') as file:
+            return file.read()
+
+    imported: int = page_store.put_many(
+        (
+            canonicalize_url(
+                f'{BASE_URL}{basename(file_path).removesuffix(".html")}/'
+            ),
+            read_file(file_path),
+        )
+        for file_path in files
+    )
+    logger.info(
+        f'Imported {imported} pages from ./contents/*.html into the page store, '
+        'the HTML files are no longer used and can be removed.'
     )
 
-    for table in filtered_tables:
-        rows: list[Node] = table.css('tr')
-        header: Node = rows.pop(0)
-        columns: list[str] = header.text().strip('\n\t ').lower().split('\n')
 
-        if len(rows) <= 1 or len(rows[1].css('td')) > len(columns):
-            continue
+def open_price_history(validator: SchemaValidator) -> PartitionedParquetWriter:
+    """
+    Opens the price history for the current run, partitioned by crawl date and
+    publisher.
 
-        replace_columns(columns=columns, mapping=columns_replace_mapping)
+    Args:
+        validator (SchemaValidator): The validator of the price tracking rows.
 
-        for row in rows:
-            if row is header or header.text().strip().lower() == 'título editora':
-                continue
+    Returns:
+        PartitionedParquetWriter: The writer appending the prices of the current run.
+    """
+    publishers: dict[str, str] = read_publishers()
+
+    return PartitionedParquetWriter(
+        default_extraction_settings.price_history_path,
+        partitions={'crawl_date': date.today().isoformat()},
+        partition_by='publisher',
+        get_partition=lambda row: publishers.get(row.get('manga')),
+        validator=validator,
+    )
 
-            table_items: Iterable = zip(columns, row.css('td'))
 
-            content: dict[str, str] = {
-                column: value.text() for column, value in table_items
-            }
-            content['manga'] = manga
+def get_price_history(
+    manga: str | None = None, publisher: str | None = None
+) -> DataFrame:
+    """
+    Reads the price history, only scanning the partitions that can hold the requested
+    rows.
 
-            return content
+    When a manga is given without its publisher, the publisher is looked up in the
+    catalog, so only its partitions (and the ones of unknown publishers) are scanned.
 
+    Args:
+        manga (str | None, optional): The name of the manga page, e.g. 'one-piece'.
+        publisher (str | None, optional): The publisher, as written in the catalog.
 
-def persist_structured_data() -> None:
+    Returns:
+        DataFrame: The prices of every crawl, with `crawl_date` and `publisher`
+            columns.
     """
-    Extracts manga data from HTML files, processes the data, and saves it in Parquet format.
+    partitions: dict[str, tuple[str | None, ...]] | None = None
+
+    if publisher is not None:
+        partitions = {'publisher': (publisher,)}
+
+    elif manga is not None and (catalog_publisher := read_publishers().get(manga)):
+        partitions = {'publisher': (catalog_publisher, None)}
 
-    This function reads all HTML files from the './contents/' directory, extracts informative
-    content and table data, and saves them as separate Parquet files for further analysis.
+    return read_partitioned_dataset(
+        default_extraction_settings.price_history_path,
+        partitions=partitions,
+        row_filter=(pc.field('manga') == manga) if manga is not None else None,
+    ).to_pandas()
+
+
+def iter_contents(
+    pages: Iterable[tuple[str, bytes]], workers: int | None, chunk_size: int
+) -> Iterator[tuple[list[dict[str, str]], list[pa.RecordBatch]]]:
     """
-    files: list[str] = glob('./contents/*.html')
+    Extracts stored manga pages chunk by chunk, serially or across a process pool.
 
-    informative_contents: list[dict[str, str]] = []
-    table_contents: list[dict[str, str]] = []
+    Pages are read lazily, and at most two chunks per worker are in flight, so
+    memory stays bounded regardless of the number of pages.
+
+    Args:
+        pages (Iterable[tuple[str, bytes]]): The URL and the HTML content of every
+            page.
+        workers (int | None): Number of worker processes, 1 to extract serially
+                              or 0 or None to use every CPU.
+        chunk_size (int): Number of pages extracted at once.
+
+    Yields:
+        tuple[list[dict[str, str]], list[pa.RecordBatch]]: The informative contents
+        and the price rows of each chunk, in the order of `pages`.
+    """
+    if workers == 1:
+        for chunk in batched(pages, chunk_size):
+            yield extract_pages(chunk)
+
+        return None
+
+    max_pending: int = 2 * (workers or cpu_count())
+    pending: deque[Future] = deque()
+
+    with ProcessPoolExecutor(max_workers=workers or None) as executor:
+        for chunk in batched(pages, chunk_size):
+            pending.append(executor.submit(extract_pages, chunk))
+
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def persist_structured_data(
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    incremental: bool | None = None,
+) -> None:
+    """
+    Extracts manga data from the stored pages, processes the data, and saves it in
+    Parquet format.
+
+    This function reads every page of the page store, extracts informative content
+    and table data, and saves them as separate Parquet files for further analysis.
+    With more than one worker, the pages are sharded in chunks across a process pool;
+    the output is identical to the serial extraction. Rows are coerced to the typed
+    schema of their dataset and written in row groups as they are extracted; values
+    that do not fit are reported in `data/<dataset>_rejected.jsonl`.
+
+    A manifest records the digest of every page that fed the previous run. Prices
+    are appended to the partitioned price history only for the pages that changed
+    since then, so the history grows with the delta of each run. In incremental
+    mode, only those pages are re-extracted and upserted by `manga` into the
+    information dataset, and the rows of deleted pages, removed from the page store
+    once the site answers them with 404 or 410, are dropped.
+
+    Args:
+        workers (int | None, optional): Number of worker processes, 1 to extract
+                                        serially or 0 to use every CPU. Defaults to
+                                        the `EXTRACTION_WORKERS` setting, where None
+                                        uses every CPU.
+        chunk_size (int | None, optional): Number of pages sent to a worker at once.
+                                           Defaults to the `EXTRACTION_CHUNK_SIZE`
+                                           setting.
+        incremental (bool | None, optional): Whether to only re-extract the pages
+                                             changed since the last run. Defaults to
+                                             the `EXTRACTION_INCREMENTAL` setting.
+    """
+    workers = default_extraction_settings.workers if workers is None else workers
+    chunk_size = chunk_size or default_extraction_settings.chunk_size
+    incremental = (
+        default_extraction_settings.incremental
+        if incremental is None
+        else incremental
+    )
 
-    for file_path in files:
-        manga: str = file_path.split('/')[-1].removesuffix('.html')
+    with get_page_store() as page_store:
+        import_legacy_contents(page_store)
 
-        with open(file_path, 'r') as file:
-            parser: HTMLParser = HTMLParser(file.read())
+        manifest: dict[str, str] = page_store.get_digests()
+        urls: list[str] = sorted(manifest)
+        previous_manifest: dict[str, str] | None = read_manifest(
+            default_extraction_settings.manifest_path
+        )
+        information_validator, price_validator = get_validators()
 
-            dynamic_tag: str = determine_dynamic_tag(parser=parser)
+        changed_urls: list[str] = (
+            urls
+            if previous_manifest is None
+            else [url for url in urls if previous_manifest.get(url) != manifest[url]]
+        )
+        changed_mangas: set[str] = {get_manga_name(url) for url in changed_urls}
+
+        if (
+            incremental
+            and previous_manifest is not None
+            and not information_validator.is_compatible(
+                'data/manga_information.parquet'
+            )
+        ):
+            logger.info(
+                'The stored datasets have outdated column types, '
+                're-extracting every page.'
+            )
+            incremental = False
+
+        with (
+            ParquetStreamWriter(
+                'data/manga_information.parquet', validator=information_validator
+            ) as information_writer,
+            open_price_history(price_validator) as price_writer,
+        ):
+            if incremental and previous_manifest is not None:
+                deleted_urls: set[str] = previous_manifest.keys() - manifest.keys()
+                stale_mangas: set[str] = changed_mangas | {
+                    get_manga_name(url) for url in deleted_urls
+                }
+                logger.info(
+                    f'Re-extracting {len(changed_urls)} of {len(urls)} pages, '
+                    f'{len(deleted_urls)} pages were deleted.'
+                )
+
+                copy_retained_rows(
+                    information_writer.path, information_writer, stale_mangas
+                )
+                urls = changed_urls
+
+            for informative_batch, price_batches in iter_contents(
+                page_store.iter_pages(urls), workers, chunk_size
+            ):
+                information_writer.write_rows(informative_batch)
+
+                # Every batch holds the prices of a single page, so of a single
+                # manga.
+                for price_batch in price_batches:
+                    if price_batch.column('manga')[0].as_py() in changed_mangas:
+                        price_writer.write_batch(price_batch)
+
+    for validator in (information_validator, price_validator):
+        validator.report(f'data/{validator.dataset}_rejected.jsonl')
+
+    write_manifest(default_extraction_settings.manifest_path, manifest)
+
+
+async def crawl_and_extract(  # noqa: PLR0913, PLR0917
+    paths: Iterable[str],
+    request_strategy: RequestStrategy,
+    archive: bool,
+    workers: int | None,
+    information_writer: ParquetStreamWriter,
+    price_writer: PartitionedParquetWriter,
+    previous_manifest: dict[str, str] | None,
+    manifest: dict[str, str],
+) -> set[str]:
+    """
+    Crawls manga pages and extracts them as they arrive.
 
-            if (content := get_informative_content(parser, dynamic_tag, manga)) is not None:
-                informative_contents.append(content)
+    Responses are handed from the crawler to the extraction stage through a
+    bounded channel, so parsing overlaps with the network instead of waiting
+    for the last download. Pages are parsed in worker threads, or in a process
+    pool when more than one worker is configured, and their rows are written
+    in the order the pages are extracted. As in `persist_structured_data`,
+    prices are only appended for the pages whose digest differs from the
+    previous manifest.
 
-            if (content := get_tables_content(parser, dynamic_tag, manga)) is not None:
-                table_contents.append(content)
+    Args:
+        paths (Iterable[str]): The URLs of the manga pages.
+        request_strategy (RequestStrategy): The strategy used for managing HTTP
+            requests.
+        archive (bool): Whether to also store the raw HTML pages in the page store.
+        workers (int | None): Number of extraction workers, 1 to parse in a single
+                              thread or 0 or None to use every CPU.
+        information_writer (ParquetStreamWriter): The writer of the informative
+            contents.
+        price_writer (PartitionedParquetWriter): The writer of the price rows.
+        previous_manifest (dict[str, str] | None): The digest of every page that fed
+            the previous run, None if unknown.
+        manifest (dict[str, str]): The manifest of the current run, updated with the
+                                   digest of every extracted page.
 
-    save_as_parquet(
-        dataframe=DataFrame(data=informative_contents,
-        columns=get_columns(informative_contents)),
-        file_name='manga_information'
+    Returns:
+        set[str]: The URLs of the pages the site answered as gone.
+    """
+    send_channel, receive_channel = open_memory_channel(
+        default_extraction_settings.queue_size
     )
-    save_as_parquet(
-        dataframe=DataFrame(data=table_contents,
-        columns=get_columns(table_contents)),
-        file_name='manga_price_tracking'
+    context: RequestContext = RequestContext(
+        base_url='', paths=paths, page_sink=send_channel, archive=archive
     )
+    gone_urls: set[str] = set()
+
+    async def crawl() -> None:
+        async with send_channel:
+            await request_strategy.fetch(context)
+
+    async def extract(
+        receive_channel: MemoryReceiveChannel, executor: ProcessPoolExecutor | None
+    ) -> None:
+        async with receive_channel:
+            async for url, page in receive_channel:
+                if page is None:
+                    gone_urls.add(url)
+                    continue
+
+                manga: str = get_manga_name(url)
+                digest: str = hashlib.md5(page).hexdigest()
+                changed: bool = (
+                    previous_manifest is None or previous_manifest.get(url) != digest
+                )
+
+                if executor is None:
+                    contents = await to_thread.run_sync(extract_page, page, manga)
+                else:
+                    future: Future = executor.submit(extract_page, page, manga)
+                    contents = await to_thread.run_sync(
+                        future.result, abandon_on_cancel=True
+                    )
+
+                informative_content, price_batch = contents
+
+                if informative_content is not None:
+                    information_writer.write(informative_content)
+
+                if price_batch is not None and changed:
+                    price_writer.write_batch(price_batch)
+
+                manifest[url] = digest
+
+    with (
+        ProcessPoolExecutor(max_workers=workers or None)
+        if workers != 1
+        else nullcontext()
+    ) as executor:
+        async with open_nursery() as nursery, receive_channel:
+            nursery.start_soon(crawl)
+
+            for _ in range(workers or cpu_count()):
+                nursery.start_soon(extract, receive_channel.clone(), executor)
+
+    return gone_urls
+
+
+def persist_streamed_data(
+    paths: Iterable[str],
+    request_strategy: RequestStrategy = SimpleRequestStrategy(),
+    archive: bool | None = None,
+    workers: int | None = None,
+) -> None:
+    """
+    Crawls and extracts manga pages in a single streaming pipeline, saving the
+    extracted data in Parquet format as it is produced.
+
+    The extraction manifest is rewritten with the pages of the run, so prices are
+    only appended for changed pages, here and by the next batch extraction. Pages
+    of the previous run that were not extracted this time, e.g. because their
+    request failed, keep their rows and manifest entries, unless the site
+    answered them as gone.
+
+    Args:
+        paths (Iterable[str]): The URLs of the manga pages.
+        request_strategy (RequestStrategy, optional): The strategy used for managing
+            HTTP requests. Defaults to `SimpleRequestStrategy`.
+        archive (bool | None, optional): Whether to also store the raw HTML pages
+                                         in the page store. Defaults to the
+                                         `EXTRACTION_ARCHIVE` setting.
+        workers (int | None, optional): Number of extraction workers, 0 to use every
+                                        CPU. Defaults to the `EXTRACTION_WORKERS`
+                                        setting, where None uses every CPU.
+    """
+    archive = default_extraction_settings.archive if archive is None else archive
+    workers = default_extraction_settings.workers if workers is None else workers
+    information_validator, price_validator = get_validators()
+    previous_manifest: dict[str, str] | None = read_manifest(
+        default_extraction_settings.manifest_path
+    )
+    manifest: dict[str, str] = {}
+
+    with (
+        ParquetStreamWriter(
+            'data/manga_information.parquet', validator=information_validator
+        ) as information_writer,
+        open_price_history(price_validator) as price_writer,
+    ):
+        gone_urls: set[str] = run(
+            crawl_and_extract,
+            paths,
+            request_strategy,
+            archive,
+            workers,
+            information_writer,
+            price_writer,
+            previous_manifest,
+            manifest,
+        )
+        retained_manifest: dict[str, str] = {
+            url: digest
+            for url, digest in (previous_manifest or {}).items()
+            if url not in manifest and url not in gone_urls
+        }
+
+        if (
+            retained_manifest
+            and exists(information_writer.path)
+            and information_validator.is_compatible(information_writer.path)
+        ):
+            logger.info(
+                f'Keeping the rows of {len(retained_manifest)} pages not extracted '
+                f'in this run, {len(gone_urls)} pages are gone.'
+            )
+            copy_retained_rows(
+                information_writer.path,
+                information_writer,
+                {get_manga_name(url) for url in manifest.keys() | gone_urls},
+            )
+            manifest |= retained_manifest
+
+    for validator in (information_validator, price_validator):
+        validator.report(f'data/{validator.dataset}_rejected.jsonl')
+
+    write_manifest(default_extraction_settings.manifest_path, manifest)
+
+
+def main(
+    stream: bool | None = None,
+    processes: int | None = None,
+) -> None:
+    """
+    Refreshes the catalog and crawls the pages it lists, then extracts them.
+
+    In a single process, the pages of the cached catalog are crawled while the
+    catalog itself is still being fetched. With several processes, the catalog
+    is refreshed first, and the pages it lists are then split between them.
+
+    Args:
+        stream (bool | None, optional): Whether to extract pages while they are
+                                        being crawled, always in a single process.
+                                        Defaults to the `EXTRACTION_STREAM` setting.
+        processes (int | None, optional): The number of processes crawling the
+                                          pages. Defaults to the `PROCESSES`
+                                          setting.
+    """
+    stream = default_extraction_settings.stream if stream is None else stream
+    processes = processes or default_settings.processes
+
+    with get_page_store() as page_store:
+        import_legacy_contents(page_store)
+
+    if stream:
+        persist_streamed_data(
+            paths=read_catalog_urls(), request_strategy=get_catalog_strategy()
+        )
+        return None
+
+    if processes > 1:
+        fetch(paths=[], request_strategy=get_catalog_strategy(crawl_pages=False))
+        fetch(
+            paths=read_catalog_urls(),
+            request_strategy=SimpleRequestStrategy(),
+            processes=processes,
+        )
 
+    else:
+        fetch(paths=read_catalog_urls(), request_strategy=get_catalog_strategy())
 
-def main() -> None:
-    fetch(paths=get_catalog()['url'])
     persist_structured_data()
 
 
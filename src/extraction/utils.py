@@ -1,110 +1,109 @@
 # Native Libraries
-from typing import Iterable
-import re
+import json
+from os.path import exists, join
+from urllib.parse import urlsplit
 
 # Third-Party Libraries
-from selectolax.parser import Node, HTMLParser
-from pandas import DataFrame
-from functools import reduce
-import httpx
+from pyarrow.parquet import read_table
 
 # Local Modules
-from src.core.agents import get_random_user_agent
+from src.core.settings import default_extraction_settings
 
 
-def get_html_parser(url: str = None, response: str = None) -> HTMLParser:
+def replace_columns(columns: list[str], mapping: list[tuple[str, str]]) -> list[str]:
     """
-    Retrieves and parses HTML content into an HTMLParser object.
+    Replaces specific column names in a list based on a mapping of old and new names.
 
     Args:
-        url (str, optional): A URL to fetch and parse. If provided, the function makes an HTTP GET request
-                             to retrieve the content.
-        response (str, optional): A string containing the HTML content to parse. If both `url` and `response`
-                                  are provided, the function prioritizes `url`.
+        columns (list[str]): A list of column names to be updated.
+        mapping (list[tuple[str, str]]): A list of tuples where each tuple contains:
+            - `old` (str): The column name to be replaced.
+            - `new` (str): The new column name that will replace the old one.
 
     Returns:
-        HTMLParser: A BeautifulSoup HTMLParser object containing the parsed HTML content.
+        list[str]: The updated list of column names after applying the replacements.
     """
-    if url:
-        response: httpx.Response = httpx.get(
-            url, headers={'User-Agent': get_random_user_agent()}
-        )
-        return HTMLParser(response.content)
+    for old, new in mapping:
+        try:
+            columns[columns.index(old)] = new
 
-    return HTMLParser(response.content)
+        except ValueError:
+            continue
+
+    return columns
 
 
-def determine_dynamic_tag(parser: HTMLParser) -> str:
+def get_manga_name(url: str) -> str:
     """
-    Determines the dynamic tag (`td` or `p`) based on the HTML structure.
+    Extracts the name of a manga from the URL of its page, e.g. 'one-piece'
+    from 'https://blogbbm.com/manga/one-piece/'.
 
     Args:
-        parser (HTMLParser): Parser object used to query the HTML content.
+        url (str): The URL of the manga page.
 
     Returns:
-        str: The appropriate dynamic tag (`'td'` or `'p'`).
+        str: The last segment of the URL path.
     """
-    return 'td' if len(parser.css_first('.entry-content td').css('strong')) > 1 else 'p'
+    return urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
 
 
-def format_tag(strong: Node) -> str:
+def read_manifest(path: str) -> dict[str, str] | None:
     """
-    Formats a string extracted from an HTML node using regex.
+    Reads the extraction manifest of the previous run.
 
     Args:
-        strong (Node): An HTML node object (e.g., BeautifulSoup tag) from which the text is extracted.
-                       If the node is None, an empty string is returned.
+        path (str): The path of the manifest file.
 
     Returns:
-        str: A cleaned and lowercase string
+        dict[str, str] | None: The digest of every page that fed the previous run,
+            keyed by URL, or None if there is no manifest or the datasets it
+            describes are missing.
     """
-    text: str = strong.text() if strong is not None else ''
+    datasets: tuple[str] = (
+        'data/manga_information.parquet',
+        join(default_extraction_settings.price_history_path, '_manifest.json'),
+    )
 
-    return re.sub(r'^(Nº de\s*)?|^[\s:]+|[\s:]+$', '', text).lower()
+    if not exists(path) or not all(exists(dataset) for dataset in datasets):
+        return None
 
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
 
-def replace_columns(columns: list[str], mapping: list[tuple[str, str]]) -> list[str]:
+
+def write_manifest(path: str, manifest: dict[str, str]) -> None:
     """
-    Replaces specific column names in a list based on a mapping of old and new names.
+    Writes the extraction manifest of the current run.
 
     Args:
-        columns (list[str]): A list of column names to be updated.
-        mapping (list[tuple[str, str]]): A list of tuples where each tuple contains:
-            - `old` (str): The column name to be replaced.
-            - `new` (str): The new column name that will replace the old one.
-
-    Returns:
-        list[str]: The updated list of column names after applying the replacements.
+        path (str): The path of the manifest file.
+        manifest (dict[str, str]): The digest of every page that fed the current run,
+                                   keyed by URL.
     """
-    for old, new in mapping:
-        try:
-            columns[columns.index(old)] = new
-
-        except ValueError:
-            continue
-
-    return columns
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
 
 
-def get_columns(dict_list: Iterable[dict[str, str]]) -> Iterable[str]:
+def read_publishers(path: str = 'data/manga_catalog.parquet') -> dict[str, str]:
     """
-    Combines all unique keys from multiple dictionaries into a single iterable of strings.
+    Reads the publisher of every manga from the catalog.
 
     Args:
-        dict_list (Iterable[dict[str, str]]): An iterable containing dictionaries with string keys and values.
+        path (str, optional): The path of the catalog dataset.
+                              Defaults to 'data/manga_catalog.parquet'.
 
     Returns:
-        Iterable[str]: A set-like iterable containing all unique keys from the input dictionaries.
+        dict[str, str]: The publisher of every manga, keyed by the name of its page,
+        empty if the catalog has not been scraped yet.
     """
-    return reduce(lambda x, y: (x | y), dict_list)
+    if not exists(path):
+        return {}
 
+    catalog: dict[str, list] = read_table(
+        path, columns=['url', 'publisher']
+    ).to_pydict()
 
-def save_as_parquet(dataframe: DataFrame, file_name: str) -> None:
-    """
-    Saves a DataFrame as a Parquet file.
-
-    Args:
-        dataframe (DataFrame): A pandas DataFrame to save as a Parquet file.
-        file_name (str): The desired name of the Parquet file (without the file extension).
-    """
-    dataframe.to_parquet(path=f'data/{file_name}.parquet', index=False)
+    return {
+        get_manga_name(url): publisher
+        for url, publisher in zip(catalog['url'], catalog['publisher'])
+    }
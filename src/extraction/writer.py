@@ -0,0 +1,564 @@
+# Native Libraries
+import json
+from datetime import datetime
+from os import makedirs, remove, replace, rmdir
+from os.path import exists, join
+from typing import Any, Callable, Iterable, Self
+from urllib.parse import quote
+from uuid import uuid4
+
+# Third-Party Libraries
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow.parquet import ParquetFile, ParquetWriter, read_schema, write_table
+
+# Local Modules
+from src.core.settings import default_extraction_settings
+from src.extraction.schema import SchemaValidator
+
+HIVE_DEFAULT_PARTITION: str = '__HIVE_DEFAULT_PARTITION__'
+
+
+class ParquetStreamWriter:
+    """
+    Writes rows to a Parquet file incrementally, one row group at a time.
+
+    Rows, or record batches of rows, are buffered until `row_group_size` of them
+    are collected, then flushed as an Arrow row group, so peak memory is one row
+    group rather than the whole dataset. The set of columns may grow while rows
+    are written: it is tracked in O(1) per key, every schema change starts a new
+    part file, and the parts are unified into a single schema when the writer is
+    closed. With a validator, rows are coerced to its typed columns as they are
+    written, and batches column by column.
+
+    Attributes:
+        path (str): The path of the Parquet file.
+        rows_written (int): The number of rows written so far.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        row_group_size: int | None = None,
+        schema: pa.Schema | None = None,
+        validator: SchemaValidator | None = None,
+    ) -> None:
+        """
+        Args:
+            path (str): The path of the Parquet file.
+            row_group_size (int | None, optional): Number of rows per row group.
+                Defaults to the `EXTRACTION_ROW_GROUP_SIZE` setting.
+            schema (pa.Schema | None, optional): Known column types; other columns
+                                                 are inferred from their values.
+                                                 Defaults to the schema of the
+                                                 validator.
+            validator (SchemaValidator | None, optional): The validator coercing
+                every written row.
+        """
+        self.path: str = path
+        self.rows_written: int = 0
+        self._row_group_size: int = (
+            row_group_size or default_extraction_settings.row_group_size
+        )
+        self._validator: SchemaValidator | None = validator
+        self._schema: pa.Schema = (
+            schema
+            or (validator.arrow_schema if validator else None)
+            or pa.schema([])
+        )
+        self._columns: dict[str, None] = {}
+        self._rows: list[dict[str, Any]] = []
+        self._batches: list[pa.RecordBatch] = []
+        self._batched_rows: int = 0
+        self._parts_directory: str = f'{path}.parts'
+        self._parts: list[str] = []
+        self._writer: ParquetWriter | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def write(self, row: dict[str, Any]) -> None:
+        """
+        Buffers a row, flushing a row group once the buffer is full.
+
+        Args:
+            row (dict[str, Any]): The row to write.
+        """
+        if self._validator is not None:
+            row = self._validator.coerce(row)
+
+        for key in row:
+            self._columns.setdefault(key)
+
+        self._rows.append(row)
+
+        if len(self._rows) >= self._row_group_size:
+            self.flush()
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Args:
+            rows (Iterable[dict[str, Any]]): The rows to write.
+        """
+        for row in rows:
+            self.write(row)
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        """
+        Buffers a batch of rows, flushing a row group once the buffer is full.
+
+        Args:
+            batch (pa.RecordBatch): The rows to write, as columns.
+        """
+        if self._validator is not None:
+            batch = self._validator.coerce_batch(batch)
+
+        for column in batch.schema.names:
+            self._columns.setdefault(column)
+
+        self._batches.append(batch)
+        self._batched_rows += batch.num_rows
+
+        if self._batched_rows >= self._row_group_size:
+            self.flush()
+
+    def write_table(self, table: pa.Table) -> None:
+        """
+        Writes an Arrow table as is, after the rows buffered so far.
+
+        Args:
+            table (pa.Table): The table to write.
+        """
+        self.flush()
+
+        for column in table.column_names:
+            self._columns.setdefault(column)
+
+        self._write(table)
+
+    def flush(self) -> None:
+        """Writes the buffered rows and batches as row groups."""
+        if self._rows:
+            table: pa.Table = pa.Table.from_arrays(
+                [
+                    pa.array(
+                        [row.get(column) for row in self._rows],
+                        type=self._get_type(column),
+                    )
+                    for column in self._columns
+                ],
+                names=list(self._columns),
+            )
+            self._rows.clear()
+            self._write(table)
+
+        if self._batches:
+            table = pa.concat_tables(
+                [pa.Table.from_batches([batch]) for batch in self._batches],
+                promote_options='permissive',
+            )
+            self._batches.clear()
+            self._batched_rows = 0
+            # Columns seen in earlier batches keep their place, so the part schema
+            # stays stable.
+            schema: pa.Schema = pa.schema([
+                table.schema.field(column)
+                if column in table.column_names
+                else (column, self._get_type(column) or pa.string())
+                for column in self._columns
+            ])
+            self._write(conform_table(table, schema))
+
+    def close(self) -> None:
+        """Flushes the buffered rows and assembles the final Parquet file."""
+        self.flush()
+        self._close_part()
+
+        if not self._parts:
+            schema: pa.Schema = pa.schema([
+                (column, self._get_type(column) or pa.string())
+                for column in self._columns
+            ])
+            write_table(schema.empty_table(), self.path)
+
+        elif len(self._parts) == 1:
+            replace(self._parts[0], self.path)
+
+        else:
+            self._merge_parts()
+
+        self._discard()
+
+    def _get_type(self, column: str) -> pa.DataType | None:
+        """
+        Args:
+            column (str): The name of a column.
+
+        Returns:
+            pa.DataType | None: The known type of the column, or None to let Arrow
+            infer it from the values.
+        """
+        if column in self._schema.names:
+            return self._schema.field(column).type
+
+        return None
+
+    def _write(self, table: pa.Table) -> None:
+        """
+        Writes a table to the current part file, starting a new part when its schema
+        changed.
+
+        Args:
+            table (pa.Table): The table to write.
+        """
+        if self._writer is None or not self._writer.schema.equals(table.schema):
+            self._close_part()
+
+            makedirs(self._parts_directory, exist_ok=True)
+            part_path: str = (
+                f'{self._parts_directory}/part-{len(self._parts)}.parquet'
+            )
+
+            self._writer = ParquetWriter(part_path, table.schema)
+            self._parts.append(part_path)
+
+        self._writer.write_table(table, row_group_size=self._row_group_size)
+        self.rows_written += table.num_rows
+
+    def _close_part(self) -> None:
+        """Closes the part file being written, if any."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _merge_parts(self) -> None:
+        """
+        Copies every part into the final file, row group by row group, under their
+        unified schema.
+        """
+        schema: pa.Schema = pa.unify_schemas(
+            [read_schema(part) for part in self._parts], promote_options='permissive'
+        )
+        schema = pa.schema([schema.field(column) for column in self._columns])
+        temp_path: str = f'{self._parts_directory}/merged.parquet'
+
+        with ParquetWriter(temp_path, schema) as writer:
+            for part in self._parts:
+                part_file: ParquetFile = ParquetFile(part)
+
+                for index in range(part_file.num_row_groups):
+                    writer.write_table(
+                        conform_table(part_file.read_row_group(index), schema)
+                    )
+
+        replace(temp_path, self.path)
+
+    def _discard(self) -> None:
+        """Removes the part files."""
+        self._close_part()
+
+        for part in self._parts:
+            if exists(part):
+                remove(part)
+
+        self._parts.clear()
+
+        if exists(self._parts_directory):
+            rmdir(self._parts_directory)
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Casts a table to a wider schema, adding the missing columns as nulls.
+
+    Args:
+        table (pa.Table): The table to conform.
+        schema (pa.Schema): The target schema, a superset of the columns of the
+            table.
+
+    Returns:
+        pa.Table: The table with exactly the columns and types of `schema`.
+    """
+    columns: list[pa.Array] = [
+        table[field.name].cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def copy_retained_rows(
+    source_path: str,
+    writer: ParquetStreamWriter,
+    stale_keys: set[str],
+    key: str = 'manga',
+) -> None:
+    """
+    Copies the rows of a Parquet file into a writer, batch by batch, leaving out
+    stale rows.
+
+    Args:
+        source_path (str): The path of the Parquet file to copy.
+        writer (ParquetStreamWriter): The writer receiving the retained rows.
+        stale_keys (set[str]): The keys whose rows are outdated or deleted.
+        key (str, optional): The column identifying the rows. Defaults to 'manga'.
+    """
+    for batch in ParquetFile(source_path).iter_batches():
+        table: pa.Table = pa.Table.from_batches([batch])
+
+        if key in table.column_names:
+            table = table.filter(
+                pc.invert(
+                    pc.is_in(
+                        table[key], value_set=pa.array(list(stale_keys), pa.string())
+                    )
+                )
+            )
+
+        writer.write_table(table)
+
+
+class PartitionedParquetWriter:
+    """
+    Appends rows to a Hive-partitioned Parquet dataset.
+
+    Every run adds one new file per partition, laid out as
+    `{directory}/{name}={value}/.../part-{run}.parquet`, and never rewrites the
+    files of previous runs, so the cost of a run grows with the rows it writes
+    rather than with the whole history. The files are listed in a compact
+    `_manifest.json`, which lets readers prune partitions without walking the
+    directory tree.
+
+    Attributes:
+        directory (str): The root directory of the dataset.
+        rows_written (int): The number of rows written during the current run.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        directory: str,
+        partitions: dict[str, str],
+        partition_by: str,
+        get_partition: Callable[[dict[str, Any]], str | None],
+        row_group_size: int | None = None,
+        validator: SchemaValidator | None = None,
+    ) -> None:
+        """
+        Args:
+            directory (str): The root directory of the dataset.
+            partitions (dict[str, str]): The partitions shared by every row of the
+                                         run, e.g. the crawl date.
+            partition_by (str): The name of the partition computed for every row.
+            get_partition (Callable[[dict[str, Any]], str | None]): Computes the
+                partition value of a row, None when it is unknown.
+            row_group_size (int | None, optional): Number of rows per row group.
+                Defaults to the `EXTRACTION_ROW_GROUP_SIZE` setting.
+            validator (SchemaValidator | None, optional): The validator coercing
+                every written row.
+        """
+        self.directory: str = directory
+        self.rows_written: int = 0
+        self._partitions: dict[str, str] = partitions
+        self._partition_by: str = partition_by
+        self._get_partition: Callable[[dict[str, Any]], str | None] = get_partition
+        self._row_group_size: int = (
+            row_group_size or default_extraction_settings.row_group_size
+        )
+        self._validator: SchemaValidator | None = validator
+        self._run: str = f'{datetime.now():%Y%m%dT%H%M%S}-{uuid4().hex[:8]}'
+        self._writers: dict[str | None, ParquetStreamWriter] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            for writer in self._writers.values():
+                writer.__exit__(exc_type, *exc_info)
+
+    def write(self, row: dict[str, Any]) -> None:
+        """
+        Args:
+            row (dict[str, Any]): The row to write.
+        """
+        self._get_writer(self._get_partition(row)).write(row)
+        self.rows_written += 1
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Args:
+            rows (Iterable[dict[str, Any]]): The rows to write.
+        """
+        for row in rows:
+            self.write(row)
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        """
+        Writes a batch of rows sharing the same partition, e.g. the prices of a page.
+
+        Args:
+            batch (pa.RecordBatch): The rows to write, as columns; the partition is
+                                    computed from the first one.
+        """
+        if not batch.num_rows:
+            return None
+
+        value: str | None = self._get_partition(batch.slice(0, 1).to_pylist()[0])
+        self._get_writer(value).write_batch(batch)
+        self.rows_written += batch.num_rows
+
+    def close(self) -> None:
+        """Closes the files of the run and records them in the manifest."""
+        entries: list[dict[str, Any]] = read_dataset_manifest(self.directory)
+
+        for value, writer in self._writers.items():
+            writer.close()
+
+            entries.append({
+                'path': writer.path.removeprefix(f'{self.directory}/'),
+                'run': self._run,
+                'rows': writer.rows_written,
+                **self._partitions,
+                self._partition_by: value,
+            })
+
+        if self._writers:
+            write_dataset_manifest(self.directory, entries)
+
+        self._writers.clear()
+
+    def _get_writer(self, value: str | None) -> ParquetStreamWriter:
+        """
+        Args:
+            value (str | None): The partition value of a row.
+
+        Returns:
+            ParquetStreamWriter: The writer of the file of the partition, opened on
+                first use.
+        """
+        if (writer := self._writers.get(value)) is None:
+            writer = self._writers[value] = ParquetStreamWriter(
+                self._get_file_path(value),
+                row_group_size=self._row_group_size,
+                validator=self._validator,
+            )
+
+        return writer
+
+    def _get_file_path(self, value: str | None) -> str:
+        """
+        Args:
+            value (str | None): The partition value of a row.
+
+        Returns:
+            str: The path of the file of the partition for the current run.
+        """
+        segments: list[str] = [
+            f'{name}='
+            f'{quote(partition, safe="") if partition else HIVE_DEFAULT_PARTITION}'
+            for name, partition in (
+                *self._partitions.items(),
+                (self._partition_by, value),
+            )
+        ]
+
+        return join(self.directory, *segments, f'part-{self._run}.parquet')
+
+
+def read_dataset_manifest(directory: str) -> list[dict[str, Any]]:
+    """
+    Args:
+        directory (str): The root directory of a partitioned dataset.
+
+    Returns:
+        list[dict[str, Any]]: The files of the dataset with their partition values,
+        empty if the dataset does not exist yet.
+    """
+    path: str = join(directory, '_manifest.json')
+
+    if not exists(path):
+        return []
+
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def write_dataset_manifest(directory: str, entries: list[dict[str, Any]]) -> None:
+    """
+    Atomically replaces the manifest of a partitioned dataset.
+
+    Args:
+        directory (str): The root directory of a partitioned dataset.
+        entries (list[dict[str, Any]]): The files of the dataset with their partition
+            values.
+    """
+    path: str = join(directory, '_manifest.json')
+    temp_path: str = f'{path}.{uuid4().hex}.tmp'
+
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(entries, file, ensure_ascii=False, separators=(',', ':'))
+
+    replace(temp_path, path)
+
+
+def read_partitioned_dataset(
+    directory: str,
+    partitions: dict[str, Iterable[str | None]] | None = None,
+    row_filter: pc.Expression | None = None,
+) -> pa.Table:
+    """
+    Reads a Hive-partitioned dataset, scanning only the files of the matching
+    partitions.
+
+    Args:
+        directory (str): The root directory of the dataset.
+        partitions (dict[str, Iterable[str | None]] | None, optional): The accepted
+            values of each partition, None standing for unknown.
+        row_filter (pc.Expression | None, optional): A filter applied to the scanned
+            rows.
+
+    Returns:
+        pa.Table: The matching rows, with the partitions as string columns.
+    """
+    accepted: dict[str, set[str | None]] = {
+        name: set(values) for name, values in (partitions or {}).items()
+    }
+    entries: list[dict[str, Any]] = [
+        entry
+        for entry in read_dataset_manifest(directory)
+        if all(entry.get(name) in values for name, values in accepted.items())
+    ]
+
+    if not entries:
+        return pa.table({})
+
+    partition_schema: pa.Schema = pa.schema([
+        (name, pa.string())
+        for name in entries[0]
+        if name not in {'path', 'run', 'rows'}
+    ])
+    files: list[str] = [join(directory, entry['path']) for entry in entries]
+    schema: pa.Schema = pa.unify_schemas(
+        [*(read_schema(file) for file in files), partition_schema],
+        promote_options='permissive',
+    )
+    dataset: ds.Dataset = ds.dataset(
+        files,
+        schema=schema,
+        format='parquet',
+        partitioning=ds.partitioning(partition_schema, flavor='hive'),
+        partition_base_dir=directory,
+    )
+
+    return dataset.to_table(filter=row_filter)
@@ -0,0 +1,214 @@
+# Native Libraries
+import json
+import subprocess
+import sys
+from itertools import accumulate
+from pathlib import Path
+
+# Third-Party Libraries
+import pytest
+
+# Local Modules
+from src.core.agents import (
+    AgentStats,
+    FenwickTree,
+    Rotator,
+    UserAgent,
+    load_user_agents,
+    read_user_agent_pool,
+    user_agents,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now: list[float] = [1000.0]
+    monkeypatch.setattr('src.core.agents.time', lambda: now[0])
+
+    return now
+
+
+@pytest.fixture
+def rotator(clock):
+    return Rotator(user_agents[:8], cache_path=None)
+
+
+def pick(monkeypatch, rotator: Rotator, target: float) -> str:
+    """Selects a user agent with `random.random()` returning `target`."""
+    monkeypatch.setattr('src.core.agents.random.random', lambda: target)
+
+    return rotator.get()
+
+
+def test_fenwick_tree_sums_and_searches_prefixes():
+    weights: list[float] = [1.0, 2.0, 3.0, 4.0]
+    tree: FenwickTree = FenwickTree(weights)
+    targets: tuple[float, ...] = (0.5, 1.0, 2.9, 5.5, 9.9, 50.0)
+
+    assert tree.total == sum(weights)
+    assert [tree.find(target) for target in targets] == [0, 1, 1, 2, 3, 3]
+
+    added: float = 5.0
+    tree.add(0, added)
+
+    assert tree.total == sum(weights) + added
+    assert tree.find(5.5) == 0
+    assert tree.find(6.5) == 1
+
+
+def test_fenwick_tree_search_adds_a_scaled_slope():
+    weights: list[float] = [1.0, 1.0, 1.0]
+    tree: FenwickTree = FenwickTree(weights)
+    scales: FenwickTree = FenwickTree([0.0, 2.0, 0.0])
+
+    assert tree.find(2.5, slope=1.0) == 1
+    assert tree.find(2.5, slope=1.0, scales=scales) == 1
+    assert tree.find(4.5, slope=1.0, scales=scales) == len(weights) - 1
+
+
+def test_rotator_selects_in_proportion_to_the_weights(monkeypatch, rotator, clock):
+    for step in range(20):
+        clock[0] += 1.0 + step % 3
+        weights: list[float] = [
+            rotator.weigh_user_agent(user_agent)
+            for user_agent in rotator.user_agents
+        ]
+        bounds: list[float] = [0.0, *accumulate(weights)]
+        index: int = step % len(weights)
+        target: float = (bounds[index] + bounds[index + 1]) / 2 / bounds[-1]
+
+        assert pick(monkeypatch, rotator, target) == rotator.user_agents[index].agent
+
+
+# The health below which a user agent blocked on every request must fall.
+BLOCKED_HEALTH: float = 0.5
+
+
+def test_blocked_user_agents_lose_weight(rotator, clock):
+    blocked: str = rotator.user_agents[0].agent
+    weight: float = rotator.weigh_user_agent(rotator.user_agents[0])
+
+    for _ in range(10):
+        rotator.record(blocked, 403, latency=0.1)
+
+    assert rotator.get_health(blocked) < BLOCKED_HEALTH
+    assert rotator.weigh_user_agent(rotator.user_agents[0]) < weight / 2
+
+
+def test_merged_stats_add_up_and_update_the_weights(rotator):
+    agent: str = rotator.user_agents[0].agent
+    rotator.record(agent, 200, latency=1.0)
+
+    rotator.merge_stats({agent: AgentStats(requests=3, blocked=3, latency=3.0)})
+
+    assert rotator.stats[agent] == AgentStats(requests=4, blocked=3, latency=2.5)
+    assert rotator._health_of[0] == rotator.get_health(agent)
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """The user agents parsed with `ua_parser` from then on."""
+    agents: list[str] = []
+    parse = UserAgent.parse.__func__
+
+    def parse_and_record(cls, agent: str) -> UserAgent:
+        agents.append(agent)
+
+        return parse(cls, agent)
+
+    monkeypatch.setattr(UserAgent, 'parse', classmethod(parse_and_record))
+
+    return agents
+
+
+def test_importing_the_crawler_does_not_parse_user_agents():
+    code: str = (
+        'import sys; import src.extraction.spider; '
+        'from src.core.agents import get_rotator; '
+        "print('ua_parser' in sys.modules, get_rotator.cache_info().currsize)"
+    )
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split() == ['False', '0']
+
+
+def test_cached_user_agents_are_not_parsed_again(parsed, tmp_path):
+    cache_path: str = str(tmp_path / 'user_agents.db')
+    agents: list[str] = user_agents[:4]
+
+    first: list[UserAgent] = load_user_agents(agents, cache_path=cache_path)
+    parsed_agents: list[str] = list(parsed)
+    second: list[UserAgent] = load_user_agents(agents, cache_path=cache_path)
+
+    assert parsed_agents == list(dict.fromkeys(agents))
+    assert parsed == parsed_agents
+    assert [
+        (user_agent.agent, user_agent.browser, user_agent.browser_version)
+        for user_agent in second
+    ] == [
+        (user_agent.agent, user_agent.browser, user_agent.browser_version)
+        for user_agent in first
+    ]
+    assert not hasattr(second[0], '__dict__')
+
+
+def write_pool(path: Path, agents: list[str]) -> None:
+    path.write_text('# The user agent pool.\n\n' + '\n'.join(agents), 'utf-8')
+
+
+def test_pools_are_read_from_every_file_of_a_directory(tmp_path):
+    write_pool(tmp_path / 'b.txt', user_agents[1:3])
+    write_pool(tmp_path / 'a.txt', user_agents[:2])
+    (tmp_path / 'notes.md').write_text(user_agents[4], 'utf-8')
+
+    assert read_user_agent_pool(str(tmp_path)) == user_agents[:3]
+
+
+def test_changed_pools_are_reloaded_keeping_the_stats(tmp_path, clock):
+    pool_path: Path = tmp_path / 'pool.txt'
+    write_pool(pool_path, user_agents[:2])
+    rotator: Rotator = Rotator(
+        user_agents[4:6], pool_path=str(pool_path), reload_interval=0.0
+    )
+    kept: str = user_agents[1]
+    rotator.record(kept, 403, latency=0.1)
+    health: float = rotator.get_health(kept)
+
+    write_pool(pool_path, [kept, *user_agents[8:10]])
+    rotator.get()
+
+    assert [user_agent.agent for user_agent in rotator.user_agents] == [
+        kept,
+        *user_agents[8:10],
+    ]
+    assert rotator._health_of[0] == health < 1.0
+
+    # An emptied pool falls back to the built-in user agents.
+    write_pool(pool_path, [])
+    rotator.get()
+
+    assert [user_agent.agent for user_agent in rotator.user_agents] == (
+        user_agents[4:6]
+    )
+
+
+def test_exported_stats_list_the_healthiest_user_agents_first(rotator, tmp_path):
+    path: Path = tmp_path / 'stats' / 'user_agents.json'
+    blocked: str = rotator.user_agents[0].agent
+
+    for status_code in (403, 429, 200):
+        rotator.record(blocked, status_code, latency=0.2)
+
+    rotator.export_stats(str(path))
+    rows: list[dict] = json.loads(path.read_text('utf-8'))
+
+    assert len(rows) == len(rotator.user_agents)
+    assert rows[-1]['agent'] == blocked
+    assert (rows[-1]['requests'], rows[-1]['blocked']) == (3, 2)
+    assert rows[-1]['health'] < rows[0]['health']
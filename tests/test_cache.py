@@ -0,0 +1,84 @@
+# Third-Party Libraries
+import pytest
+from httpx import Response
+
+# Local Modules
+from src.core.cache import CacheStats, ValidatorCache, Validators
+
+URL: str = 'https://stand-in.test/manga/1'
+ETAG: str = '"v1"'
+LAST_MODIFIED: str = 'Sat, 17 Oct 2026 12:00:00 GMT'
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'validators.db')
+
+
+@pytest.fixture
+def validator_cache(path):
+    with ValidatorCache(path=path) as validator_cache:
+        validator_cache.put(
+            URL,
+            Response(200, headers={'ETag': ETAG, 'Last-Modified': LAST_MODIFIED}),
+            content_hash='digest',
+        )
+        yield validator_cache
+
+
+def test_unknown_urls_are_requested_without_conditional_headers(validator_cache):
+    assert validator_cache.get_conditional_headers(f'{URL}/2') == {}
+    assert validator_cache.stats == CacheStats(misses=1)
+
+
+def test_stored_validators_become_conditional_headers(validator_cache):
+    assert validator_cache.get_conditional_headers(URL) == {
+        'If-None-Match': ETAG,
+        'If-Modified-Since': LAST_MODIFIED,
+    }
+    assert validator_cache.stats == CacheStats(hits=1)
+
+
+def test_responses_without_validators_count_as_misses(validator_cache):
+    validator_cache.put(URL, Response(200), content_hash='digest')
+
+    assert validator_cache.get_conditional_headers(URL) == {}
+    assert validator_cache.stats == CacheStats(misses=1)
+
+
+def test_not_modified_answers_keep_the_validators_they_omit(validator_cache):
+    last_modified: str = 'Sun, 18 Oct 2026 12:00:00 GMT'
+    fetched_at: float = validator_cache.get(URL).fetched_at
+
+    validator_cache.mark_not_modified(
+        URL, Response(304, headers={'Last-Modified': last_modified})
+    )
+    validators: Validators = validator_cache.get(URL)
+
+    assert validators.etag == ETAG
+    assert validators.last_modified == last_modified
+    assert validators.content_hash == 'digest'
+    assert validators.fetched_at >= fetched_at
+    assert validator_cache.stats == CacheStats(not_modified=1)
+
+
+def test_discarded_urls_are_requested_in_full(validator_cache):
+    validator_cache.discard(URL)
+
+    assert validator_cache.get(URL) is None
+    assert validator_cache.get_conditional_headers(URL) == {}
+
+
+def test_validators_persist_between_runs(validator_cache, path):
+    validator_cache.close()
+
+    with ValidatorCache(path=path) as reopened_cache:
+        assert reopened_cache.get(URL).etag == ETAG
+        assert reopened_cache.stats == CacheStats()
+
+
+def test_stats_of_worker_processes_add_up():
+    stats: CacheStats = CacheStats(hits=2, misses=1)
+    stats.merge(CacheStats(hits=1, misses=3, not_modified=1))
+
+    assert stats == CacheStats(hits=3, misses=4, not_modified=1)
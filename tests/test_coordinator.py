@@ -0,0 +1,167 @@
+# Native Libraries
+import multiprocessing
+from os import chdir, makedirs
+from threading import Thread
+
+import pytest
+import trio
+
+# Third-Party Libraries
+from httpx import Response, codes, post
+
+# Local Modules
+from benchmarks.site import get_slug, run_site
+from src.core.coordinator import Coordinator
+from src.core.journal import DONE, PENDING
+from src.core.limiter import CoordinatedRateLimiter
+from src.core.requester import LeasedRequestStrategy
+from src.core.settings import ClientSettings, default_settings
+from src.core.work import HTTPWorkQueue, WorkQueue, get_work_queue
+from src.entrypoint import fetch, seed_work
+
+# The number of machines crawling the stand-in site together.
+MACHINES: int = 3
+PAGES: int = 60
+LEASE_DURATION: float = 10.0
+# The global rate limit of the coordinator in the rate test, in requests per second.
+RATE: float = 50.0
+REQUESTS: int = 20
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    coordinator: Coordinator = Coordinator(
+        path=str(tmp_path / 'work.db'), lease_duration=LEASE_DURATION
+    )
+    thread: Thread = Thread(target=coordinator.serve_forever, daemon=True)
+    thread.start()
+
+    yield coordinator
+
+    coordinator.shutdown()
+    coordinator.server_close()
+    thread.join()
+
+
+def test_http_work_queues_use_the_queue_of_the_coordinator(coordinator):
+    paths: list[str] = ['/1', '/2', '/3']
+
+    with HTTPWorkQueue(path=coordinator.get_url()) as work_queue:
+        assert work_queue.lease_duration == LEASE_DURATION
+        assert work_queue.add(paths) == len(paths)
+        assert work_queue.claim('a', count=2) == ['/1', '/2']
+        assert work_queue.claim('b', count=2) == ['/3']
+
+        work_queue.complete('/1', DONE)
+        work_queue.release('a')
+
+        assert work_queue.claim('b', count=2) == ['/2']
+        assert work_queue.get_counts() == {DONE: 1, PENDING: 2}
+        assert not work_queue.is_finished()
+
+    assert coordinator.work_queue.get_counts() == {DONE: 1, PENDING: 2}
+
+
+@pytest.mark.parametrize(
+    ('operation', 'arguments', 'status'),
+    [
+        ('work/drop', {}, codes.NOT_FOUND),
+        ('work/__exit__', {}, codes.NOT_FOUND),
+        ('work/claim', {'owner': 'a'}, codes.BAD_REQUEST),
+    ],
+)
+def test_coordinators_reject_unknown_operations(
+    coordinator, operation, arguments, status
+):
+    response: Response = post(f'{coordinator.get_url()}/{operation}', json=arguments)
+
+    assert response.status_code == status
+
+
+def test_coordinated_limiters_share_the_global_rate(coordinator, monkeypatch):
+    monkeypatch.setattr(default_settings, 'rate_limit', RATE)
+    # The processes do not limit their own rate, only the coordinator does.
+    settings: ClientSettings = default_settings.model_copy(
+        update={'rate_limit': None}
+    )
+
+    async def acquire_from_every_process() -> float:
+        limiters: list[CoordinatedRateLimiter] = [
+            CoordinatedRateLimiter(settings=settings, url=coordinator.get_url())
+            for _ in range(MACHINES)
+        ]
+        started_at: float = trio.current_time()
+
+        async with trio.open_nursery() as nursery:
+            for index in range(REQUESTS):
+                nursery.start_soon(limiters[index % MACHINES].acquire, 'stand-in')
+
+        for limiter in limiters:
+            await limiter.aclose()
+
+        return trio.current_time() - started_at
+
+    assert trio.run(acquire_from_every_process) >= (REQUESTS - 1) / RATE
+
+
+def crawl_from_machine(directory: str, url: str) -> None:
+    """Crawls the work queue of the coordinator as a process of another machine."""
+    makedirs(directory)
+    chdir(directory)
+    default_settings.progress_interval = None
+    default_settings.work_queue_backend = 'http'
+    default_settings.work_queue_path = url
+    default_settings.rate_limit_url = url
+
+    fetch(paths=[], request_strategy=LeasedRequestStrategy(poll_interval=0.05))
+
+
+def test_machines_crawl_the_work_queue_of_the_coordinator_together(
+    coordinator, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(default_settings, 'work_queue_backend', 'http')
+    monkeypatch.setattr(default_settings, 'work_queue_path', coordinator.get_url())
+    spawn: multiprocessing.context.SpawnContext = multiprocessing.get_context(
+        'spawn'
+    )
+
+    with run_site(pages=PAGES) as site_url:
+        seed_work(f'{site_url}/manga/{get_slug(index)}/' for index in range(PAGES))
+
+        processes: list[multiprocessing.Process] = [
+            spawn.Process(
+                target=crawl_from_machine,
+                args=(str(tmp_path / f'machine-{machine}'), coordinator.get_url()),
+                daemon=True,
+            )
+            for machine in range(MACHINES)
+        ]
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join(timeout=60)
+
+    assert [process.exitcode for process in processes] == [0] * MACHINES
+
+    work_queue: WorkQueue
+
+    with get_work_queue() as work_queue:
+        assert work_queue.is_finished()
+        assert work_queue.get_counts() == {DONE: PAGES}
+
+    # Every machine journals the paths it crawled, each path being crawled once.
+    done: list[str] = []
+
+    for machine in range(MACHINES):
+        with open(
+            tmp_path / f'machine-{machine}' / default_settings.journal_path,
+            encoding='utf-8',
+        ) as file:
+            done.extend(
+                line.partition('\t')[2] for line in file if line.startswith(DONE)
+            )
+
+    assert len(done) == len(set(done)) == PAGES
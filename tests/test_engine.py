@@ -0,0 +1,103 @@
+# Native Libraries
+from pathlib import Path
+
+# Third-Party Libraries
+import pyarrow as pa
+import pytest
+
+# Local Modules
+from benchmarks.extraction import selector_extract
+from benchmarks.site import build_page, get_slug
+from src.extraction.engine import PageExtractor
+
+FIXTURE_PATH: Path = Path(__file__).parent / 'fixtures' / 'manga_page.html'
+
+
+@pytest.fixture
+def page() -> bytes:
+    return FIXTURE_PATH.read_bytes()
+
+
+def test_cell_layout_keeps_the_allowed_keys(page):
+    informative_content, _ = PageExtractor().extract(page, 'exemplo')
+
+    assert informative_content == {
+        'título original': 'exemplo no sekai',
+        'editora original': 'shueisha',
+        'editora brasileira (1)': 'panini',
+        'volumes no japão': '12 (completo)',
+        'volumes no brasil': '3 (em andamento)',
+        'formato': 'tankobon (13,5 x 20,5 cm)',
+        'periodicidade': 'bimestral',
+        'manga': 'exemplo',
+    }
+
+
+def test_price_tables_are_merged_into_one_batch(page):
+    _, price_batch = PageExtractor().extract(page, 'exemplo')
+
+    assert price_batch.schema == pa.schema([
+        (column, pa.string())
+        for column in (
+            'vol',
+            'data de lançamento',
+            'preço',
+            'cap',
+            'data no japão',
+            'manga',
+        )
+    ])
+    assert price_batch.to_pydict() == {
+        'vol': ['1', '2', '3', None, None],
+        'data de lançamento': ['05/03/2021', '07/05/2021', '-', None, None],
+        'preço': ['R$ 29,90', 'R$ 29,90', 'R$ 32,90', None, None],
+        'cap': [None, None, None, '1', '2'],
+        'data no japão': [None, None, None, '01/2019', '02/2019'],
+        'manga': ['exemplo'] * 5,
+    }
+
+
+def test_paragraph_layout_reads_the_first_paragraph():
+    page: bytes = (
+        '<div class="entry-content"><p><strong>Formato:</strong> Kanzenban<br>'
+        '<strong>Miolo:</strong> Papel offset</p></div>'
+    ).encode()
+
+    assert PageExtractor().extract(page, 'exemplo') == (
+        {'formato': 'kanzenban', 'miolo': 'papel offset', 'manga': 'exemplo'},
+        None,
+    )
+
+
+def test_pages_without_content_extract_nothing():
+    assert PageExtractor().extract(b'<html><body></body></html>', 'exemplo') == (
+        None,
+        None,
+    )
+
+
+def extract_first_row(
+    page: bytes, manga: str
+) -> tuple[dict[str, str] | None, dict[str, str] | None]:
+    """Extracts a page with Lexbor, keeping the first price row as Modest did."""
+    informative_content, price_batch = PageExtractor().extract(page, manga)
+    first_row: dict[str, str] | None = price_batch and {
+        column: value
+        for column, value in price_batch.slice(0, 1).to_pylist()[0].items()
+        if value is not None
+    }
+
+    return informative_content, first_row
+
+
+def test_lexbor_extraction_matches_the_modest_one_on_the_fixture(page):
+    assert extract_first_row(page, 'exemplo') == selector_extract(page, 'exemplo')
+
+
+@pytest.mark.parametrize('index', range(6))
+def test_lexbor_extraction_matches_the_modest_one_on_both_layouts(index):
+    page: bytes = build_page(index)
+
+    assert extract_first_row(page, get_slug(index)) == selector_extract(
+        page, get_slug(index)
+    )
@@ -0,0 +1,89 @@
+# Native Libraries
+from threading import current_thread, main_thread
+
+# Third-Party Libraries
+import pytest
+import trio
+
+# Local Modules
+from src.core.journal import DONE, FAILED, PENDING, CrawlJournal
+
+
+def read_lines(path: str) -> list[str]:
+    with open(path, encoding='utf-8') as file:
+        return file.read().splitlines()
+
+
+def record(journal: CrawlJournal, *entries: tuple[str, str]) -> None:
+    """Records the statuses of paths from a trio run."""
+
+    async def record_entries() -> None:
+        for status, path in entries:
+            await journal.record(status, path)
+
+    trio.run(record_entries)
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    """A journal left behind by an interrupted run, its last line torn."""
+    path: str = str(tmp_path / 'journal.tsv')
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(
+            f'{PENDING}\t/1\n{PENDING}\t/2\n{DONE}\t/1\n{PENDING}\t/3\n'
+            f'{FAILED}\t/3\n{PENDING}\t/4\n{DONE}\t/4'
+        )
+
+    return path
+
+
+def test_resumed_journals_skip_completed_paths_and_keep_pending_ones(journal_path):
+    with CrawlJournal(journal_path, resume=True) as journal:
+        assert journal.completed == {'/1'}
+
+        # Compacted to the last status of every path, the torn line dropped.
+        assert read_lines(journal_path) == [
+            f'{DONE}\t/1',
+            f'{PENDING}\t/2',
+            f'{FAILED}\t/3',
+            f'{PENDING}\t/4',
+        ]
+
+        record(journal, (DONE, '/2'))
+
+    assert read_lines(journal_path)[-1] == f'{DONE}\t/2'
+
+
+def test_journals_of_new_runs_start_empty(journal_path):
+    with CrawlJournal(journal_path) as journal:
+        assert journal.completed == set()
+
+        record(journal, (PENDING, '/5'))
+
+    assert read_lines(journal_path) == [f'{PENDING}\t/5']
+
+
+def test_shared_journals_are_appended_to_without_compaction(journal_path):
+    # The journal of the other processes, compacted beforehand.
+    with CrawlJournal(journal_path, resume=True):
+        lines: list[str] = read_lines(journal_path)
+
+    with CrawlJournal(journal_path, resume=True, shared=True) as journal:
+        record(journal, (DONE, '/2'))
+
+        # Shared journals are written line by line, without waiting for a sync.
+        assert read_lines(journal_path) == [*lines, f'{DONE}\t/2']
+
+
+def test_records_are_synced_outside_of_the_event_loop(journal_path, monkeypatch):
+    threads: list[bool] = []
+    monkeypatch.setattr(
+        'src.core.journal.fsync',
+        lambda fileno: threads.append(current_thread() is not main_thread()),
+    )
+
+    with CrawlJournal(journal_path, sync_interval=0.0) as journal:
+        record(journal, (PENDING, '/5'), (DONE, '/5'))
+
+        assert threads == [True, True]
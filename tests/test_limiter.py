@@ -0,0 +1,235 @@
+# Native Libraries
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.synchronize import Barrier
+from time import monotonic
+
+# Third-Party Libraries
+import pytest
+import trio
+from httpx import Request, Response
+from trio.testing import MockClock
+
+# Local Modules
+from src.core.limiter import (
+    REJECTION_THRESHOLD,
+    RateLimiter,
+    SharedRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from src.core.settings import ClientSettings
+
+# The rate shared by the processes of the shared limiter test, and the tokens each
+# of them acquires.
+SHARED_RATE: float = 50.0
+TOKENS: int = 10
+
+
+class ManualBucket(TokenBucket):
+    """A token bucket timed with a manual clock instead of the trio one."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.now: float = 0.0
+        super().__init__(*args, **kwargs)
+
+    def send(self, requests: int, seconds: float) -> None:
+        """Reserves evenly spread requests over `seconds`."""
+        for _ in range(requests):
+            self._reserve(self.now)
+            self.now += seconds / requests
+
+    def _get_time(self) -> float:
+        return self.now
+
+
+def test_reserve_spreads_requests_at_the_rate():
+    bucket: ManualBucket = ManualBucket(rate=10.0)
+
+    assert [bucket._reserve(0.0) for _ in range(3)] == pytest.approx([0.0, 0.1, 0.2])
+
+
+def test_isolated_errors_do_not_throttle_an_unlimited_bucket():
+    bucket: ManualBucket = ManualBucket(rate=None)
+    bucket.send(100, seconds=1.0)
+
+    bucket.penalize()
+    bucket.penalize(rejected=True)
+
+    assert bucket.rate is None
+
+
+def test_repeated_rejections_halve_the_measured_rate():
+    bucket: ManualBucket = ManualBucket(rate=None)
+    bucket.send(100, seconds=1.0)
+
+    for _ in range(REJECTION_THRESHOLD):
+        bucket.penalize(rejected=True)
+
+    assert bucket.rate == pytest.approx(50.0, rel=0.05)
+
+
+def test_retry_after_pauses_and_slows_down_an_unlimited_bucket():
+    bucket: ManualBucket = ManualBucket(rate=None)
+    bucket.send(40, seconds=2.0)
+
+    bucket.penalize(retry_after=3.0)
+
+    assert bucket.rate == pytest.approx(10.0, rel=0.05)
+    assert bucket._reserve(bucket.now) == pytest.approx(5.0)
+
+
+def test_penalty_never_starts_from_the_floor():
+    bucket: ManualBucket = ManualBucket(rate=None, min_rate=0.5)
+
+    bucket.penalize(retry_after=1.0)
+
+    assert bucket.rate is None
+
+
+def test_success_resets_the_rejections():
+    bucket: ManualBucket = ManualBucket(rate=None)
+    bucket.send(100, seconds=1.0)
+
+    for _ in range(REJECTION_THRESHOLD - 1):
+        bucket.penalize(rejected=True)
+
+    bucket.reward()
+    bucket.penalize(rejected=True)
+
+    assert bucket.rate is None
+
+
+def test_reward_recovers_multiplicatively_up_to_the_ceiling():
+    bucket: ManualBucket = ManualBucket(rate=8.0, recovery=0.5)
+    bucket.send(8, seconds=1.0)
+
+    bucket.penalize()
+    assert bucket.rate == pytest.approx(4.0)
+
+    bucket.reward()
+    assert bucket.rate == pytest.approx(6.0)
+
+    bucket.reward()
+    assert bucket.rate == pytest.approx(8.0)
+
+
+def test_reward_lifts_an_unlimited_bucket_once_its_rate_no_longer_binds():
+    bucket: ManualBucket = ManualBucket(rate=None, recovery=1.0)
+    bucket.send(100, seconds=1.0)
+    bucket.penalize(retry_after=0.0)
+
+    for _ in range(2):
+        bucket.reward()
+
+    assert bucket.rate == pytest.approx(200.0, rel=0.05)
+
+    bucket.reward()
+    assert bucket.rate is None
+
+
+def test_penalties_close_together_count_once():
+    bucket: ManualBucket = ManualBucket(rate=8.0)
+
+    bucket.penalize()
+    bucket.penalize()
+
+    assert bucket.rate == pytest.approx(4.0)
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [(None, None), ('', None), ('2.5', 2.5), ('-1', 0.0), ('soon', None)],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_concurrent_tasks_are_spread_at_the_rate():
+    sent_at: list[float] = []
+
+    async def send_together() -> None:
+        bucket: TokenBucket = TokenBucket(rate=10.0, adaptive=False)
+
+        async def send() -> None:
+            await bucket.acquire()
+            sent_at.append(trio.current_time())
+
+        async with trio.open_nursery() as nursery:
+            for _ in range(5):
+                nursery.start_soon(send)
+
+    trio.run(send_together, clock=MockClock(autojump_threshold=0))
+
+    assert sent_at == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+
+
+@pytest.mark.parametrize('per_host', [False, True])
+def test_throttled_hosts_only_slow_down_their_own_bucket(per_host):
+    rate: float = 8.0
+    limiter: RateLimiter = RateLimiter(
+        ClientSettings(rate_limit=rate, rate_limit_per_host=per_host)
+    )
+    request: Request = Request('GET', 'https://a.test/manga/1')
+
+    async def throttle() -> None:
+        limiter.update(Response(429, headers={'Retry-After': '1'}, request=request))
+
+        assert (limiter.get_bucket('a.test') is limiter.get_bucket('b.test')) == (
+            not per_host
+        )
+
+    trio.run(throttle)
+
+    assert limiter.get_bucket('a.test').rate < rate
+    assert (limiter.get_bucket('b.test').rate == rate) == per_host
+
+
+def acquire_tokens(
+    limiter: SharedRateLimiter, barrier: Barrier, connection: Connection
+) -> None:
+    """Acquires `TOKENS` tokens, sending back the times they were granted at."""
+
+    async def acquire() -> list[float]:
+        granted_at: list[float] = []
+
+        for _ in range(TOKENS):
+            await limiter.acquire('stand-in.test')
+            granted_at.append(monotonic())
+
+        return granted_at
+
+    barrier.wait()
+    connection.send(trio.run(acquire))
+
+
+def test_processes_sharing_a_limiter_add_up_to_its_rate():
+    spawn: multiprocessing.context.SpawnContext = multiprocessing.get_context(
+        'spawn'
+    )
+    limiter: SharedRateLimiter = SharedRateLimiter(
+        settings=ClientSettings(rate_limit=SHARED_RATE, adaptive_rate_limit=False)
+    )
+    barrier: Barrier = spawn.Barrier(2)
+    granted_at: list[float] = []
+    processes: list[tuple[multiprocessing.Process, Connection]] = []
+
+    for _ in range(2):
+        receiver, sender = spawn.Pipe(duplex=False)
+        process: multiprocessing.Process = spawn.Process(
+            target=acquire_tokens, args=(limiter, barrier, sender)
+        )
+        process.start()
+        sender.close()
+        processes.append((process, receiver))
+
+    for process, receiver in processes:
+        granted_at.extend(receiver.recv())
+        process.join()
+
+    granted_at.sort()
+
+    # Each process alone would be done in (TOKENS - 1) / SHARED_RATE seconds, while
+    # together they take (2 * TOKENS - 1) / SHARED_RATE, give or take a token.
+    assert len(granted_at) == 2 * TOKENS
+    assert granted_at[-1] - granted_at[0] >= (2 * TOKENS - 2) / SHARED_RATE
@@ -0,0 +1,110 @@
+# Third-Party Libraries
+import pytest
+
+# Local Modules
+from src.core.metrics import METRIC_PREFIX, CrawlMetrics, Histogram
+
+BOUNDS: tuple[float] = (1.0, 2.0, 4.0)
+
+
+def parse_samples(text: str) -> dict[str, float]:
+    """Reads the samples of a Prometheus text, keyed by name and labels."""
+    return {
+        name.removeprefix(f'{METRIC_PREFIX}_'): float(value)
+        for name, value in (
+            line.rsplit(' ', 1) for line in text.splitlines() if line[0] != '#'
+        )
+    }
+
+
+@pytest.fixture
+def metrics():
+    metrics: CrawlMetrics = CrawlMetrics()
+    metrics.requests = 4
+    metrics.pages = 2
+    metrics.retries = 1
+    metrics.bytes_received = 2048
+    metrics.statuses.update({200: 2, 503: 1})
+    metrics.errors['ConnectError'] += 1
+
+    for latency in (0.5, 1.5, 1.5, 3.0):
+        metrics.latency.observe(latency)
+
+    return metrics
+
+
+def test_histograms_interpolate_quantiles_inside_their_buckets():
+    histogram: Histogram = Histogram(BOUNDS)
+
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 0]
+    assert histogram.get_quantile(0.5) == pytest.approx(1.5)
+    assert histogram.get_quantile(1.0) == pytest.approx(4.0)
+    assert histogram.get_mean() == pytest.approx(6.5 / 4)
+
+
+def test_histograms_report_out_of_range_and_missing_observations():
+    histogram: Histogram = Histogram(BOUNDS)
+
+    assert histogram.get_quantile(0.99) == 0.0
+    assert histogram.get_mean() == 0.0
+
+    histogram.observe(10.0)
+
+    assert histogram.counts == [0, 0, 0, 1]
+    assert histogram.get_quantile(0.99) == BOUNDS[-1]
+
+
+def test_merged_metrics_add_up(metrics):
+    merged: CrawlMetrics = CrawlMetrics()
+    merged.merge(metrics)
+    merged.merge(metrics)
+
+    assert (merged.requests, merged.pages, merged.retries) == (8, 4, 2)
+    assert merged.bytes_received == 2 * metrics.bytes_received
+    assert merged.statuses == {200: 4, 503: 2}
+    assert merged.errors == {'ConnectError': 2}
+    assert merged.latency.counts == [2 * count for count in metrics.latency.counts]
+    assert merged.latency.total == 2 * metrics.latency.total
+
+
+def test_prometheus_text_declares_and_samples_every_metric(metrics):
+    text: str = metrics.to_prometheus()
+    samples: dict[str, float] = parse_samples(text)
+    names: set[str] = {
+        line.split()[2] for line in text.splitlines() if line.startswith('# TYPE')
+    }
+
+    assert text.endswith('\n')
+    assert {
+        line.split()[2] for line in text.splitlines() if line.startswith('# HELP')
+    } == names
+    assert samples['requests_total'] == metrics.requests
+    assert samples['responses_total{status="503"}'] == 1
+    assert samples['request_errors_total{error="ConnectError"}'] == 1
+    assert samples['received_bytes_total'] == metrics.bytes_received
+
+    # Histogram buckets are cumulative, the last one holding every observation.
+    assert samples['request_duration_seconds_bucket{le="0.001"}'] == 0
+    assert samples['request_duration_seconds_bucket{le="2.048"}'] == (
+        metrics.latency.count - 1
+    )
+    assert samples['request_duration_seconds_bucket{le="+Inf"}'] == (
+        metrics.latency.count
+    )
+    assert samples['request_duration_seconds_sum'] == metrics.latency.total
+    assert samples['limiter_wait_seconds_count'] == 0
+
+
+def test_exported_metrics_replace_the_previous_file(metrics, tmp_path):
+    path: str = str(tmp_path / 'metrics' / 'crawl.prom')
+    CrawlMetrics().export(path)
+
+    metrics.export(path)
+
+    with open(path, encoding='utf-8') as file:
+        assert parse_samples(file.read())['pages_total'] == metrics.pages
+
+    assert [file.name for file in (tmp_path / 'metrics').iterdir()] == ['crawl.prom']
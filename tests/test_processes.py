@@ -0,0 +1,96 @@
+# Native Libraries
+from os import chdir, getcwd
+
+# Third-Party Libraries
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from pyarrow.parquet import read_table
+
+# Local Modules
+from benchmarks.site import get_slug, run_site
+from src.core.metrics import CrawlMetrics
+from src.core.requester import SimpleRequestStrategy
+from src.core.settings import default_settings
+from src.core.store import get_page_store
+from src.entrypoint import fetch
+from src.extraction.spider import get_price_history, persist_structured_data
+
+PAGES: int = 40
+PROCESSES: int = 2
+
+
+def crawl_and_extract(directory: str, site_url: str, workers: int) -> CrawlMetrics:
+    """
+    Crawls the stand-in site and extracts it in `directory`, with `workers`
+    crawling processes and as many extraction workers.
+    """
+    chdir(directory)
+    strategy: SimpleRequestStrategy = SimpleRequestStrategy()
+    fetch(
+        paths=[f'{site_url}/manga/{get_slug(index)}/' for index in range(PAGES)],
+        request_strategy=strategy,
+        processes=workers,
+    )
+    persist_structured_data(workers=workers)
+
+    return strategy.metrics
+
+
+@pytest.fixture(scope='module')
+def runs(tmp_path_factory):
+    """The serial and the parallel runs, each in its own working directory."""
+    directory: str = getcwd()
+    progress_interval: float | None = default_settings.progress_interval
+    default_settings.progress_interval = None
+
+    try:
+        with run_site(pages=PAGES) as site_url:
+            yield {
+                workers: (
+                    path := str(tmp_path_factory.mktemp(f'workers-{workers}')),
+                    crawl_and_extract(path, site_url, workers),
+                )
+                for workers in (1, PROCESSES)
+            }
+    finally:
+        chdir(directory)
+        default_settings.progress_interval = progress_interval
+
+
+def test_parallel_crawls_store_the_same_pages_and_metrics(runs, monkeypatch):
+    digests: list[dict[str, str]] = []
+
+    for directory, _ in runs.values():
+        monkeypatch.chdir(directory)
+
+        with get_page_store() as page_store:
+            digests.append(page_store.get_digests())
+
+    serial, parallel = (metrics for _, metrics in runs.values())
+
+    assert len(digests[0]) == PAGES
+    assert digests[0] == digests[1]
+
+    for name in ('pages', 'requests', 'statuses', 'bytes_received', 'failed'):
+        assert getattr(serial, name) == getattr(parallel, name), name
+
+    assert serial.latency.count == parallel.latency.count
+
+
+def test_parallel_extractions_write_the_same_datasets(runs, monkeypatch):
+    information: list[list[dict]] = []
+    prices: list[DataFrame] = []
+
+    for directory, _ in runs.values():
+        monkeypatch.chdir(directory)
+        information.append(read_table('data/manga_information.parquet').to_pylist())
+        history: DataFrame = get_price_history()
+        prices.append(
+            history.sort_values(list(history.columns)).reset_index(drop=True)
+        )
+
+    assert len(information[0]) == PAGES
+    assert information[0] == information[1]
+    assert not prices[0].empty
+    assert_frame_equal(prices[0], prices[1])
@@ -0,0 +1,514 @@
+# Native Libraries
+import hashlib
+import json
+import math
+from collections import Counter
+from functools import partial
+from os import remove
+from os.path import exists
+from random import Random
+from threading import current_thread, main_thread
+from typing import AsyncIterator, Callable
+
+# Third-Party Libraries
+import pytest
+import trio
+from httpx import ConnectError, MockTransport, Request, Response
+from trio.testing import MockClock
+
+# Local Modules
+from src.core.cache import ValidatorCache
+from src.core.journal import DONE, FAILED
+from src.core.metrics import METRIC_PREFIX, CrawlMetrics
+from src.core.requester import (
+    CatalogRequestStrategy,
+    PaginatedRequestStrategy,
+    RateLimitedClient,
+    RequestContext,
+    RequestStrategy,
+    SimpleRequestStrategy,
+)
+from src.core.settings import default_settings
+from src.core.store import CompressedPageStore, get_page_store
+
+BASE_URL: str = 'https://stand-in.test'
+# The share of the requests of the flaky site failing with each kind of error.
+ERROR_RATE: float = 0.25
+# The seconds the circuit of a failing host stays open in the breaker test.
+COOLDOWN: float = 30.0
+# The bytes read at once from the streamed bodies of the streaming tests.
+CHUNK_SIZE: int = 4
+
+
+def read_dead_letters(path: str) -> list[dict]:
+    """Reads the dead letters of a run, without their timestamps."""
+    with open(path, encoding='utf-8') as file:
+        return [
+            {
+                key: value
+                for key, value in json.loads(line).items()
+                if key != 'failed_at'
+            }
+            for line in file
+        ]
+
+
+def read_statuses(path: str) -> dict[str, str]:
+    """Reads the last status of every path of a journal."""
+    statuses: dict[str, str] = {}
+
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            status, _, journal_path = line.removesuffix('\n').partition('\t')
+            statuses[journal_path] = status
+
+    return statuses
+
+
+@pytest.fixture
+def crawl(monkeypatch, tmp_path):
+    """Runs a strategy against a mocked site, in a scratch working directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(default_settings, 'progress_interval', None)
+    monkeypatch.setattr(default_settings, 'retry_backoff_base', 0.01)
+    monkeypatch.setattr(default_settings, 'retry_backoff_max', 0.01)
+
+    def crawl(
+        handler: Callable[[Request], Response],
+        paths: list[str],
+        strategy: RequestStrategy | None = None,
+        clock: MockClock | None = None,
+        **options,
+    ) -> RequestStrategy:
+        monkeypatch.setattr(
+            'src.core.requester.RateLimitedClient',
+            partial(RateLimitedClient, transport=MockTransport(handler)),
+        )
+        strategy = strategy or SimpleRequestStrategy()
+        trio.run(
+            strategy.fetch,
+            RequestContext(base_url=BASE_URL, paths=paths, **options),
+            clock=clock,
+        )
+
+        return strategy
+
+    return crawl
+
+
+def test_every_path_of_a_flaky_site_ends_done_or_failed(crawl, monkeypatch):
+    monkeypatch.setattr(default_settings, 'max_concurrent_requests', 8)
+    monkeypatch.setattr(default_settings, 'queue_size', 4)
+    random: Random = Random(7)
+
+    def handler(request: Request) -> Response:
+        if random.random() < ERROR_RATE:
+            raise ConnectError('connection reset', request=request)
+
+        if random.random() < ERROR_RATE:
+            return Response(503)
+
+        return Response(200, content=request.url.path.encode())
+
+    paths: list[str] = [f'/manga/{index}' for index in range(200)]
+    strategy: RequestStrategy = crawl(handler, paths)
+    statuses: dict[str, str] = read_statuses(default_settings.journal_path)
+
+    unfinished: list[str] = [
+        path for path in paths if statuses.get(path) not in {DONE, FAILED}
+    ]
+
+    assert unfinished == []
+    assert strategy.metrics.pages + strategy.metrics.failed == len(paths)
+    assert strategy.metrics.failed == strategy.dead_letters.count
+
+
+def test_retried_paths_are_not_lost_when_the_queue_runs_empty(crawl, monkeypatch):
+    monkeypatch.setattr(default_settings, 'max_concurrent_requests', 1)
+
+    # A retried path handed over to an idle worker leaves nothing queued, so the
+    # queue must stay open until the path is completed, whichever task runs first.
+    for _ in range(20):
+        attempts: Counter[str] = Counter()
+
+        def handler(request: Request) -> Response:
+            attempts[request.url.path] += 1
+
+            if attempts[request.url.path] < default_settings.max_retry_attempts:
+                raise ConnectError('connection reset', request=request)
+
+            return Response(200, content=b'manga')
+
+        crawl(handler, ['/manga/1'])
+
+        assert read_statuses(default_settings.journal_path) == {'/manga/1': DONE}
+
+
+def test_transient_failures_are_retried_until_they_succeed(crawl):
+    attempts: Counter[str] = Counter()
+
+    def handler(request: Request) -> Response:
+        attempts[request.url.path] += 1
+
+        match attempts[request.url.path]:
+            case 1:
+                raise ConnectError('connection reset', request=request)
+            case 2:
+                return Response(503)
+
+        return Response(200, content=b'manga')
+
+    paths: list[str] = ['/manga/1', '/manga/2']
+    strategy: RequestStrategy = crawl(handler, paths)
+
+    assert read_statuses(default_settings.journal_path) == dict.fromkeys(paths, DONE)
+    assert strategy.metrics.pages == len(paths)
+    assert strategy.metrics.retries == 2 * len(paths)
+    assert read_dead_letters(default_settings.dead_letter_path) == []
+
+
+def test_exhausted_and_permanent_failures_become_dead_letters(crawl):
+    def handler(request: Request) -> Response:
+        return Response(
+            {'/manga/busy': 503, '/manga/gone': 404}.get(request.url.path, 200),
+            content=b'manga',
+        )
+
+    paths: list[str] = ['/manga/1', '/manga/busy', '/manga/gone']
+    strategy: RequestStrategy = crawl(handler, paths)
+
+    assert read_statuses(default_settings.journal_path) == {
+        '/manga/1': DONE,
+        '/manga/busy': FAILED,
+        '/manga/gone': FAILED,
+    }
+    assert read_dead_letters(default_settings.dead_letter_path) == [
+        {'url': f'{BASE_URL}/manga/gone', 'reason': '404', 'attempts': 1},
+        {
+            'url': f'{BASE_URL}/manga/busy',
+            'reason': '503',
+            'attempts': default_settings.max_retry_attempts,
+        },
+    ]
+    assert strategy.metrics.failed == strategy.dead_letters.count
+
+
+def test_the_circuit_breaker_holds_back_a_failing_host(crawl, monkeypatch):
+    threshold: int = default_settings.max_retry_attempts - 1
+    monkeypatch.setattr(default_settings, 'circuit_breaker_threshold', threshold)
+    monkeypatch.setattr(default_settings, 'circuit_breaker_cooldown', COOLDOWN)
+    sent_at: list[float] = []
+
+    def handler(request: Request) -> Response:
+        sent_at.append(trio.current_time())
+
+        return Response(503 if len(sent_at) <= threshold else 200, content=b'manga')
+
+    crawl(handler, ['/manga/1'], clock=MockClock(autojump_threshold=0))
+
+    # The failure before the last attempt opens the circuit, so it waits it out.
+    assert len(sent_at) == default_settings.max_retry_attempts
+    assert sent_at[-1] - sent_at[-2] >= COOLDOWN
+    assert read_statuses(default_settings.journal_path) == {'/manga/1': DONE}
+
+
+def test_resumed_crawls_skip_the_completed_paths(crawl):
+    requested: list[str] = []
+
+    def handler(request: Request) -> Response:
+        requested.append(request.url.path)
+
+        return Response(404 if request.url.path == '/manga/gone' else 200)
+
+    crawl(handler, ['/manga/1', '/manga/gone'])
+    requested.clear()
+    crawl(handler, ['/manga/1', '/manga/gone', '/manga/2'], resume=True)
+
+    # Failed paths are tried again, along with the new ones.
+    assert sorted(requested) == ['/manga/2', '/manga/gone']
+    assert read_statuses(default_settings.journal_path) == {
+        '/manga/1': DONE,
+        '/manga/gone': FAILED,
+        '/manga/2': DONE,
+    }
+
+
+def test_unchanged_pages_are_answered_from_the_page_store(crawl):
+    etag: str = '"v1"'
+    last_modified: str = 'Sat, 17 Oct 2026 12:00:00 GMT'
+    requests: list[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+
+        if request.headers.get('If-None-Match') == etag:
+            return Response(304, headers={'ETag': etag})
+
+        return Response(
+            200,
+            headers={'ETag': etag, 'Last-Modified': last_modified},
+            content=b'<html>manga</html>',
+        )
+
+    crawl(handler, ['/manga/1'])
+    send_channel, receive_channel = trio.open_memory_channel(math.inf)
+    strategy: RequestStrategy = crawl(handler, ['/manga/1'], page_sink=send_channel)
+
+    assert requests[-1].headers['If-None-Match'] == etag
+    assert requests[-1].headers['If-Modified-Since'] == last_modified
+    assert strategy.metrics.not_modified == 1
+    assert receive_channel.receive_nowait() == (
+        f'{BASE_URL}/manga/1',
+        b'<html>manga</html>',
+    )
+
+
+def test_validators_are_read_and_written_from_worker_threads(crawl, monkeypatch):
+    etag: str = '"v1"'
+    names: list[str] = ['get_conditional_headers', 'mark_not_modified', 'put']
+    threads: dict[str, set[bool]] = {name: set() for name in names}
+
+    for name in names:
+        method = getattr(ValidatorCache, name)
+
+        def record_thread(self, *args, name=name, method=method, **kwargs):
+            threads[name].add(current_thread() is main_thread())
+            return method(self, *args, **kwargs)
+
+        monkeypatch.setattr(ValidatorCache, name, record_thread)
+
+    def handler(request: Request) -> Response:
+        if request.headers.get('If-None-Match') == etag:
+            return Response(304, headers={'ETag': etag})
+
+        return Response(200, headers={'ETag': etag}, content=b'<html>manga</html>')
+
+    crawl(handler, ['/manga/1'])
+    crawl(handler, ['/manga/1'])
+
+    assert threads == dict.fromkeys(names, {False})
+
+
+def test_unchanged_bodies_are_detected_from_their_stored_digest(crawl):
+    def handler(request: Request) -> Response:
+        return Response(200, content=request.url.path.encode())
+
+    paths: list[str] = ['/manga/1', '/manga/2']
+    crawl(handler, paths)
+    strategy: RequestStrategy = crawl(handler, paths)
+
+    assert strategy.metrics.unchanged == len(paths)
+
+    with get_page_store() as page_store:
+        assert [
+            len(page_store.get_versions(f'{BASE_URL}{path}')) for path in paths
+        ] == [1, 1]
+
+
+async def stream_body(body: bytes) -> AsyncIterator[bytes]:
+    """Sends a body in chunks, as a server streaming it would."""
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+def test_streamed_bodies_are_read_after_the_headers():
+    body: bytes = b'<html>manga</html>'
+
+    def handler(request: Request) -> Response:
+        return Response(200, content=stream_body(body))
+
+    async def read() -> tuple[list[bytes], CrawlMetrics]:
+        async with RateLimitedClient(
+            base_url=BASE_URL, transport=MockTransport(handler)
+        ) as client:
+            async with client.stream('GET', '/manga/1') as response:
+                assert not response.is_stream_consumed
+                assert client.metrics.statuses == {200: 1}
+
+                chunks: list[bytes] = [
+                    chunk async for chunk in response.aiter_bytes(CHUNK_SIZE)
+                ]
+
+            return chunks, client.metrics
+
+    chunks, metrics = trio.run(read)
+
+    assert b''.join(chunks) == body
+    assert max(map(len, chunks)) == CHUNK_SIZE
+    assert metrics.in_flight == 0
+    assert metrics.bytes_received == len(body)
+
+
+def test_streamed_pages_are_spooled_and_stored_from_a_worker_thread(
+    crawl, monkeypatch
+):
+    monkeypatch.setattr(default_settings, 'chunk_size', CHUNK_SIZE)
+    body: bytes = b'<html>' + b'manga' * 100 + b'</html>'
+    spooled: list[tuple[bool, bool]] = []
+    put_file = CompressedPageStore.put_file
+
+    def put_file_from_thread(self, url, file, digest) -> bool:
+        spooled.append((current_thread() is not main_thread(), file._rolled))
+        return put_file(self, url, file, digest)
+
+    monkeypatch.setattr(CompressedPageStore, 'put_file', put_file_from_thread)
+
+    def handler(request: Request) -> Response:
+        return Response(200, content=stream_body(body))
+
+    crawl(handler, ['/manga/1'])
+
+    # Bodies larger than a chunk are moved from memory to a temporary file.
+    assert spooled == [(True, True)]
+
+    with get_page_store() as page_store:
+        assert page_store.get(f'{BASE_URL}/manga/1') == body
+        assert page_store.get_digest(f'{BASE_URL}/manga/1') == (
+            hashlib.md5(body).hexdigest()
+        )
+
+
+def test_spooled_pages_are_read_back_for_the_page_sink(crawl, monkeypatch):
+    monkeypatch.setattr(default_settings, 'chunk_size', CHUNK_SIZE)
+    body: bytes = b'<html>' + b'manga' * 100 + b'</html>'
+    send_channel, receive_channel = trio.open_memory_channel(math.inf)
+
+    def handler(request: Request) -> Response:
+        return Response(200, content=stream_body(body))
+
+    crawl(handler, ['/manga/1'], page_sink=send_channel)
+
+    assert receive_channel.receive_nowait() == (f'{BASE_URL}/manga/1', body)
+
+    with get_page_store() as page_store:
+        assert page_store.get(f'{BASE_URL}/manga/1') == body
+
+
+@pytest.fixture
+def catalog_site():
+    """
+    A site whose catalog lists three pages and answers conditional requests for
+    it with 304, along with the paths requested from it and the catalogs parsed.
+    """
+    etag: str = '"catalog-v1"'
+    requests: list[Request] = []
+    parsed: list[bytes] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+
+        if request.url.path != '/catalog':
+            return Response(200, content=request.url.path.encode())
+
+        if request.headers.get('If-None-Match') == etag:
+            return Response(304, headers={'ETag': etag})
+
+        return Response(
+            200, headers={'ETag': etag}, content=b'/manga/1 /manga/2 /manga/3'
+        )
+
+    def parse_catalog(page: bytes) -> list[str]:
+        parsed.append(page)
+
+        with open('catalog.txt', 'wb') as file:
+            file.write(page)
+
+        return page.decode().split()
+
+    def get_strategy(crawl_pages: bool = True) -> CatalogRequestStrategy:
+        return CatalogRequestStrategy(
+            catalog_path='/catalog',
+            cache_path='catalog.txt',
+            parse_catalog=parse_catalog,
+            crawl_pages=crawl_pages,
+        )
+
+    return handler, get_strategy, requests, parsed
+
+
+def get_requested_paths(requests: list[Request]) -> list[str]:
+    return sorted(request.url.path for request in requests)
+
+
+def test_known_pages_are_crawled_along_with_the_new_catalog_ones(
+    crawl, catalog_site
+):
+    handler, get_strategy, requests, parsed = catalog_site
+
+    crawl(handler, ['/manga/1', '/manga/0'], strategy=get_strategy())
+
+    # The known pages still listed are only crawled once.
+    assert get_requested_paths(requests) == [
+        '/catalog',
+        '/manga/0',
+        '/manga/1',
+        '/manga/2',
+        '/manga/3',
+    ]
+    assert len(parsed) == 1
+    assert set(read_statuses(default_settings.journal_path).values()) == {DONE}
+
+
+def test_unchanged_catalogs_are_not_parsed_again(crawl, catalog_site):
+    handler, get_strategy, requests, parsed = catalog_site
+    crawl(handler, [], strategy=get_strategy(crawl_pages=False))
+    requests.clear()
+
+    strategy: RequestStrategy = crawl(handler, ['/manga/1'], strategy=get_strategy())
+
+    assert get_requested_paths(requests) == ['/catalog', '/manga/1']
+    assert requests[0].headers['If-None-Match'] == '"catalog-v1"'
+    assert strategy.metrics.not_modified == 1
+    assert len(parsed) == 1
+
+
+def test_catalogs_are_downloaded_again_once_their_cache_is_gone(crawl, catalog_site):
+    handler, get_strategy, requests, parsed = catalog_site
+    crawl(handler, [], strategy=get_strategy(crawl_pages=False))
+    remove('catalog.txt')
+    requests.clear()
+
+    crawl(handler, [], strategy=get_strategy(crawl_pages=False))
+
+    assert get_requested_paths(requests) == ['/catalog']
+    assert 'If-None-Match' not in requests[0].headers
+    assert parsed[0] == parsed[1]
+    assert exists('catalog.txt')
+
+
+def test_every_page_of_every_paginated_path_is_requested(crawl):
+    pages: dict[str, int] = {'/manga/a': 2, '/manga/b': 3, '/manga/c': 1}
+    requested: list[str] = []
+
+    async def number_of_pages(path: str) -> int:
+        return pages[path]
+
+    def handler(request: Request) -> Response:
+        requested.append(f'{request.url.path}?{request.url.query.decode()}')
+
+        return Response(200, content=requested[-1].encode())
+
+    crawl(handler, list(pages), strategy=PaginatedRequestStrategy(number_of_pages))
+
+    assert sorted(requested) == [
+        f'{path}?page={page}'
+        for path, count in pages.items()
+        for page in range(1, count + 1)
+    ]
+    assert set(read_statuses(default_settings.journal_path).values()) == {DONE}
+
+
+def test_crawls_export_their_metrics(crawl, monkeypatch):
+    monkeypatch.setattr(default_settings, 'metrics_path', 'metrics/crawl.prom')
+
+    def handler(request: Request) -> Response:
+        return Response(404 if request.url.path == '/manga/gone' else 200)
+
+    strategy: RequestStrategy = crawl(handler, ['/manga/1', '/manga/gone'])
+
+    assert (strategy.metrics.pages, strategy.metrics.failed) == (1, 1)
+    assert strategy.metrics.statuses == {200: 1, 404: 1}
+    assert strategy.metrics.in_flight == 0
+
+    with open('metrics/crawl.prom', encoding='utf-8') as file:
+        assert f'{METRIC_PREFIX}_pages_total 1\n' in file.read()
@@ -0,0 +1,31 @@
+# Third-Party Libraries
+import pytest
+
+# Local Modules
+from src.core.retry import RetryPolicy
+
+
+@pytest.mark.parametrize('status_code', [408, 429, 500, 502, 503, 504])
+def test_transient_failures_are_retried(status_code):
+    assert RetryPolicy.is_retryable(status_code)
+
+
+@pytest.mark.parametrize('status_code', [400, 403, 404, 501, 505])
+def test_permanent_failures_are_not_retried(status_code):
+    assert not RetryPolicy.is_retryable(status_code)
+
+
+BACKOFF_BASE: float = 2.0
+BACKOFF_MAX: float = 6.0
+RETRY_AFTER: float = 30.0
+
+
+def test_delay_backs_off_within_bounds_and_honours_retry_after():
+    policy: RetryPolicy = RetryPolicy(
+        max_attempts=5, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX
+    )
+
+    # The jitter keeps every delay within the upper half of its backoff.
+    assert BACKOFF_BASE / 2 <= policy.get_delay(1) <= BACKOFF_BASE
+    assert BACKOFF_MAX / 2 <= policy.get_delay(4) <= BACKOFF_MAX
+    assert policy.get_delay(1, retry_after=RETRY_AFTER) == RETRY_AFTER
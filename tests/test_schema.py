@@ -0,0 +1,130 @@
+# Native Libraries
+import json
+from datetime import date
+from decimal import Decimal
+
+# Third-Party Libraries
+import pyarrow as pa
+import pytest
+
+# Local Modules
+from src.extraction.schema import (
+    PRICE_TRACKING_SCHEMA,
+    RejectedValue,
+    SchemaValidator,
+    parse_date,
+    parse_decimal,
+    parse_integer,
+)
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('20', 20),
+        (' 20 (completo)', 20),
+        ('3+', 3),
+        ('1.000', 1000),
+        ('1.250.000 exemplares', 1_250_000),
+        ('12.5', 12),
+    ],
+)
+def test_parse_integer(value, expected):
+    assert parse_integer(value) == expected
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('05/03/2021', date(2021, 3, 5)),
+        ('5/3/21', date(2021, 3, 5)),
+        ('03/2021', date(2021, 3, 1)),
+        ('Março/2021', date(2021, 3, 1)),
+        ('set. 2019', date(2019, 9, 1)),
+        ('dezembro de 2018', date(2018, 12, 1)),
+    ],
+)
+def test_parse_date(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('R$ 1.029,90', Decimal('1029.90')),
+        ('29.9', Decimal('29.90')),
+        ('R$ 15', Decimal('15.00')),
+    ],
+)
+def test_parse_decimal(value, expected):
+    assert parse_decimal(value) == expected
+
+
+@pytest.mark.parametrize(
+    ('parser', 'value', 'message'),
+    [
+        (parse_integer, 'vários', 'not an integer'),
+        (parse_date, 'em breve', 'not a date'),
+        (parse_date, 'foo/2021', 'not a date'),
+        (parse_decimal, 'R$ 12,5,0', 'not a price'),
+        (parse_integer, '99999999999', 'integer out of range'),
+        (parse_decimal, '123456789012,00', 'price out of range'),
+    ],
+)
+def test_parsers_reject_malformed_values(parser, value, message):
+    with pytest.raises(ValueError, match=message):
+        parser(value)
+
+
+def test_coerce_keeps_untyped_columns_and_nulls_missing_values():
+    validator: SchemaValidator = SchemaValidator('prices', PRICE_TRACKING_SCHEMA)
+
+    assert validator.coerce({
+        'manga': 'a',
+        'vol': '2',
+        'preço': '-',
+        'título': 'x',
+    }) == {'manga': 'a', 'vol': 2, 'preço': None, 'título': 'x'}
+    assert validator.rejected == []
+
+
+def test_coerce_batch_records_rejected_values(tmp_path):
+    validator: SchemaValidator = SchemaValidator('prices', PRICE_TRACKING_SCHEMA)
+    batch: pa.RecordBatch = pa.RecordBatch.from_pydict({
+        'manga': ['a', 'b'],
+        'vol': ['1', 'um'],
+        'preço': ['R$ 9,90', ''],
+    })
+
+    coerced: pa.RecordBatch = validator.coerce_batch(batch)
+
+    assert coerced.schema.field('vol').type == pa.int32()
+    assert coerced.column('vol').to_pylist() == [1, None]
+    assert coerced.column('preço').to_pylist() == [Decimal('9.90'), None]
+    assert validator.rejected == [RejectedValue('vol', 'um', 'b')]
+
+    validator.report(str(tmp_path / 'rejected.jsonl'))
+
+    assert json.loads((tmp_path / 'rejected.jsonl').read_text()) == {
+        'column': 'vol',
+        'value': 'um',
+        'key': 'b',
+    }
+
+
+def test_coerce_batch_rejects_values_out_of_the_arrow_range():
+    validator: SchemaValidator = SchemaValidator('prices', PRICE_TRACKING_SCHEMA)
+    batch: pa.RecordBatch = pa.RecordBatch.from_pydict({
+        'manga': ['a', 'b'],
+        'vol': ['99999999999', '2'],
+        'preço': ['R$ 99.999.999,99', '123456789012,00'],
+    })
+
+    coerced: pa.RecordBatch = validator.coerce_batch(batch)
+
+    assert coerced.column('vol').to_pylist() == [None, 2]
+    assert coerced.column('preço').to_pylist() == [Decimal('99999999.99'), None]
+    assert validator.rejected == [
+        RejectedValue('vol', '99999999999', 'a'),
+        RejectedValue('preço', '123456789012,00', 'b'),
+    ]
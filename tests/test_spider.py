@@ -0,0 +1,186 @@
+# Native Libraries
+from collections import Counter
+from functools import partial
+
+# Third-Party Libraries
+import pytest
+from httpx import AsyncHTTPTransport, Request, Response, codes
+from pyarrow.parquet import read_table
+
+# Local Modules
+from benchmarks.site import build_page, get_slug, run_site
+from src.core.requester import RateLimitedClient
+from src.core.settings import default_extraction_settings, default_settings
+from src.core.store import canonicalize_url, get_page_store
+from src.extraction.spider import (
+    BASE_URL,
+    extract_pages,
+    get_price_history,
+    persist_streamed_data,
+    persist_structured_data,
+)
+from src.extraction.utils import read_manifest
+
+PAGES: int = 4
+# The manga whose page changes, the one whose page is deleted and the new one.
+CHANGED: int = 1
+DELETED: int = 2
+ADDED: int = PAGES
+# The manga whose request fails in a streamed run.
+FAILING: int = 0
+
+
+def get_url(index: int, base_url: str = BASE_URL) -> str:
+    return canonicalize_url(f'{base_url}{get_slug(index)}/')
+
+
+def read_information() -> dict[str, dict]:
+    """Reads the information dataset, keyed by manga."""
+    return {
+        row['manga']: row
+        for row in read_table('data/manga_information.parquet').to_pylist()
+    }
+
+
+def count_prices() -> Counter[str]:
+    return Counter(get_price_history()['manga'])
+
+
+@pytest.fixture
+def extracted(monkeypatch, tmp_path):
+    """
+    A first extraction of the stored pages, followed by a crawl changing, deleting
+    and adding one page each. The URLs extracted from then on are recorded in the
+    returned list.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    with get_page_store() as page_store:
+        page_store.put_many(
+            (get_url(index), build_page(index)) for index in range(PAGES)
+        )
+
+    persist_structured_data(workers=1)
+
+    with get_page_store() as page_store:
+        page_store.put(get_url(CHANGED), build_page(ADDED + 1))
+        page_store.delete(get_url(DELETED))
+        page_store.put(get_url(ADDED), build_page(ADDED))
+
+    extracted_urls: list[str] = []
+
+    def extract_and_record(pages):
+        pages = list(pages)
+        extracted_urls.extend(url for url, _ in pages)
+
+        return extract_pages(pages)
+
+    monkeypatch.setattr('src.extraction.spider.extract_pages', extract_and_record)
+
+    return extracted_urls
+
+
+def test_incremental_extractions_only_parse_the_changed_pages(extracted):
+    prices: Counter[str] = count_prices()
+
+    persist_structured_data(workers=1, incremental=True)
+    information: dict[str, dict] = read_information()
+
+    assert sorted(extracted) == sorted([get_url(CHANGED), get_url(ADDED)])
+    assert sorted(information) == sorted(
+        get_slug(index) for index in range(PAGES + 1) if index != DELETED
+    )
+    assert information[get_slug(CHANGED)]['título original'] == (
+        f'original {ADDED + 1}'
+    )
+
+    # Only the prices of the changed and new pages are appended to the history.
+    appended: Counter[str] = count_prices() - prices
+
+    assert set(appended) == {get_slug(CHANGED), get_slug(ADDED)}
+
+
+def test_incremental_extractions_match_a_full_one(extracted):
+    persist_structured_data(workers=1, incremental=True)
+    incremental: dict[str, dict] = read_information()
+
+    persist_structured_data(workers=1)
+
+    assert incremental == read_information()
+
+
+def test_unchanged_page_stores_are_not_parsed_again(extracted):
+    persist_structured_data(workers=1, incremental=True)
+    extracted.clear()
+    information: dict[str, dict] = read_information()
+
+    persist_structured_data(workers=1, incremental=True)
+
+    assert extracted == []
+    assert read_information() == information
+
+
+@pytest.fixture
+def site_url(monkeypatch, tmp_path):
+    """The URL of the manga pages of the stand-in site, in a scratch directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(default_settings, 'progress_interval', None)
+    monkeypatch.setattr(default_settings, 'retry_backoff_base', 0.01)
+    monkeypatch.setattr(default_settings, 'retry_backoff_max', 0.01)
+
+    with run_site(pages=PAGES) as site_url:
+        yield f'{site_url}/manga/'
+
+
+@pytest.fixture
+def stream(monkeypatch, site_url):
+    """
+    Runs streamed crawls and extractions of the stand-in site, the given pages
+    being answered with the given status instead.
+    """
+
+    def stream(statuses: dict[int, int]) -> None:
+        paths: dict[str, int] = {
+            f'/manga/{get_slug(index)}/': status
+            for index, status in statuses.items()
+        }
+
+        class StatusTransport(AsyncHTTPTransport):
+            async def handle_async_request(self, request: Request) -> Response:
+                if request.url.path in paths:
+                    return Response(paths[request.url.path])
+
+                return await super().handle_async_request(request)
+
+        monkeypatch.setattr(
+            'src.core.requester.RateLimitedClient',
+            partial(RateLimitedClient, transport=StatusTransport()),
+        )
+        persist_streamed_data(
+            paths=[get_url(index, site_url) for index in range(PAGES)], workers=1
+        )
+
+    return stream
+
+
+def test_streamed_runs_keep_the_pages_they_could_not_extract(stream, site_url):
+    stream({})
+    prices: Counter[str] = count_prices()
+
+    stream({FAILING: codes.SERVICE_UNAVAILABLE, DELETED: codes.NOT_FOUND})
+    manifest: dict[str, str] = read_manifest(
+        default_extraction_settings.manifest_path
+    )
+
+    assert sorted(read_information()) == sorted(
+        get_slug(index) for index in range(PAGES) if index != DELETED
+    )
+    assert sorted(manifest) == sorted(
+        get_url(index, site_url) for index in range(PAGES) if index != DELETED
+    )
+
+    # The page that failed is extracted again, but its prices are not appended.
+    stream({DELETED: codes.NOT_FOUND})
+
+    assert read_manifest(default_extraction_settings.manifest_path) == manifest
+    assert count_prices() == prices
@@ -0,0 +1,155 @@
+# Native Libraries
+import hashlib
+from threading import Thread
+
+# Third-Party Libraries
+import pytest
+
+# Local Modules
+from src.core.settings import default_settings
+from src.core.store import (
+    CompressedPageStore,
+    PageVersion,
+    canonicalize_url,
+    get_page_store,
+)
+
+
+@pytest.fixture
+def page_store(tmp_path):
+    with CompressedPageStore(path=str(tmp_path / 'pages.db')) as page_store:
+        yield page_store
+
+
+def test_canonicalize_url_sorts_parameters_and_drops_defaults():
+    assert canonicalize_url('HTTPS://Example.com:443/manga/?page=2&a=1#top') == (
+        'https://example.com/manga/?a=1&page=2'
+    )
+
+
+def test_unchanged_bodies_are_not_stored_again(page_store):
+    assert page_store.put('https://a/1', b'first')
+    assert not page_store.put('https://a/1', b'first')
+    assert page_store.put('https://a/1', b'second')
+
+    assert page_store.get('https://a/1') == b'second'
+    assert page_store.get('https://a/1', version=1) == b'first'
+    assert [
+        version.version for version in page_store.get_versions('https://a/1')
+    ] == [1, 2]
+
+
+def test_identical_bodies_share_a_blob(page_store):
+    page_store.put_many([('https://a/1', b'same'), ('https://a/2', b'same')])
+
+    assert page_store.get_digest('https://a/1') == page_store.get_digest(
+        'https://a/2'
+    )
+    assert page_store._connection.execute(
+        'SELECT COUNT(*) FROM blobs'
+    ).fetchone() == (1,)
+
+
+def test_digests_of_stored_pages_persist_between_runs(tmp_path):
+    path: str = str(tmp_path / 'pages.db')
+
+    with CompressedPageStore(path=path) as page_store:
+        page_store.put_many([('https://a/1', b'first'), ('https://a/2', b'second')])
+
+    with CompressedPageStore(path=path) as page_store:
+        assert page_store.get_digests() == {
+            'https://a/1': hashlib.md5(b'first').hexdigest(),
+            'https://a/2': hashlib.md5(b'second').hexdigest(),
+        }
+        assert not page_store.put('https://a/1', b'first')
+
+
+def test_given_digests_spare_hashing_the_body(page_store):
+    # The crawler hashes the body while it streams, so the store takes its word.
+    assert page_store.put('https://a/1', b'first', digest='streamed')
+    assert not page_store.put('https://a/1', b'changed', digest='streamed')
+
+    assert page_store.get_digest('https://a/1') == 'streamed'
+    assert page_store.get('https://a/1') == b'first'
+    assert page_store.get_digest('https://a/2') is None
+
+
+def test_files_are_stored_a_chunk_at_a_time(page_store, monkeypatch, tmp_path):
+    monkeypatch.setattr(default_settings, 'chunk_size', 4)
+    page: bytes = b'<html>' + b'manga' * 100 + b'</html>'
+    digest: str = hashlib.md5(page).hexdigest()
+    (tmp_path / 'page.html').write_bytes(page)
+
+    with open(tmp_path / 'page.html', 'rb') as file:
+        assert page_store.put_file('https://a/1', file, digest)
+        assert not page_store.put_file('https://a/1', file, digest)
+
+    assert page_store.get('https://a/1') == page
+    assert page_store.get_digest('https://a/1') == digest
+
+
+def test_deleted_pages_keep_their_history(page_store):
+    page_store.put('https://a/1', b'first')
+
+    assert page_store.delete('https://a/1')
+    assert not page_store.delete('https://a/1')
+    assert page_store.get('https://a/1') is None
+    assert page_store.get_digests() == {}
+
+    page_store.put('https://a/1', b'first')
+    versions: list[PageVersion] = page_store.get_versions('https://a/1')
+
+    assert [version.version for version in versions] == [1, 2]
+
+
+def test_iter_pages_reads_the_requested_pages_in_order(page_store):
+    page_store.put_many([
+        (f'https://a/{index}', str(index).encode()) for index in range(5)
+    ])
+
+    assert list(
+        page_store.iter_pages(['https://a/3', 'https://a/1', 'https://a/9'])
+    ) == [('https://a/1', b'1'), ('https://a/3', b'3')]
+    assert [url for url, _ in page_store.iter_pages()] == [
+        f'https://a/{index}' for index in range(5)
+    ]
+
+
+def test_concurrent_puts_number_every_version_once(tmp_path):
+    path: str = str(tmp_path / 'pages.db')
+
+    def put_bodies(worker: int) -> None:
+        with CompressedPageStore(path=path, commit_interval=1) as page_store:
+            for index in range(50):
+                page_store.put('https://a/1', f'{worker}-{index}'.encode())
+                page_store.put(f'https://a/shared/{index}', b'same')
+
+    threads: list[Thread] = [
+        Thread(target=put_bodies, args=(worker,)) for worker in range(2)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    with CompressedPageStore(path=path) as page_store:
+        versions: list[PageVersion] = page_store.get_versions('https://a/1')
+
+        assert [version.version for version in versions] == list(range(1, 101))
+        assert page_store._connection.execute(
+            'SELECT COUNT(*) FROM blobs'
+        ).fetchone() == (101,)
+
+
+def test_page_stores_read_the_settings_when_created(monkeypatch, tmp_path):
+    # Worker processes apply the settings of their parent after the import.
+    path: str = str(tmp_path / 'pages.db')
+    monkeypatch.setattr(default_settings, 'page_store_path', path)
+
+    with get_page_store() as page_store:
+        page_store.put('https://a/1', b'manga')
+
+    with CompressedPageStore(path=path) as page_store:
+        assert page_store.get('https://a/1') == b'manga'
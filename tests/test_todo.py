@@ -1 +0,0 @@
-# TODO
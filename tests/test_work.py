@@ -0,0 +1,193 @@
+# Native Libraries
+import multiprocessing
+from os import chdir
+from threading import current_thread, main_thread
+
+# Third-Party Libraries
+import pytest
+
+# Local Modules
+from benchmarks.site import get_slug, run_site
+from src.core.journal import DONE, FAILED, PENDING
+from src.core.requester import LeasedRequestStrategy
+from src.core.settings import default_settings
+from src.core.work import (
+    WORK_QUEUES,
+    SQLiteWorkQueue,
+    WorkQueue,
+    get_work_queue,
+)
+from src.entrypoint import fetch, seed_work
+
+# The number of independent processes crawling the stand-in site together.
+CRAWLERS: int = 3
+PAGES: int = 120
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now: list[float] = [1000.0]
+    monkeypatch.setattr('src.core.work.time', lambda: now[0])
+
+    return now
+
+
+@pytest.fixture
+def work_queue(tmp_path, clock):
+    with SQLiteWorkQueue(
+        path=str(tmp_path / 'work.db'), lease_duration=10.0
+    ) as work_queue:
+        work_queue.add(['/1', '/2', '/3'])
+        yield work_queue
+
+
+def test_add_ignores_known_paths(work_queue):
+    assert work_queue.add(['/3', '/4']) == 1
+    assert work_queue.get_counts() == {PENDING: 4}
+
+
+def test_claimed_paths_are_leased_to_a_single_owner(work_queue):
+    assert work_queue.claim('a', count=2) == ['/1', '/2']
+    assert work_queue.claim('b', count=2) == ['/3']
+    assert work_queue.claim('b', count=2) == []
+
+
+def test_expired_leases_are_claimed_again(work_queue, clock):
+    work_queue.claim('a', count=3)
+    clock[0] += 11.0
+
+    assert work_queue.claim('b', count=3) == ['/1', '/2', '/3']
+
+
+def test_renewed_leases_do_not_expire(work_queue, clock):
+    work_queue.claim('a', count=3)
+    clock[0] += 8.0
+    work_queue.renew('a')
+    clock[0] += 8.0
+
+    assert work_queue.claim('b', count=3) == []
+
+
+def test_released_paths_are_claimed_right_away(work_queue):
+    work_queue.claim('a', count=3)
+    work_queue.release('a')
+
+    assert work_queue.claim('b', count=3) == ['/1', '/2', '/3']
+
+
+def test_completed_paths_keep_their_first_status_unless_done_later(work_queue):
+    work_queue.claim('a', count=3)
+    work_queue.complete('/1', DONE)
+    work_queue.complete('/1', FAILED)
+    work_queue.complete('/2', FAILED)
+    work_queue.complete('/2', DONE)
+
+    assert work_queue.get_counts() == {DONE: 2, PENDING: 1}
+    assert not work_queue.is_finished()
+
+    work_queue.complete('/3', FAILED)
+
+    assert work_queue.is_finished()
+    assert work_queue.claim('b', count=3) == []
+
+
+def test_work_queues_come_from_the_configured_backend(monkeypatch, tmp_path):
+    class ShardedWorkQueue(SQLiteWorkQueue):
+        """A stand-in for another backend of the work queue."""
+
+    monkeypatch.setitem(WORK_QUEUES, 'sharded', ShardedWorkQueue)
+    monkeypatch.setattr(default_settings, 'work_queue_backend', 'sharded')
+
+    assert isinstance(
+        get_work_queue(path=str(tmp_path / 'work.db')), ShardedWorkQueue
+    )
+    assert isinstance(get_work_queue(backend='sqlite'), SQLiteWorkQueue)
+
+
+def test_work_queues_read_the_settings_when_created(monkeypatch, tmp_path):
+    # Worker processes apply the settings of their parent after the import.
+    path: str = str(tmp_path / 'work.db')
+    lease_duration: float = 42.0
+    monkeypatch.setattr(default_settings, 'work_queue_path', path)
+    monkeypatch.setattr(default_settings, 'lease_duration', lease_duration)
+
+    with get_work_queue() as work_queue:
+        work_queue.add(['/1'])
+
+        assert work_queue.lease_duration == lease_duration
+
+    with SQLiteWorkQueue(path=path) as work_queue:
+        assert work_queue.get_counts() == {PENDING: 1}
+
+
+def test_leased_crawls_use_the_work_queue_from_worker_threads(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(default_settings, 'progress_interval', None)
+    names: list[str] = ['add', 'claim', 'is_finished', 'complete', 'release']
+    threads: dict[str, set[bool]] = {name: set() for name in names}
+
+    for name in names:
+        method = getattr(SQLiteWorkQueue, name)
+
+        def record_thread(self, *args, name=name, method=method, **kwargs):
+            threads[name].add(current_thread() is main_thread())
+            return method(self, *args, **kwargs)
+
+        monkeypatch.setattr(SQLiteWorkQueue, name, record_thread)
+
+    with run_site(pages=2) as site_url:
+        fetch(
+            base_url=site_url,
+            paths=[f'/manga/{get_slug(index)}/' for index in range(2)],
+            request_strategy=LeasedRequestStrategy(poll_interval=0.05),
+        )
+
+    assert threads == dict.fromkeys(names, {False})
+
+
+def crawl_leased(directory: str) -> None:
+    """Crawls the seeded work queue as an independent process of the machine."""
+    chdir(directory)
+    default_settings.progress_interval = None
+
+    fetch(paths=[], request_strategy=LeasedRequestStrategy(poll_interval=0.05))
+
+
+def test_independent_processes_crawl_the_work_queue_together(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    spawn: multiprocessing.context.SpawnContext = multiprocessing.get_context(
+        'spawn'
+    )
+
+    with run_site(pages=PAGES) as site_url:
+        seed_work(f'{site_url}/manga/{get_slug(index)}/' for index in range(PAGES))
+
+        processes: list[multiprocessing.Process] = [
+            spawn.Process(target=crawl_leased, args=(str(tmp_path),), daemon=True)
+            for _ in range(CRAWLERS)
+        ]
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join(timeout=60)
+
+    assert [process.exitcode for process in processes] == [0] * CRAWLERS
+
+    work_queue: WorkQueue
+
+    with get_work_queue() as work_queue:
+        assert work_queue.is_finished()
+        assert work_queue.get_counts() == {DONE: PAGES}
+
+    # Every process appended its lines to the journal, none of them truncated it.
+    with open(default_settings.journal_path, encoding='utf-8') as file:
+        done: set[str] = {
+            line.partition('\t')[2] for line in file if line.startswith(DONE)
+        }
+
+    assert len(done) == PAGES
+
+    with open(default_settings.dead_letter_path, encoding='utf-8') as file:
+        assert not file.read()
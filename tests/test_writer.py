@@ -0,0 +1,188 @@
+# Native Libraries
+from glob import glob
+from os import remove
+from os.path import join
+from typing import Any
+
+# Third-Party Libraries
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+from pyarrow.parquet import ParquetFile, read_table
+
+# Local Modules
+from src.extraction.writer import (
+    ParquetStreamWriter,
+    PartitionedParquetWriter,
+    read_dataset_manifest,
+    read_partitioned_dataset,
+)
+
+# The publisher of every manga of the partitioned dataset tests.
+PUBLISHERS: dict[str, str] = {'a': 'JBC', 'b': 'Panini'}
+
+
+def test_rows_are_flushed_in_row_groups(tmp_path):
+    path: str = str(tmp_path / 'rows.parquet')
+    volumes: list[int] = [0, 1, 2, 3, 4]
+
+    with ParquetStreamWriter(path, row_group_size=2) as writer:
+        writer.write_rows({'manga': f'm{index}', 'vol': index} for index in volumes)
+
+    assert writer.rows_written == len(volumes)
+    assert ParquetFile(path).num_row_groups == (len(volumes) + 1) // 2
+    assert read_table(path).column('vol').to_pylist() == volumes
+    assert not (tmp_path / 'rows.parquet.parts').exists()
+
+
+PARTS_WRITTEN: int = 3
+
+
+def test_new_columns_start_parts_that_are_unified_on_close(tmp_path):
+    path: str = str(tmp_path / 'rows.parquet')
+
+    with ParquetStreamWriter(path, row_group_size=1) as writer:
+        writer.write({'manga': 'a', 'vol': 1})
+        writer.write({'manga': 'b', 'autor': 'x'})
+        writer.write_batch(pa.RecordBatch.from_pydict({'manga': ['c'], 'vol': [3]}))
+
+        # The second row adds a column and the third drops it again.
+        assert len(writer._parts) == PARTS_WRITTEN
+
+    table: pa.Table = read_table(path)
+
+    assert table.column_names == ['manga', 'vol', 'autor']
+    assert table.to_pylist() == [
+        {'manga': 'a', 'vol': 1, 'autor': None},
+        {'manga': 'b', 'vol': None, 'autor': 'x'},
+        {'manga': 'c', 'vol': 3, 'autor': None},
+    ]
+    assert not (tmp_path / 'rows.parquet.parts').exists()
+
+
+def write_and_fail(path: str) -> None:
+    """Writes a row and fails before the writer is closed."""
+    with ParquetStreamWriter(path, row_group_size=1) as writer:
+        writer.write({'manga': 'a'})
+
+        raise RuntimeError
+
+
+def test_failed_writes_leave_no_file(tmp_path):
+    path: str = str(tmp_path / 'rows.parquet')
+
+    with pytest.raises(RuntimeError):
+        write_and_fail(path)
+
+    assert not (tmp_path / 'rows.parquet').exists()
+    assert not (tmp_path / 'rows.parquet.parts').exists()
+
+
+def test_empty_writers_still_write_a_file(tmp_path):
+    path: str = str(tmp_path / 'rows.parquet')
+
+    with ParquetStreamWriter(path):
+        pass
+
+    assert read_table(path).num_rows == 0
+
+
+def write_prices(directory: str, crawl_date: str, rows: list[dict]) -> None:
+    """Appends the prices of a run to a history partitioned by publisher."""
+    with PartitionedParquetWriter(
+        directory,
+        partitions={'crawl_date': crawl_date},
+        partition_by='publisher',
+        get_partition=lambda row: PUBLISHERS.get(row['manga']),
+    ) as writer:
+        writer.write_rows(rows)
+
+
+@pytest.fixture
+def history(tmp_path):
+    """A price history of two runs, one of them with a manga of no publisher."""
+    directory: str = str(tmp_path / 'history')
+    write_prices(directory, '2026-10-17', [{'manga': 'a', 'vol': 1, 'price': 10.0}])
+    write_prices(
+        directory,
+        '2026-10-18',
+        [
+            {'manga': 'a', 'vol': 1, 'price': 12.0},
+            {'manga': 'b', 'vol': 1, 'price': 20.0},
+            {'manga': 'c', 'vol': 1, 'price': 30.0},
+        ],
+    )
+
+    return directory
+
+
+def test_runs_append_files_without_rewriting_the_previous_ones(history):
+    entries: list[dict[str, Any]] = read_dataset_manifest(history)
+
+    assert [
+        (entry['crawl_date'], entry['publisher'], entry['rows']) for entry in entries
+    ] == [
+        ('2026-10-17', 'JBC', 1),
+        ('2026-10-18', 'JBC', 1),
+        ('2026-10-18', 'Panini', 1),
+        ('2026-10-18', None, 1),
+    ]
+    assert entries[0]['run'] != entries[1]['run']
+    assert ParquetFile(join(history, entries[0]['path'])).read().to_pylist() == [
+        {'manga': 'a', 'vol': 1, 'price': 10.0}
+    ]
+
+
+def test_reads_only_scan_the_requested_partitions(history):
+    # The files of other partitions are not opened, so they may as well be gone.
+    for entry in read_dataset_manifest(history):
+        if entry['publisher'] != 'JBC':
+            remove(join(history, entry['path']))
+
+    table: pa.Table = read_partitioned_dataset(
+        history,
+        partitions={'publisher': ('JBC',)},
+        row_filter=pc.field('manga') == 'a',
+    )
+
+    assert sorted(
+        table.select(['crawl_date', 'price']).to_pylist(),
+        key=lambda row: row['crawl_date'],
+    ) == [
+        {'crawl_date': '2026-10-17', 'price': 10.0},
+        {'crawl_date': '2026-10-18', 'price': 12.0},
+    ]
+
+
+def test_rows_of_unknown_partitions_are_read_back(history):
+    table: pa.Table = read_partitioned_dataset(
+        history, partitions={'publisher': (None,)}
+    )
+
+    assert table.column('manga').to_pylist() == ['c']
+    assert table.column('publisher').to_pylist() == [None]
+    assert read_partitioned_dataset(history).num_rows == len(PUBLISHERS) + 2
+
+
+def write_prices_and_fail(directory: str) -> None:
+    """Writes the prices of a run and fails before the writer is closed."""
+    with PartitionedParquetWriter(
+        directory,
+        partitions={'crawl_date': '2026-10-19'},
+        partition_by='publisher',
+        get_partition=lambda row: PUBLISHERS.get(row['manga']),
+        row_group_size=1,
+    ) as writer:
+        writer.write({'manga': 'a', 'vol': 1, 'price': 14.0})
+
+        raise RuntimeError
+
+
+def test_failed_runs_leave_the_history_untouched(history):
+    entries: list[dict[str, Any]] = read_dataset_manifest(history)
+
+    with pytest.raises(RuntimeError):
+        write_prices_and_fail(history)
+
+    assert read_dataset_manifest(history) == entries
+    assert glob(join(history, 'crawl_date=2026-10-19', '**', '*.parquet')) == []